@@ -194,8 +194,8 @@ class BaseAgent(IAgent, ABC):
         
         self._emit_state_change()
     
-    async def update_state(self, update: AgentStateUpdate) -> None:
-        """상태 업데이트"""
+    async def update_state(self, update: AgentStateUpdate) -> Agent:
+        """상태 업데이트 (변경 후 발행된 상태 스냅샷 반환)"""
         if update.status:
             self._state.status = update.status
         if update.thinkingMode:
@@ -207,7 +207,7 @@ class BaseAgent(IAgent, ABC):
         
         self._state.updatedAt = datetime.now()
         self._state.lastActivity = datetime.now()
-        self._emit_state_change()
+        return self._emit_state_change()
     
     def on(self, event_type: str, handler: AgentEventHandler) -> None:
         """이벤트 핸들러 등록"""
@@ -330,14 +330,16 @@ class BaseAgent(IAgent, ABC):
             payload={"from": from_state, "to": to_state, "event": event}
         ))
     
-    def _emit_state_change(self) -> None:
-        """상태 변경 이벤트 발생"""
+    def _emit_state_change(self) -> Agent:
+        """상태 변경 이벤트 발생 (발행한 스냅샷 반환)"""
+        state = self.get_state()
         self.emit(AgentEvent(
             type=AgentEventType.STATE_CHANGED,
             agent_id=self._id,
             timestamp=datetime.now(),
-            payload=self.get_state()
+            payload=state
         ))
+        return state
     
     def log(self, level: str, message: str) -> None:
         """로깅"""
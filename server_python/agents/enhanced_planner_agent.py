@@ -15,7 +15,8 @@ Enhanced Planner Agent - Claude Code-like Agent Architecture
 import json
 import re
 import asyncio
-from typing import Dict, List, Optional, Any, Callable, Awaitable
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Any, Callable, Awaitable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -40,7 +41,7 @@ class EnhancedPlannerContext:
     """Enhanced Planner Agent 실행 컨텍스트"""
     task_id: str
     user_request: str
-    available_agents: List[Dict[str, Any]]
+    available_agents: Sequence[Dict[str, Any]]
     previous_plan: Optional[List[Dict[str, Any]]] = None
     execution_results: Optional[List[AgentResult]] = None
     reason: str = "initial"  # initial | replan | recovery
@@ -49,6 +50,8 @@ class EnhancedPlannerContext:
     use_reasoning: bool = True
     enable_critique: bool = True
     context: Dict[str, Any] = field(default_factory=dict)
+    # LLM 호출 함수 주입 (None이면 models.orchestration.call_llm 사용)
+    llm_call: Optional[Callable[..., Awaitable[str]]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for logging"""
@@ -101,6 +104,13 @@ class EnhancedPlannerResult:
 # Enhanced Planner Agent
 # =============================================================================
 
+# 현재 run()의 EnhancedPlannerContext.llm_call
+# (동시에 실행되는 run()끼리 섞이지 않도록 ContextVar로 보관)
+_current_llm_call: ContextVar[Optional[Callable[..., Awaitable[str]]]] = ContextVar(
+    "enhanced_planner_llm_call", default=None
+)
+
+
 class EnhancedPlannerAgent:
     """
     Enhanced Planner Agent - Claude Code-like Architecture
@@ -209,6 +219,14 @@ class EnhancedPlannerAgent:
         Returns:
             EnhancedPlannerResult
         """
+        token = _current_llm_call.set(context.llm_call)
+        try:
+            return await self._run(context)
+        finally:
+            _current_llm_call.reset(token)
+
+    async def _run(self, context: EnhancedPlannerContext) -> EnhancedPlannerResult:
+        """run() 본문 (LLM 호출 함수가 설정된 상태에서 실행)"""
         print(f"[EnhancedPlanner] Starting enhanced planning")
         print(f"[EnhancedPlanner] Context: {context.to_dict()}")
 
@@ -379,7 +397,7 @@ class EnhancedPlannerAgent:
             {"role": "user", "content": f"사용자 요청을 분석해주세요: {context.user_request}"}
         ]
 
-        response = await call_llm(messages, max_tokens=2000)
+        response = await self._call_llm(messages, max_tokens=2000)
 
         return {
             "analysis": response,
@@ -424,7 +442,7 @@ class EnhancedPlannerAgent:
     def _convert_decomposition_to_steps(
         self,
         decomposition: Any,
-        available_agents: List[Dict[str, Any]]
+        available_agents: Sequence[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """Decomposition을 실행 단계로 변환"""
         steps = []
@@ -504,7 +522,7 @@ JSON 형식으로 실행 계획을 작성해주세요:
             }
         ]
 
-        response = await call_llm(messages, max_tokens=4000, json_mode=True)
+        response = await self._call_llm(messages, max_tokens=4000, json_mode=True)
 
         try:
             plan = json.loads(response)
@@ -575,7 +593,7 @@ JSON 형식으로 실행 계획을 작성해주세요:
             }
         ]
 
-        response = await call_llm(messages, max_tokens=4000, json_mode=True)
+        response = await self._call_llm(messages, max_tokens=4000, json_mode=True)
 
         try:
             revised = json.loads(response)
@@ -611,6 +629,11 @@ JSON 형식으로 실행 계획을 작성해주세요:
 
         return min(1.0, max(0.0, confidence))
 
+    async def _call_llm(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        """LLM 호출 (context.llm_call이 주입되었으면 그 함수 사용)"""
+        llm_call = _current_llm_call.get() or call_llm
+        return await llm_call(messages, **kwargs)
+
     async def _llm_generate(self, prompt: str, history: Optional[List[Dict]] = None) -> str:
         """LLM 생성 함수 (Reasoning, Critique용)"""
         messages = []
@@ -618,7 +641,7 @@ JSON 형식으로 실행 계획을 작성해주세요:
             messages.extend(history)
         messages.append({"role": "user", "content": prompt})
 
-        return await call_llm(messages, max_tokens=4000)
+        return await self._call_llm(messages, max_tokens=4000)
 
     async def _summarize_context(self, messages: List[Any]) -> str:
         """컨텍스트 요약 함수"""
@@ -649,6 +672,11 @@ JSON 형식으로 실행 계획을 작성해주세요:
             iterations=1,
         )
 
+    async def close(self) -> None:
+        """리소스 정리 (메모리 통합 백그라운드 워커 종료)"""
+        if self.enable_memory:
+            await self.memory.close()
+
     def get_stats(self) -> Dict[str, Any]:
         """통계 정보"""
         stats = {
@@ -104,15 +104,17 @@ class OrchestrationEngineV2:
 
     def _setup_event_handlers(self) -> None:
         """이벤트 핸들러 설정"""
-        def on_task_status_change(event: Dict[str, Any]) -> None:
+        def on_task_status_change(events: List[Dict[str, Any]]) -> None:
             if self.ws_server:
-                self.ws_server.broadcast_task_status_change(event)
+                for event in events:
+                    self.ws_server.broadcast_task_status_change(event)
                 summary = self.task_state_manager.get_task_summary()
                 self.ws_server.broadcast_task_summary(summary)
 
-        def on_agent_status_change(agent_status: Dict[str, Any]) -> None:
+        def on_agent_status_change(agent_statuses: List[Dict[str, Any]]) -> None:
             if self.ws_server:
-                self.ws_server.broadcast_agent_status_change(agent_status)
+                for agent_status in agent_statuses:
+                    self.ws_server.broadcast_agent_status_change(agent_status)
                 summary = self.task_state_manager.get_agent_summary()
                 self.ws_server.broadcast_agent_summary(summary)
 
@@ -10,9 +10,13 @@ Task State Machine - Task/Agent 상태 관리
 - Execution 단위로 로그 관리 (가비지 방지)
 """
 
+import heapq
+import time
+from collections import deque
+from contextlib import contextmanager
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Callable
+from typing import Deque, Dict, Iterator, List, Optional, Any, Callable, Set, Tuple
 from datetime import datetime
 from uuid import uuid4
 
@@ -39,6 +43,26 @@ class AgentExecutionStatus(str, Enum):
     DISABLED = "disabled"              # 비활성화됨
 
 
+# 상태 변경 이벤트 핸들러: 이벤트 목록을 한 번에 전달받음
+EventHandler = Callable[[List[Dict[str, Any]]], None]
+
+# 종료 상태 (더 이상 전이하지 않음)
+_TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED})
+
+# 활성 Agent 상태 (registered + idle + running)
+_ACTIVE_AGENT_STATUSES = frozenset({
+    AgentExecutionStatus.REGISTERED,
+    AgentExecutionStatus.IDLE,
+    AgentExecutionStatus.RUNNING,
+})
+
+# Task 완료를 막는 Agent 상태 (작업 중)
+_BUSY_AGENT_STATUSES = frozenset({
+    AgentExecutionStatus.RUNNING,
+    AgentExecutionStatus.WAITING,
+})
+
+
 # =============================================================================
 # Task Execution Context
 # =============================================================================
@@ -56,9 +80,11 @@ class TaskExecution:
     status: TaskStatus = TaskStatus.IDLE
 
     # Agent 추적
-    assigned_agents: List[str] = field(default_factory=list)
+    assigned_agents: Set[str] = field(default_factory=set)
     active_agent_id: Optional[str] = None
     active_agent_name: Optional[str] = None
+    # 작업 중(RUNNING/WAITING)인 assigned agent 수 - 상태 전이 시 갱신
+    running_agent_count: int = 0
 
     # 진행 상태
     total_steps: int = 0
@@ -70,15 +96,19 @@ class TaskExecution:
     completed_at: Optional[datetime] = None
     last_activity: Optional[datetime] = None
 
-    # 로그 (execution 단위)
-    logs: List[Dict[str, Any]] = field(default_factory=list)
+    # 경과 시간 계산용 monotonic 타임스탬프 (payload에는 포함하지 않음)
+    completed_at_mono: Optional[float] = None
+    last_activity_mono: float = field(default_factory=time.monotonic)
+
+    # 로그 (execution_id 별로 분리 저장)
+    logs_by_execution: Dict[str, Deque[Dict[str, Any]]] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "execution_id": self.execution_id,
             "task_id": self.task_id,
             "status": self.status.value,
-            "assigned_agents": self.assigned_agents,
+            "assigned_agents": sorted(self.assigned_agents),
             "active_agent_id": self.active_agent_id,
             "active_agent_name": self.active_agent_name,
             "total_steps": self.total_steps,
@@ -104,6 +134,7 @@ class AgentStatus:
     current_execution_id: Optional[str] = None
     current_step: Optional[str] = None
     last_activity: Optional[datetime] = None
+    last_activity_mono: float = field(default_factory=time.monotonic)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -131,29 +162,61 @@ class TaskStateManager:
     - Agent 활성 상태 추적
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         # Task 실행 컨텍스트
         self._executions: Dict[str, TaskExecution] = {}
 
         # Agent 상태 추적
         self._agent_statuses: Dict[str, AgentStatus] = {}
 
-        # 이벤트 핸들러
-        self._on_status_change: Optional[Callable] = None
-        self._on_agent_change: Optional[Callable] = None
+        # 상태별 인덱스 (요약 조회 시 전체 스캔 방지)
+        self._tasks_by_status: Dict[TaskStatus, Set[str]] = {
+            status: set() for status in TaskStatus
+        }
+        self._agents_by_status: Dict[AgentExecutionStatus, Set[str]] = {
+            status: set() for status in AgentExecutionStatus
+        }
+
+        # 이벤트 핸들러 (이벤트 목록을 인자로 받음)
+        self._on_status_change: Optional[EventHandler] = None
+        self._on_agent_change: Optional[EventHandler] = None
+
+        # 종료된 Task 정리용 min-heap: (completed_at_mono, task_id)
+        self._completion_heap: List[Tuple[float, str]] = []
+
+        # batch() 구간 동안 모아둔 이벤트
+        self._batch_depth: int = 0
+        self._pending_status_events: List[Dict[str, Any]] = []
+        self._pending_agent_events: List[Dict[str, Any]] = []
 
     # =========================================================================
     # Event Handlers
     # =========================================================================
 
-    def set_status_change_handler(self, handler: Callable) -> None:
-        """Task 상태 변경 핸들러 설정"""
+    def set_status_change_handler(self, handler: EventHandler) -> None:
+        """Task 상태 변경 핸들러 설정 (handler(events: List[Dict]))"""
         self._on_status_change = handler
 
-    def set_agent_change_handler(self, handler: Callable) -> None:
-        """Agent 상태 변경 핸들러 설정"""
+    def set_agent_change_handler(self, handler: EventHandler) -> None:
+        """Agent 상태 변경 핸들러 설정 (handler(events: List[Dict]))"""
         self._on_agent_change = handler
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        상태 변경 이벤트 일괄 발행
+
+        구간 안에서 발생한 이벤트를 모아두었다가, 가장 바깥 구간을
+        벗어날 때 핸들러별로 한 번씩 목록으로 전달합니다.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_events()
+
     # =========================================================================
     # Task Execution Lifecycle
     # =========================================================================
@@ -165,16 +228,21 @@ class TaskStateManager:
         Returns:
             새로운 TaskExecution 인스턴스
         """
+        now = datetime.now()
         execution = TaskExecution(
             task_id=task_id,
             status=TaskStatus.RUNNING,
             total_steps=total_steps,
-            started_at=datetime.now(),
-            last_activity=datetime.now()
+            started_at=now,
+            last_activity=now
         )
+        previous = self._executions.get(task_id)
+        if previous:
+            self._tasks_by_status[previous.status].discard(task_id)
         self._executions[task_id] = execution
+        self._tasks_by_status[TaskStatus.RUNNING].add(task_id)
 
-        self._emit_status_change(task_id, TaskStatus.IDLE, TaskStatus.RUNNING)
+        self._emit_status_change(execution, TaskStatus.IDLE, TaskStatus.RUNNING, now=now)
         return execution
 
     def get_execution(self, task_id: str) -> Optional[TaskExecution]:
@@ -195,10 +263,29 @@ class TaskStateManager:
         if not execution:
             return None
 
+        return self._update_execution(
+            execution,
+            status=status,
+            active_agent_id=active_agent_id,
+            active_agent_name=active_agent_name,
+            current_step=current_step,
+            completed_steps=completed_steps
+        )
+
+    def _update_execution(
+        self,
+        execution: TaskExecution,
+        status: Optional[TaskStatus] = None,
+        active_agent_id: Optional[str] = None,
+        active_agent_name: Optional[str] = None,
+        current_step: Optional[str] = None,
+        completed_steps: Optional[int] = None
+    ) -> TaskExecution:
+        """이미 조회한 execution에 대한 상태 업데이트"""
         old_status = execution.status
 
-        if status:
-            execution.status = status
+        if status is not None:
+            self._set_task_status(execution, status)
         if active_agent_id is not None:
             execution.active_agent_id = active_agent_id
         if active_agent_name is not None:
@@ -208,10 +295,12 @@ class TaskStateManager:
         if completed_steps is not None:
             execution.completed_steps = completed_steps
 
-        execution.last_activity = datetime.now()
+        now = datetime.now()
+        execution.last_activity = now
+        execution.last_activity_mono = time.monotonic()
 
-        if status and status != old_status:
-            self._emit_status_change(task_id, old_status, status)
+        if status is not None and status is not old_status:
+            self._emit_status_change(execution, old_status, status, now=now)
 
         return execution
 
@@ -227,25 +316,36 @@ class TaskStateManager:
         if not execution:
             return None
 
+        return self._complete_execution(execution, success)
+
+    def _complete_execution(self, execution: TaskExecution, success: bool) -> TaskExecution:
+        """이미 조회한 execution 완료 처리"""
         old_status = execution.status
         new_status = TaskStatus.COMPLETED if success else TaskStatus.FAILED
 
-        execution.status = new_status
-        execution.completed_at = datetime.now()
-        execution.last_activity = datetime.now()
+        now = datetime.now()
+        now_mono = time.monotonic()
+        self._set_task_status(execution, new_status)
+        execution.completed_at = now
+        execution.last_activity = now
+        execution.completed_at_mono = now_mono
+        execution.last_activity_mono = now_mono
         execution.active_agent_id = None
         execution.active_agent_name = None
-
-        # 해당 Task에 할당된 모든 Agent를 IDLE로 변경
-        for agent_id in execution.assigned_agents:
-            self.update_agent_status(
-                agent_id=agent_id,
-                status=AgentExecutionStatus.IDLE,
-                current_task_id=None,
-                current_step=None
-            )
-
-        self._emit_status_change(task_id, old_status, new_status)
+        heapq.heappush(self._completion_heap, (now_mono, execution.task_id))
+
+        with self.batch():
+            # 해당 Task에 할당된 모든 Agent를 IDLE로 변경
+            for agent_id in execution.assigned_agents:
+                self._update_agent_status(
+                    agent_id=agent_id,
+                    status=AgentExecutionStatus.IDLE,
+                    now=now,
+                    now_mono=now_mono
+                )
+            execution.running_agent_count = 0
+
+            self._emit_status_change(execution, old_status, new_status, now=now)
         return execution
 
     def set_waiting_user(self, task_id: str) -> Optional[TaskExecution]:
@@ -264,7 +364,11 @@ class TaskStateManager:
             status=AgentExecutionStatus.REGISTERED,
             last_activity=datetime.now()
         )
+        previous = self._agent_statuses.get(agent_id)
+        if previous:
+            self._agents_by_status[previous.status].discard(agent_id)
         self._agent_statuses[agent_id] = agent_status
+        self._agents_by_status[agent_status.status].add(agent_id)
         return agent_status
 
     def get_agent_status(self, agent_id: str) -> Optional[AgentStatus]:
@@ -278,8 +382,30 @@ class TaskStateManager:
         current_task_id: Optional[str] = None,
         current_step: Optional[str] = None,
         agent_name: Optional[str] = None
-    ) -> Optional[AgentStatus]:
-        """Agent 상태 업데이트"""
+    ) -> AgentStatus:
+        """Agent 상태 업데이트 (미등록 Agent는 자동 등록)"""
+        return self._update_agent_status(
+            agent_id=agent_id,
+            status=status,
+            current_task_id=current_task_id,
+            current_step=current_step,
+            agent_name=agent_name,
+            now=datetime.now(),
+            now_mono=time.monotonic()
+        )
+
+    def _update_agent_status(
+        self,
+        agent_id: str,
+        status: Optional[AgentExecutionStatus] = None,
+        current_task_id: Optional[str] = None,
+        current_step: Optional[str] = None,
+        agent_name: Optional[str] = None,
+        *,
+        now: datetime,
+        now_mono: float
+    ) -> AgentStatus:
+        """Agent 상태 업데이트 (호출자가 전달한 시각 사용)"""
         agent_status = self._agent_statuses.get(agent_id)
 
         if not agent_status:
@@ -289,11 +415,14 @@ class TaskStateManager:
                 agent_name=agent_name or agent_id
             )
             self._agent_statuses[agent_id] = agent_status
+            self._agents_by_status[agent_status.status].add(agent_id)
 
         old_status = agent_status.status
+        old_task_id = agent_status.current_task_id
+        old_execution_id = agent_status.current_execution_id
 
-        if status:
-            agent_status.status = status
+        if status is not None:
+            self._set_agent_status(agent_status, status)
         if current_task_id is not None:
             agent_status.current_task_id = current_task_id
         if current_step is not None:
@@ -301,9 +430,12 @@ class TaskStateManager:
         if agent_name:
             agent_status.agent_name = agent_name
 
-        agent_status.last_activity = datetime.now()
+        agent_status.last_activity = now
+        agent_status.last_activity_mono = now_mono
 
-        if status and status != old_status:
+        if status is not None and status is not old_status:
+            if old_status in _BUSY_AGENT_STATUSES and status not in _BUSY_AGENT_STATUSES:
+                self._release_running_agent(old_task_id, old_execution_id)
             self._emit_agent_change(agent_status)
 
         return agent_status
@@ -317,6 +449,18 @@ class TaskStateManager:
         step_description: str = ""
     ) -> AgentStatus:
         """Agent를 실행 중 상태로 설정"""
+        previous = self._agent_statuses.get(agent_id)
+        already_counted = False
+        if previous and previous.status in _BUSY_AGENT_STATUSES:
+            if (previous.current_task_id == task_id
+                    and previous.current_execution_id == execution_id):
+                already_counted = True
+            else:
+                # 다른 Task에서 작업 중이던 Agent - 이전 Task의 카운트 해제
+                self._release_running_agent(
+                    previous.current_task_id, previous.current_execution_id
+                )
+
         agent_status = self.update_agent_status(
             agent_id=agent_id,
             agent_name=agent_name,
@@ -324,13 +468,14 @@ class TaskStateManager:
             current_task_id=task_id,
             current_step=step_description
         )
-        if agent_status:
-            agent_status.current_execution_id = execution_id
+        agent_status.current_execution_id = execution_id
 
         # Task execution에 Agent 추가
         execution = self._executions.get(task_id)
-        if execution and agent_id not in execution.assigned_agents:
-            execution.assigned_agents.append(agent_id)
+        if execution:
+            execution.assigned_agents.add(agent_id)
+            if not already_counted and execution.execution_id == execution_id:
+                execution.running_agent_count += 1
 
         return agent_status
 
@@ -360,32 +505,30 @@ class TaskStateManager:
             True if task should be marked as completed
         """
         execution = self._executions.get(task_id)
-        if not execution:
-            return False
+        return execution is not None and self._is_completion_ready(execution)
 
+    def _is_completion_ready(self, execution: TaskExecution) -> bool:
+        """이미 조회한 execution의 종료 조건 확인"""
         # 이미 완료/실패 상태면 조건 체크 불필요
-        if execution.status in [TaskStatus.COMPLETED, TaskStatus.FAILED]:
+        if execution.status in _TERMINAL_STATUSES:
             return False
 
         # 조건 1: 모든 steps 완료
         if execution.total_steps > 0 and execution.completed_steps >= execution.total_steps:
             return True
 
-        # 조건 2: 모든 assigned agent가 IDLE 상태 (작업 완료)
+        # 조건 2: 작업 중인 assigned agent가 없음 (작업 완료)
         if execution.assigned_agents:
-            all_idle = all(
-                self._agent_statuses.get(aid, AgentStatus(aid, aid)).status == AgentExecutionStatus.IDLE
-                for aid in execution.assigned_agents
-            )
-            if all_idle and execution.completed_steps > 0:
+            if execution.running_agent_count == 0 and execution.completed_steps > 0:
                 return True
 
         return False
 
     def auto_complete_if_done(self, task_id: str) -> bool:
         """종료 조건 충족 시 자동 완료 처리"""
-        if self.check_completion_conditions(task_id):
-            self.complete_execution(task_id, success=True)
+        execution = self._executions.get(task_id)
+        if execution is not None and self._is_completion_ready(execution):
+            self._complete_execution(execution, success=True)
             return True
         return False
 
@@ -422,7 +565,7 @@ class TaskStateManager:
             "timestamp": datetime.now().isoformat()
         }
 
-        execution.logs.append(log_entry)
+        execution.logs_by_execution.setdefault(execution.execution_id, deque()).append(log_entry)
         return log_entry
 
     def get_logs(self, task_id: str, execution_id: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -438,10 +581,7 @@ class TaskStateManager:
             return []
 
         target_execution_id = execution_id or execution.execution_id
-        return [
-            log for log in execution.logs
-            if log.get("execution_id") == target_execution_id
-        ]
+        return list(execution.logs_by_execution.get(target_execution_id, ()))
 
     def clear_stale_logs(self, task_id: str) -> int:
         """
@@ -455,14 +595,17 @@ class TaskStateManager:
             return 0
 
         current_execution_id = execution.execution_id
-        original_count = len(execution.logs)
+        removed = sum(
+            len(logs) for log_execution_id, logs in execution.logs_by_execution.items()
+            if log_execution_id != current_execution_id
+        )
 
-        execution.logs = [
-            log for log in execution.logs
-            if log.get("execution_id") == current_execution_id
-        ]
+        current_logs = execution.logs_by_execution.get(current_execution_id)
+        execution.logs_by_execution = (
+            {current_execution_id: current_logs} if current_logs is not None else {}
+        )
 
-        return original_count - len(execution.logs)
+        return removed
 
     # =========================================================================
     # Status Summary
@@ -470,27 +613,10 @@ class TaskStateManager:
 
     def get_task_summary(self) -> Dict[str, Any]:
         """전체 Task 상태 요약"""
-        running = []
-        waiting = []
-        completed = []
-        failed = []
-
-        for task_id, execution in self._executions.items():
-            task_info = {
-                "task_id": task_id,
-                "execution_id": execution.execution_id,
-                "active_agent": execution.active_agent_name,
-                "progress": f"{execution.completed_steps}/{execution.total_steps}"
-            }
-
-            if execution.status == TaskStatus.RUNNING:
-                running.append(task_info)
-            elif execution.status == TaskStatus.WAITING_USER:
-                waiting.append(task_info)
-            elif execution.status == TaskStatus.COMPLETED:
-                completed.append(task_info)
-            elif execution.status == TaskStatus.FAILED:
-                failed.append(task_info)
+        running = self._task_infos(TaskStatus.RUNNING)
+        waiting = self._task_infos(TaskStatus.WAITING_USER)
+        completed = self._task_infos(TaskStatus.COMPLETED)
+        failed = self._task_infos(TaskStatus.FAILED)
 
         return {
             "running": running,
@@ -508,30 +634,15 @@ class TaskStateManager:
 
     def get_agent_summary(self) -> Dict[str, Any]:
         """전체 Agent 상태 요약"""
-        registered = []
-        idle = []
-        running = []
-        disabled = []
-
-        for agent_id, status in self._agent_statuses.items():
-            agent_info = {
-                "agent_id": agent_id,
-                "agent_name": status.agent_name,
-                "current_task": status.current_task_id,
-                "current_step": status.current_step
-            }
-
-            if status.status == AgentExecutionStatus.REGISTERED:
-                registered.append(agent_info)
-            elif status.status == AgentExecutionStatus.IDLE:
-                idle.append(agent_info)
-            elif status.status == AgentExecutionStatus.RUNNING:
-                running.append(agent_info)
-            elif status.status == AgentExecutionStatus.DISABLED:
-                disabled.append(agent_info)
+        registered = self._agent_infos(AgentExecutionStatus.REGISTERED)
+        idle = self._agent_infos(AgentExecutionStatus.IDLE)
+        running = self._agent_infos(AgentExecutionStatus.RUNNING)
+        disabled = self._agent_infos(AgentExecutionStatus.DISABLED)
 
         # 활성 Agent = registered + idle + running
-        active_count = len(registered) + len(idle) + len(running)
+        active_count = sum(
+            len(self._agents_by_status[status]) for status in _ACTIVE_AGENT_STATUSES
+        )
 
         return {
             "registered": registered,
@@ -569,18 +680,25 @@ class TaskStateManager:
     # =========================================================================
 
     def cleanup_completed_tasks(self, older_than_hours: int = 24) -> int:
-        """완료된 오래된 Task 정리"""
-        cutoff = datetime.now()
+        """
+        완료된 오래된 Task 정리
+
+        완료 시각 순 heap에서 만료된 항목만 꺼내 확인합니다.
+        재시작/교체된 execution의 항목은 꺼낼 때 무시됩니다.
+        """
+        cutoff = time.monotonic() - older_than_hours * 3600
+        heap = self._completion_heap
         removed = 0
 
-        for task_id in list(self._executions.keys()):
-            execution = self._executions[task_id]
-            if execution.status in [TaskStatus.COMPLETED, TaskStatus.FAILED]:
-                if execution.completed_at:
-                    age_hours = (cutoff - execution.completed_at).total_seconds() / 3600
-                    if age_hours > older_than_hours:
-                        del self._executions[task_id]
-                        removed += 1
+        while heap and heap[0][0] < cutoff:
+            completed_at_mono, task_id = heapq.heappop(heap)
+            execution = self._executions.get(task_id)
+            if (execution
+                    and execution.completed_at_mono == completed_at_mono
+                    and execution.status in _TERMINAL_STATUSES):
+                del self._executions[task_id]
+                self._tasks_by_status[execution.status].discard(task_id)
+                removed += 1
 
         return removed
 
@@ -597,25 +715,31 @@ class TaskStateManager:
             "orphan_logs_removed": 0
         }
 
+        now = datetime.now()
+        now_mono = time.monotonic()
+
         # 1. Zombie task 제거 (RUNNING인데 오래된 경우)
-        for task_id, execution in list(self._executions.items()):
-            if execution.status == TaskStatus.RUNNING:
-                if execution.last_activity:
-                    idle_minutes = (datetime.now() - execution.last_activity).total_seconds() / 60
-                    if idle_minutes > 30:  # 30분 이상 비활성
-                        execution.status = TaskStatus.FAILED
-                        fixes["zombie_tasks_removed"] += 1
+        # 상태 인덱스의 RUNNING 버킷만 확인 (순회 중 버킷이 바뀌므로 스냅샷 사용)
+        for task_id in list(self._tasks_by_status[TaskStatus.RUNNING]):
+            execution = self._executions[task_id]
+            idle_minutes = (now_mono - execution.last_activity_mono) / 60.0
+            if idle_minutes > 30:  # 30분 이상 비활성
+                self._set_task_status(execution, TaskStatus.FAILED)
+                execution.completed_at = now
+                execution.completed_at_mono = now_mono
+                heapq.heappush(self._completion_heap, (now_mono, task_id))
+                fixes["zombie_tasks_removed"] += 1
 
         # 2. Stale agent 리셋 (RUNNING인데 task가 없는 경우)
-        for agent_id, status in self._agent_statuses.items():
-            if status.status == AgentExecutionStatus.RUNNING:
-                if status.current_task_id:
-                    execution = self._executions.get(status.current_task_id)
-                    if not execution or execution.status in [TaskStatus.COMPLETED, TaskStatus.FAILED]:
-                        status.status = AgentExecutionStatus.IDLE
-                        status.current_task_id = None
-                        status.current_step = None
-                        fixes["stale_agents_reset"] += 1
+        for agent_id in list(self._agents_by_status[AgentExecutionStatus.RUNNING]):
+            status = self._agent_statuses[agent_id]
+            if status.current_task_id:
+                current = self._executions.get(status.current_task_id)
+                if not current or current.status in _TERMINAL_STATUSES:
+                    self._set_agent_status(status, AgentExecutionStatus.IDLE)
+                    status.current_task_id = None
+                    status.current_step = None
+                    fixes["stale_agents_reset"] += 1
 
         return fixes
 
@@ -623,27 +747,102 @@ class TaskStateManager:
     # Internal Helpers
     # =========================================================================
 
+    def _set_task_status(self, execution: TaskExecution, status: TaskStatus) -> None:
+        """Task 상태 변경 (상태별 인덱스 동기화)"""
+        if execution.status is not status:
+            self._tasks_by_status[execution.status].discard(execution.task_id)
+            self._tasks_by_status[status].add(execution.task_id)
+        execution.status = status
+
+    def _set_agent_status(self, agent_status: AgentStatus, status: AgentExecutionStatus) -> None:
+        """Agent 상태 변경 (상태별 인덱스 동기화)"""
+        if agent_status.status is not status:
+            self._agents_by_status[agent_status.status].discard(agent_status.agent_id)
+            self._agents_by_status[status].add(agent_status.agent_id)
+        agent_status.status = status
+
+    def _task_infos(self, status: TaskStatus) -> List[Dict[str, Any]]:
+        """특정 상태의 Task 요약 정보 목록"""
+        infos = []
+        for task_id in self._tasks_by_status[status]:
+            execution = self._executions[task_id]
+            infos.append({
+                "task_id": task_id,
+                "execution_id": execution.execution_id,
+                "active_agent": execution.active_agent_name,
+                "progress": f"{execution.completed_steps}/{execution.total_steps}"
+            })
+        return infos
+
+    def _agent_infos(self, status: AgentExecutionStatus) -> List[Dict[str, Any]]:
+        """특정 상태의 Agent 요약 정보 목록"""
+        infos = []
+        for agent_id in self._agents_by_status[status]:
+            agent_status = self._agent_statuses[agent_id]
+            infos.append({
+                "agent_id": agent_id,
+                "agent_name": agent_status.agent_name,
+                "current_task": agent_status.current_task_id,
+                "current_step": agent_status.current_step
+            })
+        return infos
+
+    def _release_running_agent(
+        self,
+        task_id: Optional[str],
+        execution_id: Optional[str]
+    ) -> None:
+        """Agent가 작업을 마쳤을 때 해당 execution의 running_agent_count 감소"""
+        if not task_id:
+            return
+        execution = self._executions.get(task_id)
+        if (execution and execution.execution_id == execution_id
+                and execution.running_agent_count > 0):
+            execution.running_agent_count -= 1
+
     def _emit_status_change(
         self,
-        task_id: str,
+        execution: TaskExecution,
         old_status: TaskStatus,
-        new_status: TaskStatus
+        new_status: TaskStatus,
+        now: Optional[datetime] = None
     ) -> None:
-        """상태 변경 이벤트 발행"""
-        if self._on_status_change:
-            execution = self._executions.get(task_id)
-            self._on_status_change({
-                "task_id": task_id,
-                "execution_id": execution.execution_id if execution else None,
-                "old_status": old_status.value,
-                "new_status": new_status.value,
-                "timestamp": datetime.now().isoformat()
-            })
+        """상태 변경 이벤트 발행 (핸들러가 없으면 payload를 만들지 않음)"""
+        if self._on_status_change is None:
+            return
+
+        event = {
+            "task_id": execution.task_id,
+            "execution_id": execution.execution_id,
+            "old_status": old_status.value,
+            "new_status": new_status.value,
+            "timestamp": (now or datetime.now()).isoformat()
+        }
+        if self._batch_depth > 0:
+            self._pending_status_events.append(event)
+        else:
+            self._on_status_change([event])
 
     def _emit_agent_change(self, agent_status: AgentStatus) -> None:
-        """Agent 상태 변경 이벤트 발행"""
-        if self._on_agent_change:
-            self._on_agent_change(agent_status.to_dict())
+        """Agent 상태 변경 이벤트 발행 (핸들러가 없으면 payload를 만들지 않음)"""
+        if self._on_agent_change is None:
+            return
+
+        event = agent_status.to_dict()
+        if self._batch_depth > 0:
+            self._pending_agent_events.append(event)
+        else:
+            self._on_agent_change([event])
+
+    def _flush_events(self) -> None:
+        """batch() 구간에서 모아둔 이벤트를 핸들러에 전달"""
+        agent_events, self._pending_agent_events = self._pending_agent_events, []
+        status_events, self._pending_status_events = self._pending_status_events, []
+
+        if agent_events and self._on_agent_change:
+            self._on_agent_change(agent_events)
+        if status_events and self._on_status_change:
+            self._on_status_change(status_events)
 
 
 # =============================================================================
@@ -1,8 +1,20 @@
-from typing import Optional, List, Callable, Dict, Any
+from collections import deque
+from inspect import isawaitable, iscoroutinefunction
+from types import MappingProxyType
+from typing import Optional, List, Callable, Deque, Dict, Any, Mapping, Tuple
 from datetime import datetime
 from models.agent import ThinkingMode
 
 
+_STATE_DESCRIPTIONS: Dict[ThinkingMode, str] = {
+    ThinkingMode.IDLE: "대기 중 - 새로운 작업을 기다리는 상태",
+    ThinkingMode.EXPLORING: "탐색 중 - 정보를 수집하고 분석하는 상태",
+    ThinkingMode.STRUCTURING: "구조화 중 - 작업을 티켓으로 분해하는 상태",
+    ThinkingMode.VALIDATING: "검증 중 - 생성된 티켓을 검토하는 상태",
+    ThinkingMode.SUMMARIZING: "요약 중 - 결과를 정리하는 상태",
+}
+
+
 class StateTransition:
     def __init__(
         self,
@@ -17,6 +29,8 @@ class StateTransition:
         self.event = event
         self.guard = guard
         self.action = action
+        # async 액션 여부를 생성 시점에 한 번만 판별
+        self.is_async_action = action is not None and iscoroutinefunction(action)
 
 
 class StateMachineConfig:
@@ -24,11 +38,14 @@ class StateMachineConfig:
         self,
         initial_state: ThinkingMode = ThinkingMode.IDLE,
         transitions: Optional[List[StateTransition]] = None,
-        on_state_change: Optional[Callable[[ThinkingMode, ThinkingMode, str], None]] = None
+        on_state_change: Optional[Callable[[ThinkingMode, ThinkingMode, str], None]] = None,
+        history_limit: int = 1024
     ):
         self.initial_state = initial_state
         self.transitions = transitions or []
         self.on_state_change = on_state_change
+        # 보관할 최대 전환 히스토리 수 (초과 시 오래된 항목부터 제거)
+        self.history_limit = history_limit
 
 
 class ThinkingModeStateMachine:
@@ -85,7 +102,8 @@ class ThinkingModeStateMachine:
         
         self.config = config
         self.current_state = config.initial_state
-        self.history: List[Dict[str, Any]] = []
+        # 항목은 기록 시점에 고정된 읽기 전용 매핑 (조회 시 복사 불필요)
+        self.history: Deque[Mapping[str, Any]] = deque(maxlen=config.history_limit)
         self.is_paused = False
     
     def get_state(self) -> ThinkingMode:
@@ -121,18 +139,20 @@ class ThinkingModeStateMachine:
         self.current_state = valid_transition.to_state
         
         # 히스토리 기록
-        self.history.append({
+        self.history.append(MappingProxyType({
             "from": previous_state,
             "to": self.current_state,
             "event": event,
             "timestamp": datetime.now()
-        })
+        }))
         
         # 액션 실행
         if valid_transition.action:
-            if callable(valid_transition.action):
+            if valid_transition.is_async_action:
+                await valid_transition.action()
+            elif callable(valid_transition.action):
                 result = valid_transition.action()
-                if hasattr(result, '__await__'):
+                if isawaitable(result):
                     await result
         
         # 상태 변경 콜백
@@ -172,19 +192,12 @@ class ThinkingModeStateMachine:
             for t in self.config.transitions
         )
     
-    def get_history(self) -> List[Dict[str, Any]]:
-        """상태 전환 히스토리 조회"""
-        return self.history.copy()
+    def get_history(self) -> Tuple[Mapping[str, Any], ...]:
+        """상태 전환 히스토리 조회 (읽기 전용 스냅샷)"""
+        return tuple(self.history)
     
     @staticmethod
     def get_state_description(state: ThinkingMode) -> str:
         """상태별 설명"""
-        descriptions = {
-            ThinkingMode.IDLE: "대기 중 - 새로운 작업을 기다리는 상태",
-            ThinkingMode.EXPLORING: "탐색 중 - 정보를 수집하고 분석하는 상태",
-            ThinkingMode.STRUCTURING: "구조화 중 - 작업을 티켓으로 분해하는 상태",
-            ThinkingMode.VALIDATING: "검증 중 - 생성된 티켓을 검토하는 상태",
-            ThinkingMode.SUMMARIZING: "요약 중 - 결과를 정리하는 상태",
-        }
-        return descriptions.get(state, "알 수 없는 상태")
+        return _STATE_DESCRIPTIONS.get(state, "알 수 없는 상태")
 
@@ -37,6 +37,8 @@ AgentEventHandler = Callable[[AgentEvent], None]
 
 
 class AgentExecutionContext:
+    __slots__ = ('agent_id', 'ontology_context', 'current_ticket', 'previous_decisions')
+
     def __init__(
         self,
         agent_id: str,
@@ -51,6 +53,8 @@ class AgentExecutionContext:
 
 
 class AgentInput:
+    __slots__ = ('type', 'content', 'metadata', 'source')
+
     def __init__(
         self,
         type: str,  # 'email' | 'document' | 'message' | 'task' | 'event'
@@ -83,6 +87,11 @@ class AgentOutput:
 
 
 class AgentConfig:
+    __slots__ = (
+        'name', 'type', 'description', 'permissions',
+        'constraints', 'capabilities', 'custom_config'
+    )
+
     def __init__(
         self,
         name: str,
@@ -159,7 +168,7 @@ class IAgent(ABC):
         pass
 
     @abstractmethod
-    async def update_state(self, update: AgentStateUpdate) -> None:
+    async def update_state(self, update: AgentStateUpdate) -> Agent:
         pass
 
     @abstractmethod
@@ -18,6 +18,18 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+def _create_index_concurrently(index_name: str, table_name: str, columns, **kw) -> None:
+    """Create an index without blocking writes; safe to re-run."""
+    op.create_index(
+        index_name,
+        table_name,
+        columns,
+        postgresql_concurrently=True,
+        if_not_exists=True,
+        **kw,
+    )
+
+
 def upgrade() -> None:
     # Create agents table
     op.create_table(
@@ -32,13 +44,11 @@ def upgrade() -> None:
         sa.Column('system_prompt', sa.Text(), nullable=True),
         sa.Column('constraints', postgresql.ARRAY(sa.String()), nullable=True),
         sa.Column('allowed_mcps', postgresql.ARRAY(sa.String()), nullable=True),
-        sa.Column('config', postgresql.JSON(), nullable=True),
+        sa.Column('config', postgresql.JSONB(), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('NOW()')),
         sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('NOW()')),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_agents_type', 'agents', ['type'])
-    op.create_index('ix_agents_status', 'agents', ['status'])
 
     # Create tasks table
     op.create_table(
@@ -54,17 +64,13 @@ def upgrade() -> None:
         sa.Column('auto_assign', sa.Boolean(), nullable=False, server_default='false'),
         sa.Column('due_date', sa.DateTime(timezone=True), nullable=True),
         sa.Column('tags', postgresql.ARRAY(sa.String()), nullable=True),
-        sa.Column('metadata_json', postgresql.JSON(), nullable=True),
+        sa.Column('metadata_json', postgresql.JSONB(), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('NOW()')),
         sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('NOW()')),
         sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
         sa.ForeignKeyConstraint(['assigned_agent_id'], ['agents.id'], ondelete='SET NULL'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_tasks_status', 'tasks', ['status'])
-    op.create_index('ix_tasks_priority', 'tasks', ['priority'])
-    op.create_index('ix_tasks_assigned_agent_id', 'tasks', ['assigned_agent_id'])
-    op.create_index('ix_tasks_created_at', 'tasks', ['created_at'])
 
     # Create tickets table
     op.create_table(
@@ -75,14 +81,12 @@ def upgrade() -> None:
         sa.Column('content', sa.Text(), nullable=True),
         sa.Column('status', sa.String(50), nullable=False, server_default='pending'),
         sa.Column('priority', sa.Integer(), nullable=False, server_default='0'),
-        sa.Column('options', postgresql.JSON(), nullable=True),
+        sa.Column('options', postgresql.JSONB(), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('NOW()')),
         sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('NOW()')),
         sa.ForeignKeyConstraint(['agent_id'], ['agents.id'], ondelete='SET NULL'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_tickets_status', 'tickets', ['status'])
-    op.create_index('ix_tickets_agent_id', 'tickets', ['agent_id'])
 
     # Create approvals table
     op.create_table(
@@ -93,16 +97,14 @@ def upgrade() -> None:
         sa.Column('type', sa.String(50), nullable=False),
         sa.Column('message', sa.Text(), nullable=True),
         sa.Column('status', sa.String(50), nullable=False, server_default='pending'),
-        sa.Column('options', postgresql.JSON(), nullable=True),
-        sa.Column('response', postgresql.JSON(), nullable=True),
+        sa.Column('options', postgresql.JSONB(), nullable=True),
+        sa.Column('response', postgresql.JSONB(), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('NOW()')),
         sa.Column('responded_at', sa.DateTime(timezone=True), nullable=True),
         sa.ForeignKeyConstraint(['agent_id'], ['agents.id'], ondelete='SET NULL'),
         sa.ForeignKeyConstraint(['ticket_id'], ['tickets.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_approvals_status', 'approvals', ['status'])
-    op.create_index('ix_approvals_agent_id', 'approvals', ['agent_id'])
 
     # Create audit_logs table
     op.create_table(
@@ -111,14 +113,53 @@ def upgrade() -> None:
         sa.Column('entity_type', sa.String(50), nullable=False),
         sa.Column('entity_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('action', sa.String(50), nullable=False),
-        sa.Column('old_value', postgresql.JSON(), nullable=True),
-        sa.Column('new_value', postgresql.JSON(), nullable=True),
+        sa.Column('old_value', postgresql.JSONB(), nullable=True),
+        sa.Column('new_value', postgresql.JSONB(), nullable=True),
         sa.Column('performed_by', sa.String(255), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('NOW()')),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_audit_logs_entity', 'audit_logs', ['entity_type', 'entity_id'])
-    op.create_index('ix_audit_logs_created_at', 'audit_logs', ['created_at'])
+
+    # Indexes are built CONCURRENTLY (no ACCESS EXCLUSIVE lock), which
+    # cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        _create_index_concurrently('ix_agents_type', 'agents', ['type'])
+        _create_index_concurrently('ix_agents_status', 'agents', ['status'])
+
+        # Work-queue lookups: filter on status/priority, newest first, index-only
+        _create_index_concurrently(
+            'ix_tasks_queue', 'tasks',
+            ['status', 'priority', sa.text('created_at DESC')],
+            postgresql_include=['id', 'title', 'assigned_agent_id'],
+        )
+        _create_index_concurrently('ix_tasks_assigned_agent_id', 'tasks', ['assigned_agent_id'])
+        _create_index_concurrently('ix_tasks_created_at', 'tasks', ['created_at'])
+        _create_index_concurrently(
+            'ix_tasks_metadata_gin', 'tasks', ['metadata_json'],
+            postgresql_using='gin',
+            postgresql_ops={'metadata_json': 'jsonb_path_ops'},
+        )
+
+        _create_index_concurrently(
+            'ix_tickets_status_pending', 'tickets', ['status'],
+            postgresql_where=sa.text("status IN ('pending', 'pending_approval')"),
+        )
+        _create_index_concurrently('ix_tickets_agent_id', 'tickets', ['agent_id'])
+
+        _create_index_concurrently(
+            'ix_approvals_status_pending', 'approvals', ['status'],
+            postgresql_where=sa.text("status = 'pending'"),
+        )
+        _create_index_concurrently('ix_approvals_agent_id', 'approvals', ['agent_id'])
+
+        _create_index_concurrently('ix_audit_logs_entity', 'audit_logs', ['entity_type', 'entity_id'])
+        # audit_logs is append-only, so created_at follows physical row order:
+        # a BRIN index is a few pages instead of a full B-tree
+        _create_index_concurrently(
+            'ix_audit_logs_created_at', 'audit_logs', ['created_at'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+        )
 
 
 def downgrade() -> None:
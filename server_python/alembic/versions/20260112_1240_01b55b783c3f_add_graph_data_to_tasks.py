@@ -21,9 +21,20 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     # Add graph_data column to tasks table
-    op.add_column('tasks', sa.Column('graph_data', postgresql.JSON(), nullable=True))
+    op.add_column('tasks', sa.Column('graph_data', postgresql.JSONB(), nullable=True))
+
+    # GIN index for containment (@>) lookups; built CONCURRENTLY outside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_graph_data_gin', 'tasks', ['graph_data'],
+            postgresql_using='gin',
+            postgresql_ops={'graph_data': 'jsonb_path_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
+    op.drop_index('ix_tasks_graph_data_gin', table_name='tasks', if_exists=True)
     # Remove graph_data column from tasks table
     op.drop_column('tasks', 'graph_data')
@@ -0,0 +1,62 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: 7c2e9a4d1f36
+Revises: 01b55b783c3f
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e9a4d1f36'
+down_revision: Union[str, None] = '01b55b783c3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (created_at, id) B-trees back keyset pagination in both directions;
+    # built CONCURRENTLY outside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_created_at_id', 'tasks', ['created_at', 'id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Superseded: same leading column
+        op.drop_index(
+            'ix_tasks_created_at', table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        # Audit keyset pages are per entity type (get_by_entity_type); the
+        # BRIN ix_audit_logs_created_at stays for created_at range scans
+        op.create_index(
+            'ix_audit_logs_entity_type_created_at_id', 'audit_logs',
+            ['entity_type', 'created_at', 'id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_audit_logs_entity_type_created_at_id', table_name='audit_logs',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            'ix_tasks_created_at', 'tasks', ['created_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_tasks_created_at_id', table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
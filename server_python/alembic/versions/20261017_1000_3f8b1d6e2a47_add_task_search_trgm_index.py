@@ -0,0 +1,46 @@
+"""add_task_search_trgm_index
+
+Revision ID: 3f8b1d6e2a47
+Revises: 7c2e9a4d1f36
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8b1d6e2a47'
+down_revision: Union[str, None] = '7c2e9a4d1f36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # Trigram GIN index serves both ILIKE '%term%' and the %> word-similarity
+    # search on title/description; built CONCURRENTLY outside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_search_trgm', 'tasks', ['title', 'description'],
+            postgresql_using='gin',
+            postgresql_ops={
+                'title': 'gin_trgm_ops',
+                'description': 'gin_trgm_ops',
+            },
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_search_trgm', table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    # pg_trgm is left installed; other objects may depend on it
@@ -2,13 +2,15 @@
 Slack 웹훅 API 엔드포인트
 """
 from fastapi import APIRouter, Request, HTTPException, Header
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from typing import Optional
-import json
-from datetime import datetime
+import logging
+import orjson
 from services.slack_webhook import SlackWebhookService
 
-router = APIRouter(prefix="/api/slack", tags=["slack"])
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/slack", tags=["slack"], default_response_class=ORJSONResponse)
 
 # 전역 Slack 웹훅 서비스 인스턴스 (main.py에서 설정)
 slack_webhook_service: Optional[SlackWebhookService] = None
@@ -29,37 +31,32 @@ async def slack_webhook(
     """Slack 웹훅 엔드포인트"""
     # 요청 본문 읽기
     body = await request.body()
-    body_str = body.decode('utf-8')
     
-    # 모든 요청 로그 출력 (디버깅)
-    print(f"\n{'='*60}")
-    print(f"[SlackWebhook] New request received at {datetime.now().isoformat()}")
-    print(f"[SlackWebhook] Method: {request.method}")
-    print(f"[SlackWebhook] URL: {request.url}")
-    print(f"[SlackWebhook] Headers: {dict(request.headers)}")
-    print(f"[SlackWebhook] Body length: {len(body_str)}")
-    print(f"[SlackWebhook] Body: {body_str[:1000]}")  # 처음 1000자 출력
-    print(f"{'='*60}\n")
+    logger.info("[SlackWebhook] %s %s (%d bytes)", request.method, request.url, len(body))
+    # 요청 전체 로그 (디버깅)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[SlackWebhook] Headers: %s", dict(request.headers))
+        logger.debug("[SlackWebhook] Body: %s", body[:1000].decode("utf-8", "replace"))  # 처음 1000바이트
     
     # 이벤트 파싱
     try:
-        event_data = json.loads(body_str)
-    except json.JSONDecodeError as e:
-        print(f"[SlackWebhook] JSON decode error: {e}")
+        event_data = orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        logger.warning("[SlackWebhook] JSON decode error: %s", e)
         raise HTTPException(status_code=400, detail="Invalid JSON")
     
     # URL 검증 처리 (서명 검증 전에 먼저 처리)
     if event_data.get("type") == "url_verification":
         challenge = event_data.get("challenge")
         if challenge:
-            print(f"[SlackWebhook] URL verification challenge received: {challenge}")
-            return JSONResponse(content={"challenge": challenge})
+            logger.info("[SlackWebhook] URL verification challenge received")
+            return {"challenge": challenge}
         else:
             raise HTTPException(status_code=400, detail="Challenge parameter missing")
     
     # URL 검증이 아닌 경우에만 서비스 초기화 확인 및 서명 검증
     if not slack_webhook_service:
-        print(f"[SlackWebhook] ERROR: Slack webhook service not initialized")
+        logger.error("[SlackWebhook] Slack webhook service not initialized")
         raise HTTPException(status_code=500, detail="Slack webhook service not initialized")
     
     # 서명 검증 (URL 검증 후 실제 이벤트에서만)
@@ -67,43 +64,40 @@ async def slack_webhook(
     if x_slack_signature and x_slack_request_timestamp:
         is_valid = slack_webhook_service.verify_signature(
             x_slack_request_timestamp,
-            body_str,
+            body,
             x_slack_signature
         )
         if not is_valid:
-            print(f"[SlackWebhook] ERROR: Invalid signature")
-            print(f"[SlackWebhook] Expected signature: {x_slack_signature}")
+            logger.warning("[SlackWebhook] Invalid signature: %s", x_slack_signature)
             raise HTTPException(status_code=401, detail="Invalid signature")
-        print(f"[SlackWebhook] Signature verified successfully")
+        logger.debug("[SlackWebhook] Signature verified successfully")
     else:
-        print(f"[SlackWebhook] WARNING: No signature provided (development mode?)")
+        logger.warning("[SlackWebhook] No signature provided (development mode?)")
     
     # 이벤트 처리
     try:
-        # 디버깅: 받은 이벤트 로그 출력
-        print(f"[SlackWebhook] Received event: type={event_data.get('type')}")
-        print(f"[SlackWebhook] Event data: {json.dumps(event_data, indent=2, ensure_ascii=False)}")
+        logger.info("[SlackWebhook] Received event: type=%s", event_data.get("type"))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SlackWebhook] Event data: %s", orjson.dumps(event_data).decode())
         
         task = slack_webhook_service.process_event(event_data)
         
         if task:
-            print(f"[SlackWebhook] Task created: {task.title}")
-            return JSONResponse(content={
+            logger.info("[SlackWebhook] Task created: %s", task.title)
+            return {
                 "status": "success",
                 "task_id": task.id,
                 "message": "Task created successfully"
-            })
+            }
         else:
-            print(f"[SlackWebhook] Event processed but no task created")
-            return JSONResponse(content={
+            logger.info("[SlackWebhook] Event processed but no task created")
+            return {
                 "status": "success",
                 "message": "Event processed, no task created"
-            })
+            }
     except Exception as e:
-        print(f"[SlackWebhook] Error processing event: {e}")
-        import traceback
-        traceback.print_exc()
-        return JSONResponse(
+        logger.exception("[SlackWebhook] Error processing event: %s", e)
+        return ORJSONResponse(
             status_code=500,
             content={"status": "error", "message": str(e)}
         )
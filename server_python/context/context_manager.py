@@ -4,15 +4,43 @@ Implements sliding window, summarization, and context compression strategies.
 """
 
 import asyncio
+import functools
 import logging
-from typing import Any, Dict, List, Optional, Callable, Awaitable
+import os
+from collections import Counter, deque
+from itertools import chain, islice
+from typing import Any, Deque, Dict, Iterator, List, Optional, Callable, Awaitable
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 import tiktoken
 
 logger = logging.getLogger(__name__)
 
+# Texts longer than this are token-counted from a prefix sample
+_TOKEN_SAMPLE_CHARS = 2048
+
+
+@functools.lru_cache(maxsize=4)
+def _get_encoder(model: str) -> tiktoken.Encoding:
+    """Get a tokenizer for the model, shared across all ContextManagers."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _utcnow() -> datetime:
+    """Current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+def _scale_sample_tokens(sample_tokens: int, text_length: int) -> int:
+    """Extrapolate the token count of a prefix sample to the full text."""
+    if text_length <= _TOKEN_SAMPLE_CHARS:
+        return sample_tokens
+    return int(sample_tokens * text_length / _TOKEN_SAMPLE_CHARS)
+
 
 class MessageRole(str, Enum):
     """Message roles in conversation."""
@@ -22,13 +50,13 @@ class MessageRole(str, Enum):
     TOOL = "tool"
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A message in the conversation."""
     role: MessageRole
     content: str
     metadata: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=_utcnow)
     token_count: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
@@ -42,7 +70,7 @@ class Message:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextWindow:
     """Represents the current context window."""
     messages: List[Message]
@@ -118,21 +146,27 @@ class ContextManager:
         self.model = model
         self.preserve_recent_messages = preserve_recent_messages
 
-        self._messages: List[Message] = []
+        # System messages are always preserved; the rest are evicted oldest-first
+        self._system_messages: List[Message] = []
+        self._messages: Deque[Message] = deque()
         self._summary: Optional[str] = None
+        self._summary_tokens = 0
         self._summarized_count = 0
+        # Running token total of system and non-system messages
+        self._total_tokens = 0
+        # Running message count per role
+        self._role_counts: Counter[str] = Counter()
 
-        # Initialize tokenizer
-        try:
-            self._tokenizer = tiktoken.encoding_for_model("gpt-4")  # Use GPT-4 as proxy
-        except:
-            self._tokenizer = tiktoken.get_encoding("cl100k_base")
+        # Initialize tokenizer (shared; GPT-4 encoding used as proxy)
+        self._tokenizer = _get_encoder("gpt-4")
 
     def add_message(
         self,
         role: MessageRole,
         content: str,
         metadata: Optional[Dict[str, Any]] = None,
+        *,
+        exact_tokens: bool = False,
     ) -> Message:
         """
         Add a message to the context.
@@ -141,18 +175,50 @@ class ContextManager:
             role: Message role
             content: Message content
             metadata: Optional metadata
+            exact_tokens: Tokenize the full content instead of estimating long texts
 
         Returns:
             The created Message
         """
+        return self._append_message(
+            role, content, metadata,
+            self._count_tokens(content, exact=exact_tokens),
+        )
+
+    def add_messages(self, messages: List[Dict[str, Any]]) -> None:
+        """Add multiple messages from dict format."""
+        contents = [msg.get("content", "") for msg in messages]
+        token_counts = self._count_tokens_batch(contents)
+
+        for msg, content, token_count in zip(messages, contents, token_counts):
+            self._append_message(
+                MessageRole(msg.get("role", "user")),
+                content,
+                msg.get("metadata"),
+                token_count,
+            )
+
+    def _append_message(
+        self,
+        role: MessageRole,
+        content: str,
+        metadata: Optional[Dict[str, Any]],
+        token_count: int,
+    ) -> Message:
+        """Append a message whose token count is already known."""
         message = Message(
             role=role,
             content=content,
             metadata=metadata or {},
-            token_count=self._count_tokens(content),
+            token_count=token_count,
         )
 
-        self._messages.append(message)
+        if role == MessageRole.SYSTEM:
+            self._system_messages.append(message)
+        else:
+            self._messages.append(message)
+        self._total_tokens += token_count
+        self._role_counts[role.value] += 1
 
         logger.debug(
             f"Added {role.value} message ({message.token_count} tokens)"
@@ -160,15 +226,6 @@ class ContextManager:
 
         return message
 
-    def add_messages(self, messages: List[Dict[str, Any]]) -> None:
-        """Add multiple messages from dict format."""
-        for msg in messages:
-            self.add_message(
-                MessageRole(msg.get("role", "user")),
-                msg.get("content", ""),
-                msg.get("metadata"),
-            )
-
     def get_context_window(
         self,
         include_summary: bool = True,
@@ -182,26 +239,32 @@ class ContextManager:
         Returns:
             ContextWindow with messages
         """
-        messages = self._messages.copy()
-        total_tokens = sum(m.token_count for m in messages)
+        total_tokens = self._total_tokens
+        if include_summary and self._summary:
+            total_tokens += self._summary_tokens
+
+        return ContextWindow(
+            messages=list(self._iter_context_messages(include_summary)),
+            total_tokens=total_tokens,
+            max_tokens=self.max_tokens,
+            summarized_messages=self._summarized_count,
+        )
+
+    def _iter_context_messages(self, include_summary: bool) -> Iterator[Message]:
+        """Iterate over context messages without copying them."""
+        messages = chain(self._system_messages, self._messages)
 
         # Add summary if available and requested
         if include_summary and self._summary:
             summary_msg = Message(
                 role=MessageRole.SYSTEM,
                 content=f"[Context Summary]\n{self._summary}",
-                token_count=self._count_tokens(self._summary),
+                token_count=self._summary_tokens,
                 metadata={"is_summary": True},
             )
-            messages.insert(0, summary_msg)
-            total_tokens += summary_msg.token_count
+            return chain((summary_msg,), messages)
 
-        return ContextWindow(
-            messages=messages,
-            total_tokens=total_tokens,
-            max_tokens=self.max_tokens,
-            summarized_messages=self._summarized_count,
-        )
+        return messages
 
     def get_messages_for_llm(
         self,
@@ -216,10 +279,9 @@ class ContextManager:
         Returns:
             List of message dicts
         """
-        window = self.get_context_window(include_summary)
         return [
             {"role": msg.role.value, "content": msg.content}
-            for msg in window.messages
+            for msg in self._iter_context_messages(include_summary)
         ]
 
     async def maybe_summarize(self) -> bool:
@@ -232,10 +294,8 @@ class ContextManager:
         if not self.summarize_func:
             return False
 
-        window = self.get_context_window(include_summary=False)
-
         # Check if we should summarize
-        usage = window.total_tokens / window.max_tokens
+        usage = self._total_tokens / self.max_tokens
         if usage < self.summarize_threshold:
             return False
 
@@ -250,20 +310,26 @@ class ContextManager:
             return False
 
         # Summarize all but recent messages
-        messages_to_summarize = self._messages[:-self.preserve_recent_messages]
-        messages_to_keep = self._messages[-self.preserve_recent_messages:]
+        summarize_count = len(self._messages) - self.preserve_recent_messages
+        messages_to_summarize = list(islice(self._messages, summarize_count))
 
         # Generate summary
         summary = await self.summarize_func(messages_to_summarize)
 
-        # Update state
-        self._summary = summary
-        self._summarized_count += len(messages_to_summarize)
-        self._messages = messages_to_keep
+        # Update state (messages added while summarizing are kept). The deque
+        # may have been compressed or cleared during the await, so only pop
+        # summarized messages that are still at its head.
+        self._set_summary(summary)
+        summarized_ids = {id(message) for message in messages_to_summarize}
+        popped = 0
+        while self._messages and id(self._messages[0]) in summarized_ids:
+            self._pop_oldest_message()
+            popped += 1
+        self._summarized_count += popped
 
         logger.info(
-            f"Summarized {len(messages_to_summarize)} messages, "
-            f"keeping {len(messages_to_keep)} recent"
+            f"Summarized {popped} messages, "
+            f"keeping {len(self._messages)} recent"
         )
 
         return True
@@ -283,23 +349,16 @@ class ContextManager:
         """
         target = target_tokens or self.max_tokens
 
-        window = self.get_context_window(include_summary=False)
-        if window.total_tokens <= target:
+        if self._total_tokens <= target:
             return 0
 
         removed = 0
 
         # Remove oldest messages (except system messages) until under target
-        while window.total_tokens > target and len(self._messages) > self.preserve_recent_messages:
-            # Find oldest non-system message
-            for i, msg in enumerate(self._messages):
-                if msg.role != MessageRole.SYSTEM:
-                    self._messages.pop(i)
-                    self._summarized_count += 1
-                    removed += 1
-                    break
-
-            window = self.get_context_window(include_summary=False)
+        while self._total_tokens > target and len(self._messages) > self.preserve_recent_messages:
+            self._pop_oldest_message()
+            self._summarized_count += 1
+            removed += 1
 
         logger.info(f"Compressed context: removed {removed} messages")
         return removed
@@ -311,44 +370,80 @@ class ContextManager:
         Args:
             keep_summary: Whether to keep the summary
         """
+        self._system_messages.clear()
         self._messages.clear()
+        self._total_tokens = 0
+        self._role_counts.clear()
 
         if not keep_summary:
-            self._summary = None
+            self._set_summary(None)
             self._summarized_count = 0
 
         logger.info("Cleared context")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get context statistics."""
-        window = self.get_context_window(include_summary=True)
+        total_tokens = self._total_tokens + self._summary_tokens
 
-        role_counts = {}
-        for role in MessageRole:
-            role_counts[role.value] = sum(
-                1 for m in self._messages
-                if m.role == role
-            )
+        role_counts = {
+            role.value: self._role_counts[role.value]
+            for role in MessageRole
+        }
 
         return {
-            "total_messages": len(self._messages),
-            "total_tokens": window.total_tokens,
+            "total_messages": len(self._system_messages) + len(self._messages),
+            "total_tokens": total_tokens,
             "max_tokens": self.max_tokens,
-            "usage_percent": round((window.total_tokens / self.max_tokens) * 100, 2),
+            "usage_percent": round((total_tokens / self.max_tokens) * 100, 2),
             "summarized_messages": self._summarized_count,
             "has_summary": self._summary is not None,
             "role_distribution": role_counts,
         }
 
-    def _count_tokens(self, text: str) -> int:
-        """Count tokens in text."""
+    def _pop_oldest_message(self) -> Message:
+        """Remove the oldest non-system message and update running totals."""
+        message = self._messages.popleft()
+        self._total_tokens -= message.token_count
+        self._role_counts[message.role.value] -= 1
+        return message
+
+    def _set_summary(self, summary: Optional[str]) -> None:
+        """Set the summary and cache its token count."""
+        self._summary = summary
+        self._summary_tokens = self._count_tokens(summary) if summary else 0
+
+    def _count_tokens(self, text: str, exact: bool = False) -> int:
+        """
+        Count tokens in text.
+
+        Texts longer than _TOKEN_SAMPLE_CHARS are estimated from the token
+        density of their prefix unless exact is set.
+        """
         try:
-            return len(self._tokenizer.encode(text))
+            if exact or len(text) <= _TOKEN_SAMPLE_CHARS:
+                return len(self._tokenizer.encode_ordinary(text))
+            sample = self._tokenizer.encode_ordinary(text[:_TOKEN_SAMPLE_CHARS])
+            return _scale_sample_tokens(len(sample), len(text))
         except Exception as e:
             logger.warning(f"Failed to count tokens: {e}")
             # Rough estimate: ~4 chars per token
             return len(text) // 4
 
+    def _count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for many texts in one batched tokenizer call."""
+        try:
+            encoded = self._tokenizer.encode_ordinary_batch(
+                [text[:_TOKEN_SAMPLE_CHARS] for text in texts],
+                num_threads=os.cpu_count() or 1,
+            )
+            return [
+                _scale_sample_tokens(len(tokens), len(text))
+                for tokens, text in zip(encoded, texts)
+            ]
+        except Exception as e:
+            logger.warning(f"Failed to batch count tokens: {e}")
+            return [self._count_tokens(text) for text in texts]
+
     def export_history(self) -> List[Dict[str, Any]]:
         """Export full message history."""
         history = []
@@ -360,6 +455,8 @@ class ContextManager:
                 "is_summary": True,
             })
 
+        for msg in self._system_messages:
+            history.append(msg.to_dict())
         for msg in self._messages:
             history.append(msg.to_dict())
 
@@ -369,13 +466,11 @@ class ContextManager:
         """Import message history."""
         self.clear()
 
+        messages = []
         for msg_data in history:
             if msg_data.get("is_summary"):
-                self._summary = msg_data["content"]
+                self._set_summary(msg_data["content"])
                 continue
+            messages.append(msg_data)
 
-            self.add_message(
-                MessageRole(msg_data["role"]),
-                msg_data["content"],
-                msg_data.get("metadata"),
-            )
+        self.add_messages(messages)
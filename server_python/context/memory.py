@@ -5,15 +5,47 @@ Provides short-term and long-term memory with semantic search capabilities.
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Set
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-import json
 import hashlib
+import heapq
+import itertools
+import sys
+import time
 
 logger = logging.getLogger(__name__)
 
+# Memory timestamps are naive UTC; exports carry them as integer microseconds
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_epoch_us(value: datetime) -> int:
+    """Convert a naive UTC datetime to integer epoch microseconds."""
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _to_epoch_seconds(value: datetime) -> float:
+    """Convert a naive UTC datetime to epoch seconds."""
+    return (value - _EPOCH).total_seconds()
+
+
+def _from_epoch_us(value: Any) -> datetime:
+    """Convert epoch microseconds (or a legacy ISO string) to a naive UTC datetime."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _intern_tags(tags: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """Immutable tag set sharing one string object per distinct tag."""
+    if not tags:
+        return frozenset()
+    return frozenset(sys.intern(tag) for tag in tags)
+
 
 class MemoryType(str, Enum):
     """Types of memories."""
@@ -24,7 +56,7 @@ class MemoryType(str, Enum):
     SKILL = "skill"
 
 
-@dataclass
+@dataclass(slots=True)
 class Memory:
     """A single memory item."""
     id: str
@@ -32,12 +64,17 @@ class Memory:
     content: str
     importance: float = 0.5  # 0-1
     confidence: float = 1.0  # 0-1
-    tags: Set[str] = field(default_factory=set)
+    tags: FrozenSet[str] = field(default_factory=frozenset)
     metadata: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.utcnow)
     last_accessed: datetime = field(default_factory=datetime.utcnow)
     access_count: int = 0
     embedding: Optional[List[float]] = None  # For semantic search
+    # last_accessed as epoch seconds, so scoring is a float subtraction
+    last_accessed_ts: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.last_accessed_ts = _to_epoch_seconds(self.last_accessed)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -49,14 +86,15 @@ class Memory:
             "confidence": self.confidence,
             "tags": list(self.tags),
             "metadata": self.metadata,
-            "created_at": self.created_at.isoformat(),
-            "last_accessed": self.last_accessed.isoformat(),
+            "created_at": _to_epoch_us(self.created_at),
+            "last_accessed": _to_epoch_us(self.last_accessed),
             "access_count": self.access_count,
         }
 
-    def access(self) -> None:
+    def access(self, current_time: Optional[datetime] = None) -> None:
         """Record memory access."""
-        self.last_accessed = datetime.utcnow()
+        self.last_accessed = current_time or datetime.utcnow()
+        self.last_accessed_ts = _to_epoch_seconds(self.last_accessed)
         self.access_count += 1
 
     def get_relevance_score(
@@ -65,6 +103,7 @@ class Memory:
         recency_weight: float = 0.3,
         importance_weight: float = 0.4,
         access_weight: float = 0.3,
+        now_ts: Optional[float] = None,
     ) -> float:
         """
         Calculate relevance score for this memory.
@@ -74,14 +113,16 @@ class Memory:
             recency_weight: Weight for recency factor
             importance_weight: Weight for importance
             access_weight: Weight for access frequency
+            now_ts: Current time as epoch seconds (takes precedence over current_time)
 
         Returns:
             Relevance score (0-1)
         """
-        current_time = current_time or datetime.utcnow()
+        if now_ts is None:
+            now_ts = _to_epoch_seconds(current_time) if current_time else time.time()
 
         # Recency score (exponential decay)
-        time_delta = (current_time - self.last_accessed).total_seconds()
+        time_delta = now_ts - self.last_accessed_ts
         recency_score = 1.0 / (1.0 + time_delta / 86400)  # Decay over days
 
         # Importance score
@@ -100,6 +141,130 @@ class Memory:
         return relevance
 
 
+class _MemoryStore:
+    """Memories keyed by ID in LRU order, indexed by type and tag for filtered recall."""
+
+    def __init__(self) -> None:
+        self._memories: OrderedDict[str, Memory] = OrderedDict()
+        self._by_type: Dict[MemoryType, Set[str]] = {t: set() for t in MemoryType}
+        self._by_tag: Dict[str, Set[str]] = {}
+        # LRU position per ID (bumped on add/touch), to order index matches
+        self._seq: Dict[str, int] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._memories)
+
+    def __contains__(self, memory_id: object) -> bool:
+        return memory_id in self._memories
+
+    def get(self, memory_id: str) -> Optional[Memory]:
+        """Get a memory by ID."""
+        return self._memories.get(memory_id)
+
+    def values(self) -> Iterable[Memory]:
+        """All memories, least recently used first."""
+        return self._memories.values()
+
+    def touch(self, memory_id: str) -> None:
+        """Mark a memory as most recently used."""
+        if memory_id in self._memories:
+            self._memories.move_to_end(memory_id)
+            self._seq[memory_id] = next(self._counter)
+
+    def evict_oldest(self) -> Optional[Memory]:
+        """Remove the least recently used memory."""
+        if not self._memories:
+            return None
+        return self.remove(next(iter(self._memories)))
+
+    def count_by_type(self, memory_type: MemoryType) -> int:
+        """Number of memories of the given type."""
+        return len(self._by_type[memory_type])
+
+    def add(self, memory: Memory) -> None:
+        """Add or replace a memory."""
+        self.remove(memory.id)
+        self._memories[memory.id] = memory
+        self._seq[memory.id] = next(self._counter)
+        self._by_type[memory.type].add(memory.id)
+        for tag in memory.tags:
+            self._by_tag.setdefault(tag, set()).add(memory.id)
+
+    def add_many(self, memories: Iterable[Memory]) -> None:
+        """Add or replace several memories, merging the tag index once at the end."""
+        tag_ids: Dict[str, Set[str]] = defaultdict(set)
+        for memory in memories:
+            replaced = self.remove(memory.id)
+            if replaced is not None:
+                # Drop tags of an earlier entry with the same ID in this batch
+                for tag in replaced.tags:
+                    pending = tag_ids.get(tag)
+                    if pending is not None:
+                        pending.discard(memory.id)
+            self._memories[memory.id] = memory
+            self._seq[memory.id] = next(self._counter)
+            self._by_type[memory.type].add(memory.id)
+            for tag in memory.tags:
+                tag_ids[tag].add(memory.id)
+
+        for tag, ids in tag_ids.items():
+            if ids:
+                self._by_tag.setdefault(tag, set()).update(ids)
+
+    def remove(self, memory_id: str) -> Optional[Memory]:
+        """Remove a memory by ID."""
+        memory = self._memories.pop(memory_id, None)
+        if memory is None:
+            return None
+
+        del self._seq[memory_id]
+        self._by_type[memory.type].discard(memory_id)
+        for tag in memory.tags:
+            tagged = self._by_tag.get(tag)
+            if tagged is not None:
+                tagged.discard(memory_id)
+                if not tagged:
+                    del self._by_tag[tag]
+        return memory
+
+    def clear(self) -> None:
+        """Remove all memories."""
+        self._memories.clear()
+        self._seq.clear()
+        for ids in self._by_type.values():
+            ids.clear()
+        self._by_tag.clear()
+
+    def select(
+        self,
+        memory_type: Optional[MemoryType] = None,
+        tags: Optional[Set[str]] = None,
+        ordered: bool = True,
+    ) -> Iterable[Memory]:
+        """
+        Memories of the given type having any of the given tags.
+
+        Only the index matches are visited. With ordered=True they are
+        returned in store (LRU) order, otherwise in arbitrary order.
+        """
+        if not memory_type and not tags:
+            return self._memories.values()
+
+        ids: Optional[Set[str]] = None
+        if memory_type:
+            ids = self._by_type[memory_type]
+        if tags:
+            tagged = set().union(*(self._by_tag.get(tag, ()) for tag in tags))
+            ids = tagged if ids is None else ids & tagged
+
+        if not ids:
+            return []
+        if ordered:
+            ids = sorted(ids, key=self._seq.__getitem__)
+        return [self._memories[memory_id] for memory_id in ids]
+
+
 class MemorySystem:
     """
     Memory system for agents.
@@ -153,8 +318,14 @@ class MemorySystem:
         self.consolidation_threshold = consolidation_threshold
         self.decay_threshold_days = decay_threshold_days
 
-        self._short_term: Dict[str, Memory] = {}
-        self._long_term: Dict[str, Memory] = {}
+        self._short_term = _MemoryStore()
+        self._long_term = _MemoryStore()
+
+        # Single background worker consolidates on demand; the lock keeps
+        # consolidation and pruning from interleaving
+        self._lock = asyncio.Lock()
+        self._consolidate_event = asyncio.Event()
+        self._consolidation_worker: Optional[asyncio.Task] = None
 
     def add_memory(
         self,
@@ -181,33 +352,100 @@ class MemorySystem:
         Returns:
             The created Memory
         """
-        # Generate ID from content
-        memory_id = hashlib.md5(content.encode()).hexdigest()[:16]
-
-        memory = Memory(
-            id=memory_id,
-            type=memory_type,
-            content=content,
-            importance=importance,
-            confidence=confidence,
-            tags=tags or set(),
-            metadata=metadata or {},
+        memory = self._build_memory(
+            memory_type, content, importance, confidence, tags, metadata
         )
+        memory_id = memory.id
 
         # Add to appropriate store
         if to_long_term:
-            self._long_term[memory_id] = memory
+            self._long_term.add(memory)
             logger.debug(f"Added long-term {memory_type.value} memory")
         else:
-            self._short_term[memory_id] = memory
+            # Bound short-term memory between consolidations (LRU eviction)
+            if memory_id not in self._short_term and len(self._short_term) >= self.max_short_term:
+                evicted = self._short_term.evict_oldest()
+                if evicted:
+                    logger.debug(f"Evicted short-term memory {evicted.id} (capacity reached)")
+            self._short_term.add(memory)
             logger.debug(f"Added short-term {memory_type.value} memory")
 
         # Auto-consolidate if threshold reached
         if len(self._short_term) >= self.consolidation_threshold:
-            asyncio.create_task(self.consolidate())
+            self._request_consolidation()
 
         return memory
 
+    def add_memories(
+        self,
+        records: Iterable[Mapping[str, Any]],
+        to_long_term: bool = False,
+    ) -> List[Memory]:
+        """
+        Add several memories in one pass.
+
+        Equivalent to calling add_memory() for each record, but the tag index
+        is merged once, short-term eviction runs once and at most one
+        consolidation is requested for the whole batch.
+
+        As with add_memory(), short-term memory keeps only the max_short_term
+        most recently added entries: a batch larger than that evicts its own
+        earliest entries too, so some of the returned Memories may already be
+        gone from short-term memory.
+
+        Args:
+            records: add_memory() keyword arguments per memory
+                (memory_type and content required)
+            to_long_term: Add directly to long-term memory
+
+        Returns:
+            The created Memories, in input order
+        """
+        memories = [self._build_memory(**record) for record in records]
+        if not memories:
+            return memories
+
+        if to_long_term:
+            self._long_term.add_many(memories)
+        else:
+            self._short_term.add_many(memories)
+            # Bound short-term memory between consolidations (LRU eviction)
+            while len(self._short_term) > self.max_short_term:
+                evicted = self._short_term.evict_oldest()
+                logger.debug(f"Evicted short-term memory {evicted.id} (capacity reached)")
+
+        logger.debug(
+            f"Added {len(memories)} {'long' if to_long_term else 'short'}-term memories"
+        )
+
+        # Auto-consolidate if threshold reached
+        if len(self._short_term) >= self.consolidation_threshold:
+            self._request_consolidation()
+
+        return memories
+
+    @staticmethod
+    def _build_memory(
+        memory_type: MemoryType,
+        content: str,
+        importance: float = 0.5,
+        confidence: float = 1.0,
+        tags: Optional[Set[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Memory:
+        """Create a Memory whose ID is derived from its content."""
+        memory_id = hashlib.sha256(content.encode(), usedforsecurity=False).digest()[:8].hex()
+
+        return Memory(
+            id=memory_id,
+            type=memory_type,
+            content=content,
+            importance=importance,
+            confidence=confidence,
+            tags=_intern_tags(tags),
+            metadata=metadata or {},
+        )
+
     def recall(
         self,
         query: Optional[str] = None,
@@ -218,6 +456,8 @@ class MemorySystem:
         limit: int = 10,
         include_short_term: bool = True,
         include_long_term: bool = True,
+        sort_by_relevance: bool = True,
+        track_access: bool = True,
     ) -> List[Memory]:
         """
         Recall memories matching criteria.
@@ -231,25 +471,25 @@ class MemorySystem:
             limit: Maximum memories to return
             include_short_term: Include short-term memories
             include_long_term: Include long-term memories
+            sort_by_relevance: Rank by relevance (otherwise store order, no scoring)
+            track_access: Record an access on each returned memory and mark it
+                most recently used (False leaves memories and LRU order untouched)
 
         Returns:
-            List of matching memories, sorted by relevance
+            List of matching memories (sorted by relevance if requested)
         """
         # Collect memories from stores
-        memories = []
+        memories: List[Memory] = []
 
+        # Filter by type and tags (any match) via the store indexes
         if include_short_term:
-            memories.extend(self._short_term.values())
+            memories.extend(
+                self._short_term.select(memory_type, tags, ordered=not sort_by_relevance)
+            )
         if include_long_term:
-            memories.extend(self._long_term.values())
-
-        # Filter by type
-        if memory_type:
-            memories = [m for m in memories if m.type == memory_type]
-
-        # Filter by tags
-        if tags:
-            memories = [m for m in memories if tags & m.tags]
+            memories.extend(
+                self._long_term.select(memory_type, tags, ordered=not sort_by_relevance)
+            )
 
         # Filter by importance and confidence
         memories = [
@@ -257,18 +497,25 @@ class MemorySystem:
             if m.importance >= min_importance and m.confidence >= min_confidence
         ]
 
-        # Score by relevance
-        for memory in memories:
-            memory.access()  # Record access
+        # One timestamp for the whole scoring/access pass
+        now = datetime.utcnow()
 
-        # Sort by relevance
-        memories.sort(
-            key=lambda m: m.get_relevance_score(),
-            reverse=True
-        )
+        if sort_by_relevance:
+            # Select the top memories by relevance (partial sort)
+            now_ts = _to_epoch_seconds(now)
+            memories = heapq.nlargest(
+                limit,
+                memories,
+                key=lambda m: m.get_relevance_score(now_ts=now_ts),
+            )
+        else:
+            memories = memories[:limit]
 
-        # Limit results
-        memories = memories[:limit]
+        if track_access:
+            for memory in memories:
+                memory.access(now)  # Record access
+                # Recalled short-term memories become most recently used
+                self._short_term.touch(memory.id)
 
         logger.debug(f"Recalled {len(memories)} memories")
 
@@ -283,7 +530,11 @@ class MemorySystem:
         if from_long_term:
             return self._long_term.get(memory_id)
         else:
-            return self._short_term.get(memory_id) or self._long_term.get(memory_id)
+            memory = self._short_term.get(memory_id)
+            if memory:
+                self._short_term.touch(memory_id)
+                return memory
+            return self._long_term.get(memory_id)
 
     async def consolidate(self) -> int:
         """
@@ -294,44 +545,42 @@ class MemorySystem:
         Returns:
             Number of memories consolidated
         """
-        if not self._short_term:
-            return 0
-
-        logger.info("Consolidating short-term memories to long-term")
-
-        # Score memories by importance and recency
-        scored = []
-        for memory in self._short_term.values():
-            score = memory.get_relevance_score()
-            scored.append((score, memory))
-
-        scored.sort(reverse=True)
+        async with self._lock:
+            if not self._short_term:
+                return 0
 
-        # Move top memories to long-term
-        consolidated = 0
-        for score, memory in scored:
-            # Only consolidate important memories
-            if memory.importance < 0.5:
-                continue
+            logger.info("Consolidating short-term memories to long-term")
 
-            # Move to long-term
-            self._long_term[memory.id] = memory
-            consolidated += 1
+            # Only consolidate important memories, up to the free long-term
+            # capacity (at least one so pruning can make room)
+            candidates = [
+                memory for memory in self._short_term.values()
+                if memory.importance >= 0.5
+            ]
+            capacity = max(self.max_long_term - len(self._long_term), 1)
+
+            # Select the top memories by relevance (partial sort)
+            now_ts = time.time()
+            top_memories = heapq.nlargest(
+                capacity,
+                candidates,
+                key=lambda m: m.get_relevance_score(now_ts=now_ts),
+            )
 
-            # Stop if long-term is full
-            if len(self._long_term) >= self.max_long_term:
-                break
+            # Move top memories to long-term
+            for memory in top_memories:
+                self._long_term.add(memory)
+            consolidated = len(top_memories)
 
-        # Clear short-term
-        self._short_term.clear()
+            # Clear short-term
+            self._short_term.clear()
 
-        logger.info(f"Consolidated {consolidated} memories to long-term")
+            logger.info(f"Consolidated {consolidated} memories to long-term")
 
-        # Prune old long-term memories if needed
-        if len(self._long_term) > self.max_long_term:
-            await self.prune_old_memories()
+            # Prune old long-term memories if needed
+            self._prune_old_memories()
 
-        return consolidated
+            return consolidated
 
     async def prune_old_memories(self) -> int:
         """
@@ -340,6 +589,11 @@ class MemorySystem:
         Returns:
             Number of memories pruned
         """
+        async with self._lock:
+            return self._prune_old_memories()
+
+    def _prune_old_memories(self) -> int:
+        """Prune long-term memories; caller must hold the lock."""
         if len(self._long_term) <= self.max_long_term:
             return 0
 
@@ -349,34 +603,62 @@ class MemorySystem:
 
         # Find memories to prune
         to_prune = []
-        for memory_id, memory in self._long_term.items():
+        for memory in self._long_term.values():
             # Prune if old and not important
             if (memory.last_accessed < cutoff_date and
                 memory.importance < 0.6):
-                to_prune.append(memory_id)
+                to_prune.append(memory.id)
 
         # Remove pruned memories
         for memory_id in to_prune:
-            del self._long_term[memory_id]
+            self._long_term.remove(memory_id)
 
         logger.info(f"Pruned {len(to_prune)} old memories")
 
         return len(to_prune)
 
+    def _request_consolidation(self) -> None:
+        """Wake the background consolidation worker, starting it if needed."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No running loop (sync caller): consolidate() must be awaited explicitly
+            return
+
+        if self._consolidation_worker is None or self._consolidation_worker.done():
+            self._consolidation_worker = asyncio.create_task(self._consolidation_loop())
+        self._consolidate_event.set()
+
+    async def _consolidation_loop(self) -> None:
+        """Run consolidate() whenever a consolidation is requested."""
+        while True:
+            await self._consolidate_event.wait()
+            self._consolidate_event.clear()
+            try:
+                await self.consolidate()
+            except Exception as e:
+                logger.error(f"Background consolidation failed: {e}")
+
+    async def close(self) -> None:
+        """Stop the background consolidation worker."""
+        if self._consolidation_worker is None:
+            return
+
+        self._consolidation_worker.cancel()
+        try:
+            await self._consolidation_worker
+        except asyncio.CancelledError:
+            pass
+        self._consolidation_worker = None
+
     def get_stats(self) -> Dict[str, Any]:
         """Get memory system statistics."""
         # Count by type
         type_counts = {}
         for memory_type in MemoryType:
             type_counts[memory_type.value] = {
-                "short_term": sum(
-                    1 for m in self._short_term.values()
-                    if m.type == memory_type
-                ),
-                "long_term": sum(
-                    1 for m in self._long_term.values()
-                    if m.type == memory_type
-                ),
+                "short_term": self._short_term.count_by_type(memory_type),
+                "long_term": self._long_term.count_by_type(memory_type),
             }
 
         return {
@@ -425,13 +707,13 @@ class MemorySystem:
                 content=mem_data["content"],
                 importance=mem_data.get("importance", 0.5),
                 confidence=mem_data.get("confidence", 1.0),
-                tags=set(mem_data.get("tags", [])),
+                tags=_intern_tags(mem_data.get("tags")),
                 metadata=mem_data.get("metadata", {}),
-                created_at=datetime.fromisoformat(mem_data["created_at"]),
-                last_accessed=datetime.fromisoformat(mem_data["last_accessed"]),
+                created_at=_from_epoch_us(mem_data["created_at"]),
+                last_accessed=_from_epoch_us(mem_data["last_accessed"]),
                 access_count=mem_data.get("access_count", 0),
             )
-            self._short_term[memory.id] = memory
+            self._short_term.add(memory)
 
         # Import long-term
         for mem_data in data.get("long_term", []):
@@ -441,13 +723,13 @@ class MemorySystem:
                 content=mem_data["content"],
                 importance=mem_data.get("importance", 0.5),
                 confidence=mem_data.get("confidence", 1.0),
-                tags=set(mem_data.get("tags", [])),
+                tags=_intern_tags(mem_data.get("tags")),
                 metadata=mem_data.get("metadata", {}),
-                created_at=datetime.fromisoformat(mem_data["created_at"]),
-                last_accessed=datetime.fromisoformat(mem_data["last_accessed"]),
+                created_at=_from_epoch_us(mem_data["created_at"]),
+                last_accessed=_from_epoch_us(mem_data["last_accessed"]),
                 access_count=mem_data.get("access_count", 0),
             )
-            self._long_term[memory.id] = memory
+            self._long_term.add(memory)
 
         logger.info(
             f"Imported {len(self._short_term)} short-term and "
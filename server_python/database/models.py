@@ -13,10 +13,11 @@ from sqlalchemy import (
     Integer,
     DateTime,
     ForeignKey,
-    JSON,
     ARRAY,
+    Index,
+    func,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -33,6 +34,9 @@ class Base(DeclarativeBase):
 class TaskModel(Base):
     """Task ORM model."""
     __tablename__ = "tasks"
+    # Fetch server-generated created_at/updated_at via RETURNING on flush,
+    # so reading them later never triggers a lazy load (MissingGreenlet)
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -53,17 +57,17 @@ class TaskModel(Base):
     auto_assign: Mapped[bool] = mapped_column(Boolean, default=False)
     due_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     tags: Mapped[List[str]] = mapped_column(ARRAY(String), default=list)
-    metadata_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    graph_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    metadata_json: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    graph_data: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
     completed_at: Mapped[Optional[datetime]] = mapped_column(
@@ -72,16 +76,11 @@ class TaskModel(Base):
     )
 
     # Relationships
+    # Loaded only on request, e.g. selectinload() in get_with_filters()
     assigned_agent: Mapped[Optional["AgentModel"]] = relationship(
         "AgentModel",
         back_populates="assigned_tasks"
     )
-    audit_logs: Mapped[List["AuditLogModel"]] = relationship(
-        "AuditLogModel",
-        back_populates="task",
-        foreign_keys="AuditLogModel.entity_id",
-        primaryjoin="and_(TaskModel.id==AuditLogModel.entity_id, AuditLogModel.entity_type=='task')"
-    )
 
     def __repr__(self) -> str:
         return f"<Task(id={self.id}, title='{self.title}', status='{self.status}')>"
@@ -90,6 +89,7 @@ class TaskModel(Base):
 class AgentModel(Base):
     """Agent ORM model."""
     __tablename__ = "agents"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -105,16 +105,16 @@ class AgentModel(Base):
     system_prompt: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     constraints: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String), default=list)
     allowed_mcps: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String), default=list)
-    config: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    config: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
 
@@ -139,6 +139,7 @@ class AgentModel(Base):
 class TicketModel(Base):
     """Ticket ORM model."""
     __tablename__ = "tickets"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -154,16 +155,16 @@ class TicketModel(Base):
     content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     status: Mapped[str] = mapped_column(String(50), nullable=False, default="pending")
     priority: Mapped[int] = mapped_column(Integer, default=0)
-    options: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    options: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
 
@@ -185,6 +186,7 @@ class TicketModel(Base):
 class ApprovalModel(Base):
     """Approval request ORM model."""
     __tablename__ = "approvals"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -204,11 +206,11 @@ class ApprovalModel(Base):
     type: Mapped[str] = mapped_column(String(50), nullable=False)
     message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     status: Mapped[str] = mapped_column(String(50), nullable=False, default="pending")
-    options: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    response: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    options: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    response: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
     responded_at: Mapped[Optional[datetime]] = mapped_column(
@@ -233,6 +235,11 @@ class ApprovalModel(Base):
 class AuditLogModel(Base):
     """Audit log ORM model for tracking changes."""
     __tablename__ = "audit_logs"
+    # Entity lookups (AuditRepository.get_by_entity) are index seeks
+    __table_args__ = (
+        Index("ix_audit_logs_entity", "entity_type", "entity_id"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -242,23 +249,14 @@ class AuditLogModel(Base):
     entity_type: Mapped[str] = mapped_column(String(50), nullable=False)
     entity_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     action: Mapped[str] = mapped_column(String(50), nullable=False)
-    old_value: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    new_value: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    old_value: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    new_value: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     performed_by: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
 
-    # Optional relationships for convenience
-    task: Mapped[Optional["TaskModel"]] = relationship(
-        "TaskModel",
-        back_populates="audit_logs",
-        foreign_keys=[entity_id],
-        primaryjoin="and_(AuditLogModel.entity_id==TaskModel.id, AuditLogModel.entity_type=='task')",
-        viewonly=True
-    )
-
     def __repr__(self) -> str:
         return f"<AuditLog(id={self.id}, entity_type='{self.entity_type}', action='{self.action}')>"
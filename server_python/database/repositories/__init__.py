@@ -6,10 +6,13 @@ from .base import BaseRepository
 from .task_repository import TaskRepository
 from .agent_repository import AgentRepository
 from .audit_repository import AuditRepository
+from .dto import AgentSummary, TaskSummary
 
 __all__ = [
     "BaseRepository",
     "TaskRepository",
     "AgentRepository",
     "AuditRepository",
+    "AgentSummary",
+    "TaskSummary",
 ]
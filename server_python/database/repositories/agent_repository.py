@@ -5,12 +5,26 @@ Agent repository for database operations.
 import uuid
 from typing import Optional, List
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from .base import BaseRepository
+from .dto import AgentSummary
 from ..models import AgentModel
 
+# Agent statuses counted as active by get_active_agents
+ACTIVE_AGENT_STATUSES = ("running", "registered", "waiting")
+
+# Built once; the status list is bound per call (expanding IN parameter)
+_ACTIVE_AGENTS_STMT = (
+    select(AgentModel)
+    .options(raiseload("*"))
+    .where(AgentModel.status.in_(bindparam("statuses", expanding=True)))
+    .order_by(AgentModel.name)
+)
+
 
 class AgentRepository(BaseRepository[AgentModel]):
     """Repository for Agent operations."""
@@ -21,7 +35,7 @@ class AgentRepository(BaseRepository[AgentModel]):
     async def get_by_type(self, agent_type: str) -> List[AgentModel]:
         """Get all agents of a specific type."""
         result = await self.session.execute(
-            select(AgentModel)
+            self._base_query()
             .where(AgentModel.type == agent_type)
             .order_by(AgentModel.name)
         )
@@ -30,23 +44,30 @@ class AgentRepository(BaseRepository[AgentModel]):
     async def get_by_name(self, name: str) -> Optional[AgentModel]:
         """Get an agent by name."""
         result = await self.session.execute(
-            select(AgentModel).where(AgentModel.name == name)
+            self._base_query().where(AgentModel.name == name)
         )
         return result.scalar_one_or_none()
 
     async def get_active_agents(self) -> List[AgentModel]:
         """Get all active agents."""
         result = await self.session.execute(
-            select(AgentModel)
-            .where(AgentModel.status.in_(["running", "registered", "waiting"]))
-            .order_by(AgentModel.name)
+            _ACTIVE_AGENTS_STMT, {"statuses": ACTIVE_AGENT_STATUSES}
         )
         return list(result.scalars().all())
 
+    async def get_active_agent_summaries(self) -> List[AgentSummary]:
+        """Get active agents as read-only AgentSummary rows (no ORM objects)."""
+        return await self._fetch_dtos(
+            self._select_dto(AgentSummary)
+            .where(AgentModel.status.in_(ACTIVE_AGENT_STATUSES))
+            .order_by(AgentModel.name),
+            AgentSummary,
+        )
+
     async def get_custom_agents(self) -> List[AgentModel]:
         """Get all custom agents."""
         result = await self.session.execute(
-            select(AgentModel)
+            self._base_query()
             .where(AgentModel.is_custom == True)
             .order_by(AgentModel.created_at.desc())
         )
@@ -55,7 +76,7 @@ class AgentRepository(BaseRepository[AgentModel]):
     async def get_system_agents(self) -> List[AgentModel]:
         """Get all system (non-custom) agents."""
         result = await self.session.execute(
-            select(AgentModel)
+            self._base_query()
             .where(AgentModel.is_custom == False)
             .order_by(AgentModel.name)
         )
@@ -81,13 +102,17 @@ class AgentRepository(BaseRepository[AgentModel]):
         **kwargs
     ) -> AgentModel:
         """Get an existing agent or create a new one."""
-        existing = await self.get_by_id(agent_id)
-        if existing:
-            return existing
-
-        return await self.create(
-            id=agent_id,
-            name=name,
-            type=agent_type,
-            **kwargs
+        # Single INSERT ... ON CONFLICT DO NOTHING RETURNING; no race between
+        # the existence check and the insert
+        result = await self.session.execute(
+            pg_insert(AgentModel)
+            .values(id=agent_id, name=name, type=agent_type, **kwargs)
+            .on_conflict_do_nothing(index_elements=[AgentModel.id])
+            .returning(AgentModel)
         )
+        created = result.scalar_one_or_none()
+        if created is not None:
+            return created
+
+        # Conflict: the agent already exists
+        return await self.get_by_id(agent_id)
@@ -3,13 +3,14 @@ Audit log repository for tracking changes.
 """
 
 import uuid
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Sequence, Union
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .base import BaseRepository
+from .base import BaseRepository, Cursor
 from ..models import AuditLogModel
 
 
@@ -38,6 +39,19 @@ class AuditRepository(BaseRepository[AuditLogModel]):
             performed_by=performed_by,
         )
 
+    async def log_actions_bulk(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Log many actions with a single batched INSERT.
+
+        Each row takes the same keys as log_action(). Rows are not
+        returned or refreshed.
+        """
+        if not rows:
+            return 0
+
+        await self.session.execute(insert(AuditLogModel), rows)
+        return len(rows)
+
     async def get_by_entity(
         self,
         entity_type: str,
@@ -46,7 +60,7 @@ class AuditRepository(BaseRepository[AuditLogModel]):
     ) -> List[AuditLogModel]:
         """Get audit logs for a specific entity."""
         result = await self.session.execute(
-            select(AuditLogModel)
+            self._base_query()
             .where(AuditLogModel.entity_type == entity_type)
             .where(AuditLogModel.entity_id == entity_id)
             .order_by(AuditLogModel.created_at.desc())
@@ -54,22 +68,55 @@ class AuditRepository(BaseRepository[AuditLogModel]):
         )
         return list(result.scalars().all())
 
+    async def list_for_task(
+        self,
+        task_id: uuid.UUID,
+        limit: int = 50,
+    ) -> List[AuditLogModel]:
+        """Get audit logs for a task, newest first."""
+        return await self.get_by_entity("task", task_id, limit=limit)
+
     async def get_by_entity_type(
         self,
         entity_type: str,
         limit: int = 100,
         offset: int = 0,
-    ) -> List[AuditLogModel]:
-        """Get audit logs for a specific entity type."""
-        result = await self.session.execute(
-            select(AuditLogModel)
+        cursor: Optional[Cursor] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Union[List[AuditLogModel], List[Row]]:
+        """
+        Get audit logs for a specific entity type (keyset paged by cursor).
+
+        Pass columns (e.g. ("action", "performed_by", "created_at")) to
+        select only those columns and get rows (named tuples) instead of
+        models, skipping the old_value/new_value JSON. Include "created_at"
+        and "id" to build next_cursor() from the result.
+        """
+        if columns:
+            query = select(*self._columns(columns))
+        else:
+            query = self._base_query()
+        query = (
+            query
             .where(AuditLogModel.entity_type == entity_type)
-            .order_by(AuditLogModel.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+            .order_by(*self._created_at_order())
         )
+        result = await self.session.execute(
+            self._paginate(query, limit, offset, cursor)
+        )
+        if columns:
+            return list(result.all())
         return list(result.scalars().all())
 
+    @staticmethod
+    def _columns(names: Sequence[str]) -> List[Any]:
+        """Map column names to AuditLogModel column attributes."""
+        table_columns = AuditLogModel.__table__.columns
+        unknown = [name for name in names if name not in table_columns]
+        if unknown:
+            raise ValueError(f"Unknown audit log columns: {', '.join(unknown)}")
+        return [getattr(AuditLogModel, name) for name in names]
+
     async def get_by_action(
         self,
         action: str,
@@ -77,7 +124,7 @@ class AuditRepository(BaseRepository[AuditLogModel]):
     ) -> List[AuditLogModel]:
         """Get audit logs for a specific action."""
         result = await self.session.execute(
-            select(AuditLogModel)
+            self._base_query()
             .where(AuditLogModel.action == action)
             .order_by(AuditLogModel.created_at.desc())
             .limit(limit)
@@ -90,7 +137,7 @@ class AuditRepository(BaseRepository[AuditLogModel]):
         since: Optional[datetime] = None,
     ) -> List[AuditLogModel]:
         """Get recent audit logs."""
-        query = select(AuditLogModel)
+        query = self._base_query()
         if since:
             query = query.where(AuditLogModel.created_at >= since)
         query = query.order_by(AuditLogModel.created_at.desc()).limit(limit)
@@ -144,6 +191,7 @@ class AuditRepository(BaseRepository[AuditLogModel]):
             performed_by=performed_by,
         )
 
+
     async def log_agent_status_change(
         self,
         agent_id: uuid.UUID,
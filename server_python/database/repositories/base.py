@@ -3,16 +3,28 @@ Base repository class with common CRUD operations.
 """
 
 import uuid
-from typing import TypeVar, Generic, Optional, List, Type, Any
+from contextlib import asynccontextmanager
+from dataclasses import fields
+from typing import (
+    TypeVar, Generic, Optional, List, Sequence, Tuple, Type, Any, AsyncIterator,
+)
 from datetime import datetime
 
-from sqlalchemy import select, update, delete, func
+from sqlalchemy import Select, select, update, delete, func, exists, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, raiseload
+from sqlalchemy.orm.interfaces import ORMOption
 
 from ..models import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
+DTOType = TypeVar("DTOType")
+
+# Keyset pagination cursor: (created_at, id) of the last row of a page
+Cursor = Tuple[datetime, uuid.UUID]
+
+# session.info key: nesting depth of unit_of_work() blocks on the session
+_UOW_DEPTH = "repository_unit_of_work_depth"
 
 
 class BaseRepository(Generic[ModelType]):
@@ -22,18 +34,113 @@ class BaseRepository(Generic[ModelType]):
         self.session = session
         self.model = model
 
+    def _base_query(self, *options: ORMOption) -> Select:
+        """
+        SELECT for the model with lazy loading disabled.
+
+        Touching an unloaded relationship raises instead of silently issuing
+        one query per row; pass selectinload()/joinedload() options to load
+        relationships eagerly.
+        """
+        return select(self.model).options(raiseload("*"), *options)
+
+    def _select_dto(self, dto: type) -> Select:
+        """
+        SELECT only the model columns named by the dataclass dto's fields.
+
+        Pair with _fetch_dtos() for read-only lists that are serialized
+        straight away; rows never become ORM instances.
+        """
+        return select(*[getattr(self.model, f.name) for f in fields(dto)])
+
+    async def _fetch_dtos(self, query: Select, dto: Type[DTOType]) -> List[DTOType]:
+        """Execute a _select_dto() query and build one dto per row."""
+        result = await self.session.execute(query)
+        return [dto(**row) for row in result.mappings()]
+
+    def _paginate(
+        self,
+        query: Select,
+        limit: int,
+        offset: int = 0,
+        cursor: Optional[Cursor] = None,
+        descending: bool = True,
+    ) -> Select:
+        """
+        Apply LIMIT with keyset pagination when a cursor is given, else OFFSET.
+
+        Keyset pagination expects the query to be ordered by (created_at, id)
+        and only reads rows past the cursor instead of skipping offset rows.
+        """
+        if cursor is not None:
+            key = tuple_(self.model.created_at, self.model.id)
+            query = query.where(key < cursor if descending else key > cursor)
+        elif offset:
+            query = query.offset(offset)
+        return query.limit(limit)
+
+    def _created_at_order(self, descending: bool = True) -> tuple:
+        """ORDER BY (created_at, id), the keyset pagination order."""
+        if descending:
+            return (self.model.created_at.desc(), self.model.id.desc())
+        return (self.model.created_at.asc(), self.model.id.asc())
+
+    @staticmethod
+    def next_cursor(rows: Sequence[Any]) -> Optional[Cursor]:
+        """Cursor for the page after rows (None when rows is empty)."""
+        if not rows:
+            return None
+        return (rows[-1].created_at, rows[-1].id)
+
+    async def flush(self) -> None:
+        """Write pending changes without committing."""
+        await self.session.flush()
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator["BaseRepository[ModelType]"]:
+        """
+        Group several writes behind a single flush.
+
+        Inside the block create() only adds instances to the session; they
+        are flushed once on exit (not on error). Repositories sharing this
+        session join the same unit, e.g.::
+
+            async with task_repo.unit_of_work():
+                task = await task_repo.create(title="a")
+                await audit_repo.log_action("task", task.id, "created")
+
+        Rows created in the unit are not visible to queries (get_by_id(),
+        update(), ...) until it exits. The commit itself is left to the
+        session scope (Database.session()).
+        """
+        info = self.session.info
+        info[_UOW_DEPTH] = info.get(_UOW_DEPTH, 0) + 1
+        try:
+            yield self
+        finally:
+            info[_UOW_DEPTH] -= 1
+        if not info[_UOW_DEPTH]:
+            await self.session.flush()
+
     async def create(self, **kwargs: Any) -> ModelType:
-        """Create a new record."""
+        """
+        Create a new record.
+
+        The primary key is generated client-side, so the instance's id is
+        usable even while the flush is deferred by unit_of_work(); outside
+        a unit the row is flushed immediately.
+        """
+        kwargs.setdefault("id", uuid.uuid4())
         instance = self.model(**kwargs)
         self.session.add(instance)
-        await self.session.flush()
-        await self.session.refresh(instance)
+        if not self.session.info.get(_UOW_DEPTH):
+            await self.session.flush()
         return instance
 
     async def get_by_id(self, id: uuid.UUID) -> Optional[ModelType]:
         """Get a record by ID."""
         result = await self.session.execute(
-            select(self.model).where(self.model.id == id)
+            self._base_query().where(self.model.id == id)
         )
         return result.scalar_one_or_none()
 
@@ -43,47 +150,59 @@ class BaseRepository(Generic[ModelType]):
         offset: int = 0,
         order_by: Optional[str] = None,
         descending: bool = True,
+        cursor: Optional[Cursor] = None,
     ) -> List[ModelType]:
-        """Get all records with pagination."""
-        query = select(self.model)
+        """
+        Get all records with pagination.
+
+        Pass cursor=next_cursor(previous_page) to page by (created_at, id)
+        instead of offset.
+        """
+        query = self._base_query()
 
         # Apply ordering
-        if order_by and hasattr(self.model, order_by):
+        if order_by and order_by != "created_at" and hasattr(self.model, order_by):
+            if cursor is not None:
+                raise ValueError("Cursor pagination requires created_at ordering")
             order_column = getattr(self.model, order_by)
             query = query.order_by(
                 order_column.desc() if descending else order_column.asc()
             )
         elif hasattr(self.model, "created_at"):
-            query = query.order_by(
-                self.model.created_at.desc() if descending else self.model.created_at.asc()
-            )
+            query = query.order_by(*self._created_at_order(descending))
 
-        query = query.limit(limit).offset(offset)
+        query = self._paginate(query, limit, offset, cursor, descending)
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
     async def update(self, id: uuid.UUID, **kwargs: Any) -> Optional[ModelType]:
-        """Update a record by ID."""
-        # Remove None values if not explicitly updating to None
-        updates = {k: v for k, v in kwargs.items() if v is not None or k in kwargs}
+        """Update a record by ID. None values are ignored."""
+        updates = {k: v for k, v in kwargs.items() if v is not None}
+        if not updates:
+            # Nothing to write: skip the UPDATE (and the updated_at bump)
+            return await self.get_by_id(id)
 
         if hasattr(self.model, "updated_at"):
-            updates["updated_at"] = datetime.utcnow()
+            # Stamped by PostgreSQL (transaction time), not the app clock
+            updates["updated_at"] = func.now()
 
-        await self.session.execute(
+        # UPDATE ... RETURNING: one round trip instead of UPDATE + SELECT;
+        # raiseload keeps relationships from adding a second query
+        result = await self.session.execute(
             update(self.model)
             .where(self.model.id == id)
             .values(**updates)
+            .returning(self.model)
+            .options(raiseload("*"))
+            .execution_options(synchronize_session="fetch")
         )
-        await self.session.flush()
-        return await self.get_by_id(id)
+        return result.scalar_one_or_none()
 
     async def delete(self, id: uuid.UUID) -> bool:
         """Delete a record by ID."""
         result = await self.session.execute(
             delete(self.model).where(self.model.id == id)
         )
-        await self.session.flush()
         return result.rowcount > 0
 
     async def count(self) -> int:
@@ -95,9 +214,8 @@ class BaseRepository(Generic[ModelType]):
 
     async def exists(self, id: uuid.UUID) -> bool:
         """Check if a record exists."""
+        # SELECT EXISTS (...) stops at the first matching row
         result = await self.session.execute(
-            select(func.count())
-            .select_from(self.model)
-            .where(self.model.id == id)
+            select(exists().where(self.model.id == id))
         )
-        return (result.scalar() or 0) > 0
+        return bool(result.scalar())
@@ -0,0 +1,34 @@
+"""
+Lightweight read models for list queries.
+
+Read-only list methods whose results go straight to JSON select just these
+columns into plain dataclasses, skipping ORM instance construction,
+identity-map insertion and change tracking. Field names must match the
+model's column attributes (see BaseRepository._select_dto).
+"""
+
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(slots=True)
+class AgentSummary:
+    """Agent fields shown in agent lists."""
+    id: uuid.UUID
+    name: str
+    type: str
+    status: str
+    thinking_mode: Optional[str]
+
+
+@dataclass(slots=True)
+class TaskSummary:
+    """Task fields shown in task lists."""
+    id: uuid.UUID
+    title: str
+    status: str
+    priority: str
+    assigned_agent_id: Optional[uuid.UUID]
+    created_at: datetime
@@ -3,15 +3,72 @@ Task repository for database operations.
 """
 
 import uuid
-from typing import Optional, List
-from datetime import datetime
+from typing import Optional, List, Sequence, AsyncIterator
 
-from sqlalchemy import select, or_
+from sqlalchemy import select, or_, func, bindparam
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
 
-from .base import BaseRepository
+from .base import BaseRepository, Cursor
+from .dto import TaskSummary
 from ..models import TaskModel
 
+# Task statuses reported by count_by_status
+TASK_STATUSES = ("pending", "in_progress", "completed", "cancelled", "failed")
+
+# Terminal statuses excluded by get_unassigned_tasks
+FINISHED_TASK_STATUSES = ("completed", "cancelled", "failed")
+
+# Built once; the status list is bound per call (expanding NOT IN parameter)
+_UNASSIGNED_TASKS_STMT = (
+    select(TaskModel)
+    .options(raiseload("*"))
+    .where(TaskModel.assigned_agent_id.is_(None))
+    .where(TaskModel.status.notin_(bindparam("statuses", expanding=True)))
+    .order_by(TaskModel.created_at.desc())
+)
+
+# Trigrams need at least this many characters; shorter terms use ILIKE
+TRGM_MIN_SEARCH_LENGTH = 3
+
+
+def _optional_filter(
+    name: str,
+    column: ColumnElement,
+    predicate=None,
+) -> ColumnElement:
+    """
+    Build ``(:name IS NULL OR predicate)`` for a filter that may be omitted.
+
+    Binding NULL disables the filter, so every combination of filters runs
+    the same SQL text and reuses one compiled/prepared statement.
+    """
+    param = bindparam(name, type_=column.type)
+    condition = predicate(param) if predicate is not None else column == param
+    return or_(param.is_(None), condition)
+
+
+# Filters applied by get_with_filters; each is switched off by binding NULL
+_TASK_FILTERS = (
+    _optional_filter("status", TaskModel.status),
+    _optional_filter("priority", TaskModel.priority),
+    _optional_filter("source", TaskModel.source),
+    _optional_filter("assigned_agent_id", TaskModel.assigned_agent_id),
+    _optional_filter(
+        "search_pattern",
+        TaskModel.title,
+        lambda pattern: or_(
+            TaskModel.title.ilike(pattern),
+            TaskModel.description.ilike(pattern),
+        ),
+    ),
+    # Match any of the provided tags (array overlap; the column is the
+    # generic ARRAY type, which has no .overlap() comparator)
+    _optional_filter("tags", TaskModel.tags, TaskModel.tags.op("&&")),
+)
+
 
 class TaskRepository(BaseRepository[TaskModel]):
     """Repository for Task operations."""
@@ -31,51 +88,91 @@ class TaskRepository(BaseRepository[TaskModel]):
         offset: int = 0,
         order_by: str = "created_at",
         descending: bool = True,
+        cursor: Optional[Cursor] = None,
+        load: Sequence[ORMOption] = (selectinload(TaskModel.assigned_agent),),
+        use_trgm: bool = False,
     ) -> List[TaskModel]:
-        """Get tasks with multiple filters."""
-        query = select(TaskModel)
-
-        # Apply filters
-        if status:
-            query = query.where(TaskModel.status == status)
-        if priority:
-            query = query.where(TaskModel.priority == priority)
-        if source:
-            query = query.where(TaskModel.source == source)
-        if assigned_agent_id:
-            query = query.where(TaskModel.assigned_agent_id == assigned_agent_id)
-        if search:
-            search_pattern = f"%{search}%"
+        """
+        Get tasks with multiple filters.
+
+        The assigned agent is loaded with one extra SELECT ... IN query;
+        pass load=() to skip it or other loader options to replace it.
+        Pass cursor=next_cursor(previous_page) to page by (created_at, id)
+        instead of offset.
+
+        search matches title/description with ILIKE '%search%', served by
+        the ix_tasks_search_trgm index. With use_trgm=True it instead does
+        a pg_trgm word-similarity search (typo tolerant) ranked by
+        similarity; terms shorter than TRGM_MIN_SEARCH_LENGTH fall back
+        to ILIKE.
+        """
+        trgm_search = bool(
+            use_trgm and search and len(search) >= TRGM_MIN_SEARCH_LENGTH
+        )
+
+        query = self._base_query(*load).where(*_TASK_FILTERS)
+        params = {
+            "status": status or None,
+            "priority": priority or None,
+            "source": source or None,
+            "assigned_agent_id": assigned_agent_id or None,
+            "search_pattern": f"%{search}%" if search and not trgm_search else None,
+            "tags": tags or None,
+        }
+
+        if trgm_search:
+            if cursor is not None:
+                raise ValueError("Cursor pagination is not supported with use_trgm")
             query = query.where(
                 or_(
-                    TaskModel.title.ilike(search_pattern),
-                    TaskModel.description.ilike(search_pattern),
+                    TaskModel.title.op("%>")(search),
+                    TaskModel.description.op("%>")(search),
                 )
+            ).order_by(
+                func.greatest(
+                    func.word_similarity(search, TaskModel.title),
+                    func.word_similarity(search, TaskModel.description),
+                ).desc()
             )
-        if tags:
-            # Match any of the provided tags
-            query = query.where(TaskModel.tags.overlap(tags))
 
         # Apply ordering
-        if hasattr(TaskModel, order_by):
+        if order_by == "created_at":
+            query = query.order_by(*self._created_at_order(descending))
+        elif hasattr(TaskModel, order_by):
+            if cursor is not None:
+                raise ValueError("Cursor pagination requires created_at ordering")
             order_column = getattr(TaskModel, order_by)
             query = query.order_by(
                 order_column.desc() if descending else order_column.asc()
             )
 
-        query = query.limit(limit).offset(offset)
-        result = await self.session.execute(query)
+        query = self._paginate(query, limit, offset, cursor, descending)
+        result = await self.session.execute(query, params)
         return list(result.scalars().all())
 
     async def get_by_status(self, status: str) -> List[TaskModel]:
         """Get all tasks with a specific status."""
         result = await self.session.execute(
-            select(TaskModel)
+            self._base_query()
             .where(TaskModel.status == status)
             .order_by(TaskModel.created_at.desc())
         )
         return list(result.scalars().all())
 
+    async def get_summaries_by_status(
+        self,
+        status: str,
+        limit: int = 100,
+    ) -> List[TaskSummary]:
+        """Get tasks with a status as read-only TaskSummary rows (no ORM objects)."""
+        return await self._fetch_dtos(
+            self._select_dto(TaskSummary)
+            .where(TaskModel.status == status)
+            .order_by(*self._created_at_order())
+            .limit(limit),
+            TaskSummary,
+        )
+
     async def get_pending_tasks(self) -> List[TaskModel]:
         """Get all pending tasks."""
         return await self.get_by_status("pending")
@@ -87,22 +184,39 @@ class TaskRepository(BaseRepository[TaskModel]):
     async def get_unassigned_tasks(self) -> List[TaskModel]:
         """Get tasks without an assigned agent."""
         result = await self.session.execute(
-            select(TaskModel)
-            .where(TaskModel.assigned_agent_id.is_(None))
-            .where(TaskModel.status.notin_(["completed", "cancelled", "failed"]))
-            .order_by(TaskModel.created_at.desc())
+            _UNASSIGNED_TASKS_STMT, {"statuses": FINISHED_TASK_STATUSES}
         )
         return list(result.scalars().all())
 
     async def get_tasks_by_agent(self, agent_id: uuid.UUID) -> List[TaskModel]:
-        """Get all tasks assigned to a specific agent."""
+        """Get all tasks assigned to a specific agent (see iter_by_agent)."""
         result = await self.session.execute(
-            select(TaskModel)
+            self._base_query()
             .where(TaskModel.assigned_agent_id == agent_id)
             .order_by(TaskModel.created_at.desc())
         )
         return list(result.scalars().all())
 
+    async def iter_by_agent(
+        self,
+        agent_id: uuid.UUID,
+        batch_size: int = 100,
+    ) -> AsyncIterator[TaskModel]:
+        """
+        Stream tasks assigned to an agent, newest first.
+
+        Rows are fetched from a server-side cursor batch_size at a time,
+        so memory stays bounded no matter how many tasks the agent has.
+        """
+        result = await self.session.stream(
+            self._base_query()
+            .where(TaskModel.assigned_agent_id == agent_id)
+            .order_by(TaskModel.created_at.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for task in result.scalars():
+            yield task
+
     async def assign_agent(
         self,
         task_id: uuid.UUID,
@@ -120,7 +234,7 @@ class TaskRepository(BaseRepository[TaskModel]):
         return await self.update(
             task_id,
             status="completed",
-            completed_at=datetime.utcnow(),
+            completed_at=func.now(),
         )
 
     async def cancel_task(self, task_id: uuid.UUID) -> Optional[TaskModel]:
@@ -132,14 +246,16 @@ class TaskRepository(BaseRepository[TaskModel]):
         return await self.update(task_id, status="failed")
 
     async def count_by_status(self) -> dict:
-        """Get task counts grouped by status."""
-        from sqlalchemy import func
-
+        """Get task counts for every known status (zero if none)."""
+        # One row of COUNT(*) FILTER (WHERE status = ...) columns; the SQL
+        # text is the same no matter which statuses are present
         result = await self.session.execute(
-            select(TaskModel.status, func.count(TaskModel.id))
-            .group_by(TaskModel.status)
+            select(*[
+                func.count().filter(TaskModel.status == status).label(status)
+                for status in TASK_STATUSES
+            ]).select_from(TaskModel)
         )
-        return dict(result.all())
+        return dict(result.mappings().one())
 
     async def delete_completed_tasks(self) -> int:
         """Delete all completed tasks."""
@@ -148,5 +264,4 @@ class TaskRepository(BaseRepository[TaskModel]):
         result = await self.session.execute(
             delete(TaskModel).where(TaskModel.status == "completed")
         )
-        await self.session.flush()
         return result.rowcount
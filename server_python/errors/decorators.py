@@ -5,12 +5,13 @@ Decorators - 에러 핸들링 데코레이터
 """
 
 import functools
-import traceback
+import logging
 from typing import Callable, Optional, TypeVar, Any
 
 from .exceptions import AgentMonitorError
 from .error_response import ErrorResponse
 
+logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
@@ -40,14 +41,13 @@ def handle_errors(
                 return func(*args, **kwargs)
             except AgentMonitorError as e:
                 if log_errors:
-                    print(f"[{func.__name__}] Error: {e.code} - {e.message}")
+                    logger.error("[%s] Error: %s - %s", func.__name__, e.code, e.message)
                 if reraise:
                     raise
                 return default_return
             except Exception as e:
                 if log_errors:
-                    print(f"[{func.__name__}] Unexpected error: {e}")
-                    traceback.print_exc()
+                    logger.exception("[%s] Unexpected error: %s", func.__name__, e)
                 if reraise:
                     raise
                 return default_return
@@ -84,7 +84,7 @@ def async_handle_errors(
                 return await func(*args, **kwargs)
             except AgentMonitorError as e:
                 if log_errors:
-                    print(f"[{func.__name__}] Error: {e.code} - {e.message}")
+                    logger.error("[%s] Error: %s - %s", func.__name__, e.code, e.message)
 
                 if broadcast_error and ws_server_getter:
                     try:
@@ -104,8 +104,7 @@ def async_handle_errors(
 
             except Exception as e:
                 if log_errors:
-                    print(f"[{func.__name__}] Unexpected error: {e}")
-                    traceback.print_exc()
+                    logger.exception("[%s] Unexpected error: %s", func.__name__, e)
 
                 if broadcast_error and ws_server_getter:
                     try:
@@ -164,10 +163,12 @@ class ErrorHandler:
 
             if self.log_errors:
                 if isinstance(exc_val, AgentMonitorError):
-                    print(f"[ErrorHandler] {exc_val.code}: {exc_val.message}")
+                    logger.error("[ErrorHandler] %s: %s", exc_val.code, exc_val.message)
                 else:
-                    print(f"[ErrorHandler] Unexpected error: {exc_val}")
-                    traceback.print_exc()
+                    logger.error(
+                        "[ErrorHandler] Unexpected error: %s", exc_val,
+                        exc_info=(exc_type, exc_val, exc_tb)
+                    )
 
             if self.broadcast_errors and self.ws_server:
                 self.ws_server.broadcast_notification(
@@ -11,6 +11,11 @@ from typing import Optional, Dict, Any
 from uuid import uuid4
 
 
+def _new_trace_id() -> str:
+    """새 추적 ID (하이픈 없는 32자 hex)"""
+    return uuid4().hex
+
+
 class ErrorType(str, Enum):
     """에러 유형"""
     NETWORK = "network"
@@ -36,29 +41,33 @@ class ErrorResponse:
     error_type: ErrorType = ErrorType.SYSTEM
     severity: ErrorSeverity = ErrorSeverity.ERROR
     details: Optional[Dict[str, Any]] = None
-    trace_id: str = field(default_factory=lambda: str(uuid4()))
+    trace_id: str = field(default_factory=_new_trace_id)
     timestamp: datetime = field(default_factory=datetime.now)
 
+    def _inner(self) -> dict:
+        """에러 본문 딕셔너리 (to_dict/to_websocket_message 공용, 현재 필드 값 기준)"""
+        return {
+            "code": self.error_code,
+            "type": self.error_type.value,
+            "severity": self.severity.value,
+            "message": self.message,
+            "details": self.details,
+            "traceId": self.trace_id,
+            "timestamp": self.timestamp.isoformat()
+        }
+
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
         return {
             "success": False,
-            "error": {
-                "code": self.error_code,
-                "type": self.error_type.value,
-                "severity": self.severity.value,
-                "message": self.message,
-                "details": self.details,
-                "traceId": self.trace_id,
-                "timestamp": self.timestamp.isoformat()
-            }
+            "error": self._inner()
         }
 
     def to_websocket_message(self) -> dict:
         """WebSocket 메시지 형식으로 변환"""
         return {
             "type": "error",
-            "payload": self.to_dict()["error"]
+            "payload": self._inner()
         }
 
     @classmethod
@@ -71,7 +80,7 @@ class ErrorResponse:
                 error_code=exception.code,
                 message=exception.message,
                 details=exception.details,
-                trace_id=trace_id or str(uuid4())
+                trace_id=trace_id or _new_trace_id()
             )
 
         # 일반 예외
@@ -80,7 +89,7 @@ class ErrorResponse:
             message=str(exception),
             error_type=ErrorType.SYSTEM,
             severity=ErrorSeverity.ERROR,
-            trace_id=trace_id or str(uuid4())
+            trace_id=trace_id or _new_trace_id()
         )
 
     @classmethod
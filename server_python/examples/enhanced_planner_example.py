@@ -6,94 +6,129 @@ Enhanced Planner Agent 사용 예시
 """
 
 import asyncio
+import itertools
 import json
+import traceback
 from typing import Dict, List, Any
 
+# 예시에서 공유하는 Agent 목록 (호출마다 새로 만들지 않는 불변 튜플)
+# Task Decomposition 시 json.dumps로 직렬화되므로 항목은 일반 dict로 둠
+_DEFAULT_AGENTS = (
+    {"id": "general-agent", "name": "General Agent", "type": "custom"},
+)
+
+# Mock LLM 응답 (호출마다 다시 만들지 않도록 모듈 로드 시 한 번만 생성)
+_ANALYSIS_RESPONSE = """단계별 분석:
+1. 사용자는 프로젝트 구조 파악을 원함
+2. 파일 시스템 탐색 필요
+3. 결과를 정리하여 보고"""
+
+_PLAN_JSON_RESPONSE = json.dumps({
+    "analysis": "태스크를 3단계로 분해했습니다",
+    "steps": [
+        {
+            "agent_id": "general-agent",
+            "agent_name": "General Agent",
+            "role": "worker",
+            "description": "프로젝트 디렉토리 스캔"
+        },
+        {
+            "agent_id": "general-agent",
+            "agent_name": "General Agent",
+            "role": "worker",
+            "description": "파일 구조 분석"
+        },
+        {
+            "agent_id": "qa-agent-system",
+            "agent_name": "Q&A Agent",
+            "role": "q_and_a",
+            "description": "결과 사용자에게 전달"
+        }
+    ]
+})
+
+
 # Mock LLM function (실제로는 Claude API 사용)
 async def mock_llm_call(messages: List[Dict[str, str]], **kwargs) -> str:
     """Mock LLM call for demonstration"""
     print(f"[MockLLM] Called with {len(messages)} messages")
 
     # 간단한 응답 생성
-    last_message = messages[-1]["content"] if messages else ""
+    last_message = messages[-1]["content"].lower() if messages else ""
 
-    if "분석" in last_message or "analysis" in last_message.lower():
-        return """단계별 분석:
-1. 사용자는 프로젝트 구조 파악을 원함
-2. 파일 시스템 탐색 필요
-3. 결과를 정리하여 보고"""
+    if "분석" in last_message or "analysis" in last_message:
+        return _ANALYSIS_RESPONSE
 
-    elif "JSON" in last_message or "json" in last_message:
-        return json.dumps({
-            "analysis": "태스크를 3단계로 분해했습니다",
-            "steps": [
-                {
-                    "agent_id": "general-agent",
-                    "agent_name": "General Agent",
-                    "role": "worker",
-                    "description": "프로젝트 디렉토리 스캔"
-                },
-                {
-                    "agent_id": "general-agent",
-                    "agent_name": "General Agent",
-                    "role": "worker",
-                    "description": "파일 구조 분석"
-                },
-                {
-                    "agent_id": "qa-agent-system",
-                    "agent_name": "Q&A Agent",
-                    "role": "q_and_a",
-                    "description": "결과 사용자에게 전달"
-                }
-            ]
-        })
+    elif "json" in last_message:
+        return _PLAN_JSON_RESPONSE
 
     else:
         return "처리 완료"
 
 
+_DECOMPOSITION_RESPONSE = json.dumps({
+    "rationale": "웹 스크래퍼는 3단계로 분해됩니다",
+    "subtasks": [
+        {
+            "name": "HTML 페칭",
+            "description": "웹 페이지 HTML을 가져옴",
+            "dependencies": [],
+            "estimated_complexity": 3,
+            "task_type": "tool_call"
+        },
+        {
+            "name": "파싱",
+            "description": "HTML을 파싱하여 데이터 추출",
+            "dependencies": ["HTML 페칭"],
+            "estimated_complexity": 5,
+            "task_type": "generic"
+        },
+        {
+            "name": "저장",
+            "description": "추출된 데이터를 파일에 저장",
+            "dependencies": ["파싱"],
+            "estimated_complexity": 2,
+            "task_type": "tool_call"
+        }
+    ]
+})
+
+
+async def mock_decompose_generate(prompt: str, history=None) -> str:
+    """Mock LLM generate for TaskDecomposer"""
+    return _DECOMPOSITION_RESPONSE
+
+
 async def example_1_basic_planning():
     """예시 1: 기본 Planning"""
     print("\n" + "="*60)
     print("예시 1: 기본 Enhanced Planning")
     print("="*60 + "\n")
 
-    # Mock LLM function 패치
     import sys
     sys.path.insert(0, '/Users/1113804/Desktop/Code/24.AgentMoniter/agent-monitor_v2/server_python')
 
     from agents import enhanced_planner_agent, EnhancedPlannerContext
 
-    # Mock LLM 함수 주입
-    from models import orchestration
-    original_call_llm = orchestration.call_llm
-    orchestration.call_llm = mock_llm_call
-
-    try:
-        context = EnhancedPlannerContext(
-            task_id="demo-1",
-            user_request="프로젝트의 Python 파일들을 찾아서 구조를 분석해줘",
-            available_agents=[
-                {"id": "general-agent", "name": "General Agent", "type": "custom"}
-            ],
-            use_task_decomposition=False,  # 간단한 planning만
-            use_reasoning=True,
-            enable_critique=False,  # 빠른 데모를 위해 비활성화
-        )
+    context = EnhancedPlannerContext(
+        task_id="demo-1",
+        user_request="프로젝트의 Python 파일들을 찾아서 구조를 분석해줘",
+        available_agents=_DEFAULT_AGENTS,
+        use_task_decomposition=False,  # 간단한 planning만
+        use_reasoning=True,
+        enable_critique=False,  # 빠른 데모를 위해 비활성화
+        llm_call=mock_llm_call,  # Mock LLM 함수 주입
+    )
 
-        result = await enhanced_planner_agent.run(context)
+    result = await enhanced_planner_agent.run(context)
 
-        print(f"✓ Planning 성공: {result.success}")
-        print(f"✓ 분석: {result.analysis[:200]}...")
-        print(f"✓ 단계 수: {len(result.steps)}")
-        print(f"✓ 확신도: {result.confidence:.2%}")
+    print(f"✓ Planning 성공: {result.success}")
+    print(f"✓ 분석: {result.analysis[:200]}...")
+    print(f"✓ 단계 수: {len(result.steps)}")
+    print(f"✓ 확신도: {result.confidence:.2%}")
 
-        for i, step in enumerate(result.steps):
-            print(f"  {i+1}. {step.get('agent_name', 'Unknown')}: {step.get('description', '')}")
-
-    finally:
-        # Restore
-        orchestration.call_llm = original_call_llm
+    for i, step in enumerate(result.steps):
+        print(f"  {i+1}. {step.get('agent_name', 'Unknown')}: {step.get('description', '')}")
 
 
 async def example_2_tool_system():
@@ -113,10 +148,8 @@ async def example_2_tool_system():
     print(f"✓ 등록된 도구 수: {len(registry.get_names())}")
     print(f"✓ 도구 목록:")
 
-    for tool_name in registry.get_names()[:10]:
-        tool = registry.get(tool_name)
-        if tool:
-            print(f"  - {tool.name}: {tool.description[:60]}...")
+    for _, tool in itertools.islice(registry.get_all_items(), 10):
+        print(f"  - {tool.name}: {tool.description[:60]}...")
 
     # Tool executor
     executor = ToolExecutor(registry)
@@ -150,28 +183,28 @@ async def example_3_memory_system():
 
     memory = MemorySystem()
 
-    # 메모리 추가
+    # 메모리 추가 (한 번에 일괄 추가)
     print("✓ 메모리 추가:")
-    memory.add_memory(
-        MemoryType.FACT,
-        "사용자는 Python 프로젝트 분석을 요청함",
-        importance=0.8,
-        tags={"user_request", "python"}
-    )
-
-    memory.add_memory(
-        MemoryType.PATTERN,
-        "파일 검색 시 glob 도구가 효율적임",
-        importance=0.9,
-        tags={"tool_usage", "pattern"}
-    )
-
-    memory.add_memory(
-        MemoryType.PREFERENCE,
-        "사용자는 상세한 분석을 선호함",
-        importance=0.7,
-        tags={"user_preference"}
-    )
+    memory.add_memories([
+        {
+            "memory_type": MemoryType.FACT,
+            "content": "사용자는 Python 프로젝트 분석을 요청함",
+            "importance": 0.8,
+            "tags": {"user_request", "python"},
+        },
+        {
+            "memory_type": MemoryType.PATTERN,
+            "content": "파일 검색 시 glob 도구가 효율적임",
+            "importance": 0.9,
+            "tags": {"tool_usage", "pattern"},
+        },
+        {
+            "memory_type": MemoryType.PREFERENCE,
+            "content": "사용자는 상세한 분석을 선호함",
+            "importance": 0.7,
+            "tags": {"user_preference"},
+        },
+    ])
 
     stats = memory.get_stats()
     print(f"  - Short-term: {stats['short_term_count']}")
@@ -188,6 +221,8 @@ async def example_3_memory_system():
         print(f"  - [{mem.type.value}] {mem.content}")
         print(f"    Importance: {mem.importance}, Accessed: {mem.access_count} times")
 
+    await memory.close()
+
 
 async def example_4_context_manager():
     """예시 4: Context Manager"""
@@ -240,32 +275,7 @@ async def example_5_task_decomposition():
 
     # Mock LLM 주입
     decomposer = TaskDecomposer(
-        llm_generate=lambda p, h=None: asyncio.create_task(asyncio.sleep(0, result=json.dumps({
-            "rationale": "웹 스크래퍼는 3단계로 분해됩니다",
-            "subtasks": [
-                {
-                    "name": "HTML 페칭",
-                    "description": "웹 페이지 HTML을 가져옴",
-                    "dependencies": [],
-                    "estimated_complexity": 3,
-                    "task_type": "tool_call"
-                },
-                {
-                    "name": "파싱",
-                    "description": "HTML을 파싱하여 데이터 추출",
-                    "dependencies": ["HTML 페칭"],
-                    "estimated_complexity": 5,
-                    "task_type": "generic"
-                },
-                {
-                    "name": "저장",
-                    "description": "추출된 데이터를 파일에 저장",
-                    "dependencies": ["파싱"],
-                    "estimated_complexity": 2,
-                    "task_type": "tool_call"
-                }
-            ]
-        }))),
+        llm_generate=mock_decompose_generate,
         max_subtasks=10
     )
 
@@ -297,47 +307,37 @@ async def example_6_complete_workflow():
 
     from agents import enhanced_planner_agent, EnhancedPlannerContext
 
-    # Mock LLM 주입
-    from models import orchestration
-    original_call_llm = orchestration.call_llm
-    orchestration.call_llm = mock_llm_call
-
-    try:
-        print("✓ Step 1: Planning")
-        context = EnhancedPlannerContext(
-            task_id="demo-complete",
-            user_request="프로젝트의 모든 TODO 코멘트를 찾아서 정리해줘",
-            available_agents=[
-                {"id": "general-agent", "name": "General Agent", "type": "custom"}
-            ],
-            use_task_decomposition=False,
-            use_reasoning=True,
-            enable_critique=False,
-        )
-
-        result = await enhanced_planner_agent.run(context)
-        print(f"  - 성공: {result.success}")
-        print(f"  - 단계: {len(result.steps)}")
+    print("✓ Step 1: Planning")
+    context = EnhancedPlannerContext(
+        task_id="demo-complete",
+        user_request="프로젝트의 모든 TODO 코멘트를 찾아서 정리해줘",
+        available_agents=_DEFAULT_AGENTS,
+        use_task_decomposition=False,
+        use_reasoning=True,
+        enable_critique=False,
+        llm_call=mock_llm_call,  # Mock LLM 함수 주입
+    )
 
-        print(f"\n✓ Step 2: 통계 확인")
-        stats = enhanced_planner_agent.get_stats()
-        print(f"  - Tools: {stats['tools']['total_tools']}")
-        print(f"  - Context tokens: {stats['context']['total_tokens']}")
-        print(f"  - Memories: {stats['memory']['total_memories']}")
+    result = await enhanced_planner_agent.run(context)
+    print(f"  - 성공: {result.success}")
+    print(f"  - 단계: {len(result.steps)}")
 
-        print(f"\n✓ Step 3: Memory 확인")
-        memories = enhanced_planner_agent.memory.recall(
-            tags={"planning"},
-            limit=3
-        )
-        print(f"  - Planning 관련 메모리: {len(memories)}")
-        for mem in memories:
-            print(f"    - {mem.content[:60]}...")
+    print(f"\n✓ Step 2: 통계 확인")
+    stats = enhanced_planner_agent.get_stats()
+    print(f"  - Tools: {stats['tools']['total_tools']}")
+    print(f"  - Context tokens: {stats['context']['total_tokens']}")
+    print(f"  - Memories: {stats['memory']['total_memories']}")
 
-        print(f"\n✓ 완료!")
+    print(f"\n✓ Step 3: Memory 확인")
+    memories = enhanced_planner_agent.memory.recall(
+        tags={"planning"},
+        limit=3
+    )
+    print(f"  - Planning 관련 메모리: {len(memories)}")
+    for mem in memories:
+        print(f"    - {mem.content[:60]}...")
 
-    finally:
-        orchestration.call_llm = original_call_llm
+    print(f"\n✓ 완료!")
 
 
 async def main():
@@ -355,16 +355,21 @@ async def main():
         ("완전한 워크플로우", example_6_complete_workflow),
     ]
 
-    for i, (name, func) in enumerate(examples, 1):
-        try:
-            await func()
-        except Exception as e:
-            print(f"\n❌ 예시 {i} ({name}) 실패: {e}")
-            import traceback
-            traceback.print_exc()
-
-        # 구분을 위한 대기
-        await asyncio.sleep(0.5)
+    # 예시들은 서로 독립적이므로 동시에 실행 (출력은 섞일 수 있음)
+    try:
+        results = await asyncio.gather(
+            *(func() for _, func in examples),
+            return_exceptions=True
+        )
+    finally:
+        # 전역 Agent의 메모리 통합 워커 종료
+        from agents import enhanced_planner_agent
+        await enhanced_planner_agent.close()
+
+    for i, ((name, _), result) in enumerate(zip(examples, results), 1):
+        if isinstance(result, BaseException):
+            print(f"\n❌ 예시 {i} ({name}) 실패: {result}")
+            traceback.print_exception(result)
 
     print("\n" + "="*60)
     print("모든 데모 완료!")
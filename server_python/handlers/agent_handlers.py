@@ -7,10 +7,57 @@ AgentHandlers - Agent 관련 핸들러
 """
 
 import asyncio
-from typing import Callable, Awaitable
+import logging
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Awaitable, Dict, Mapping, Optional, Sequence
 
+from models.ontology import OntologyContext
 from .base_handler import BaseHandler
 
+logger = logging.getLogger(__name__)
+
+# 누락된 목록/객체 필드의 공유 기본값 (읽기 전용)
+_EMPTY_TUPLE: tuple = ()
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True)
+class AssignTaskPayload:
+    """ASSIGN_TASK 페이로드 (메시지당 한 번만 파싱)"""
+    task_id: Optional[str]
+    agent_id: Optional[str]
+    orchestration_plan: Dict[str, Any]
+    title: Optional[str] = None
+    content: Optional[str] = ''
+    priority: Optional[str] = None
+    source: Optional[str] = None
+    tags: Sequence[str] = _EMPTY_TUPLE
+    planned_agents: Sequence[Dict[str, Any]] = _EMPTY_TUPLE
+    needs_user_input: bool = False
+    input_prompt: str = ''
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> "AssignTaskPayload":
+        """웹소켓 페이로드 딕셔너리에서 생성"""
+        task = payload.get('task') or _EMPTY_MAPPING
+        # Agent metadata로 그대로 전달되므로 공유 기본값을 쓰지 않음
+        plan = payload.get('orchestrationPlan') or {}
+        title = task.get('title')
+        return cls(
+            task_id=payload.get('taskId'),
+            agent_id=payload.get('agentId'),
+            orchestration_plan=plan,
+            title=title,
+            content=task.get('description', title or ''),
+            priority=task.get('priority'),
+            source=task.get('source'),
+            tags=task.get('tags') or _EMPTY_TUPLE,
+            planned_agents=plan.get('agents') or _EMPTY_TUPLE,
+            needs_user_input=plan.get('needsUserInput', False),
+            input_prompt=plan.get('inputPrompt', ''),
+        )
+
 
 class AgentHandlers(BaseHandler):
     """Agent 관련 메시지 핸들러"""
@@ -41,15 +88,10 @@ class AgentHandlers(BaseHandler):
 
     async def handle_assign_task(self, client_id: str, payload: dict):
         """Task를 Agent에게 할당 (ASSIGN_TASK)"""
-        task_id = payload.get('taskId')
-        agent_id = payload.get('agentId')
-        task_data = payload.get('task', {})
-
-        # 멀티-에이전트 플랜
-        orchestration_plan = payload.get('orchestrationPlan', {})
-        planned_agents = orchestration_plan.get('agents', [])
-        needs_user_input = orchestration_plan.get('needsUserInput', False)
-        input_prompt = orchestration_plan.get('inputPrompt', '')
+        request = AssignTaskPayload.from_payload(payload)
+        task_id = request.task_id
+        agent_id = request.agent_id
+        planned_agents = request.planned_agents
 
         self.log(f"Assigning task {task_id} to agent {agent_id}")
         if planned_agents:
@@ -71,7 +113,7 @@ class AgentHandlers(BaseHandler):
                 agent = await self._auto_create_agent(
                     agent_id,
                     agent_info,
-                    task_data
+                    request.title
                 )
             else:
                 self.log(f"ERROR: Agent {agent_id} not found in planned_agents either")
@@ -91,17 +133,17 @@ class AgentHandlers(BaseHandler):
             from agents.types import AgentInput
             agent_input = AgentInput(
                 type='task',
-                content=task_data.get('description', task_data.get('title', '')),
+                content=request.content,
                 metadata={
                     'task_id': task_id,
-                    'title': task_data.get('title'),
-                    'priority': task_data.get('priority'),
-                    'source': task_data.get('source'),
-                    'tags': task_data.get('tags', []),
-                    'orchestration_plan': orchestration_plan,
+                    'title': request.title,
+                    'priority': request.priority,
+                    'source': request.source,
+                    'tags': request.tags,
+                    'orchestration_plan': request.orchestration_plan,
                     'planned_agents': planned_agents,
-                    'needs_user_input': needs_user_input,
-                    'input_prompt': input_prompt,
+                    'needs_user_input': request.needs_user_input,
+                    'input_prompt': request.input_prompt,
                 }
             )
 
@@ -110,10 +152,8 @@ class AgentHandlers(BaseHandler):
                 asyncio.create_task(self._process_agent_task(agent, agent_input))
             self.log(f"Started agent task processing for task {task_id}")
 
-        except Exception as e:
-            self.log(f"Error starting agent task: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error starting agent task", extra={"task_id": task_id})
 
     async def handle_create_agent(self, client_id: str, payload: dict):
         """Agent 생성 요청 처리 (CREATE_AGENT)"""
@@ -179,15 +219,13 @@ class AgentHandlers(BaseHandler):
             self.log(f"Agent {agent_name} ({agent_id}) created and registered")
 
         except Exception as e:
-            self.log(f"Error creating agent: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error creating agent", extra={"agent_id": payload.get('id')})
             self.broadcast_notification(
                 f"Failed to create agent: {str(e)}",
                 "error"
             )
 
-    async def _auto_create_agent(self, agent_id: str, agent_info: dict, task_data: dict):
+    async def _auto_create_agent(self, agent_id: str, agent_info: dict, task_title: Optional[str]):
         """Agent 자동 생성"""
         agent_name = agent_info.get('agentName', f'Agent-{agent_id[:8]}')
         self.log(f"Auto-creating agent: {agent_name} ({agent_id})")
@@ -198,7 +236,7 @@ class AgentHandlers(BaseHandler):
         config = AgentConfig(
             name=agent_name,
             type='custom',
-            description=f'Auto-created agent for task: {task_data.get("title", "Unknown")}',
+            description=f'Auto-created agent for task: {task_title or "Unknown"}',
             constraints=[],
             capabilities=['general'],
         )
@@ -219,21 +257,12 @@ class AgentHandlers(BaseHandler):
         if not hasattr(agent, 'context') or (hasattr(agent, 'context') and agent.context is None):
             self.log(f"Initializing agent {agent_id}")
             from agents.types import AgentExecutionContext
-            from models.ontology import OntologyContext
-
-            ontology_context = OntologyContext(
-                activePreferences=[],
-                activeTaboos=[],
-                activeApprovalRules=[],
-                matchedFailurePatterns=[],
-                appliedConstraints=[]
-            )
 
             context = AgentExecutionContext(
                 agent_id=agent_id,
-                ontology_context=ontology_context,
-                current_ticket=None,
-                previous_decisions=[]
+                # Agent마다 새 인스턴스 (목록 필드를 공유하지 않도록)
+                ontology_context=OntologyContext(),
+                current_ticket=None
             )
 
             try:
@@ -242,10 +271,8 @@ class AgentHandlers(BaseHandler):
                 if hasattr(agent, 'start'):
                     await agent.start()
                 self.log(f"Agent {agent_id} initialized and started")
-            except Exception as e:
-                self.log(f"Error initializing agent: {e}")
-                import traceback
-                traceback.print_exc()
+            except Exception:
+                logger.exception("Error initializing agent", extra={"agent_id": agent_id})
                 raise
 
     async def _save_agent_config(
@@ -7,124 +7,85 @@ ApprovalHandlers - 승인/거부/옵션선택 관련 핸들러
 - SELECT_OPTION
 """
 
+import logging
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
+from models.agent import AgentStatus, AgentStateUpdate
+from models.approval import ApprovalRequest, ApprovalStatus, ApprovalResponse
 from .base_handler import BaseHandler
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _DecisionSpec:
+    """결정 유형별 처리 방식"""
+    status: ApprovalStatus
+    activates_agent: bool           # Agent 상태를 ACTIVE로 변경할지 여부
+    task_description: str           # approval.message가 없을 때의 작업 설명
+    label: str                      # 로그용 이름
+    notification: str               # 완료 알림 (ticket_id, option_id로 포맷)
+    notification_type: str
+
+
+_DECISION_TABLE = {
+    "approve": _DecisionSpec(
+        status=ApprovalStatus.APPROVED,
+        activates_agent=True,
+        task_description="Approved task",
+        label="approval",
+        notification="Ticket {ticket_id} approved. Agent will proceed with execution.",
+        notification_type="success",
+    ),
+    "reject": _DecisionSpec(
+        status=ApprovalStatus.REJECTED,
+        activates_agent=False,
+        task_description="",
+        label="rejection",
+        notification="Ticket {ticket_id} rejected.",
+        notification_type="info",
+    ),
+    "select": _DecisionSpec(
+        status=ApprovalStatus.APPROVED,
+        activates_agent=True,
+        task_description="Option selected",
+        label="option selection",
+        notification="Option {option_id} selected for ticket {ticket_id}.",
+        notification_type="success",
+    ),
+}
+
 
 class ApprovalHandlers(BaseHandler):
     """승인 관련 메시지 핸들러"""
 
     async def handle_approve_request(self, client_id: str, payload: dict):
         """승인 요청 처리 (APPROVE_REQUEST)"""
-        request_id = payload.get('requestId')
-        ticket_id = payload.get('ticketId')
-        agent_id = payload.get('agentId')
-
-        self.log(f"Processing approval for request {request_id}, ticket {ticket_id}")
-
-        # Agent 조회
-        agent = self.get_agent(agent_id)
-        if not agent:
-            self.log(f"ERROR: Agent {agent_id} not found")
-            return
-
-        # ApprovalRequest 생성
-        from models.approval import ApprovalRequest, ApprovalStatus, ApprovalResponse
-        approval = ApprovalRequest(
-            id=request_id,
-            ticketId=ticket_id,
-            agentId=agent_id,
-            type="proceed",
-            message="Approval request",
-            status=ApprovalStatus.APPROVED,
-            response=ApprovalResponse(
-                decision="approve",
-                respondedAt=datetime.now()
-            )
-        )
-
-        # Agent 상태를 ACTIVE로 변경
-        from models.agent import AgentStatus
-        state = agent.get_state()
-        state.status = AgentStatus.ACTIVE
-        state.currentTaskId = ticket_id
-        state.currentTaskDescription = approval.message or "Approved task"
-        agent._emit_state_change()
-
-        # Agent 상태 업데이트 브로드캐스트
-        self.broadcast_agent_update(state)
-        self.log(f"Agent {agent.name} status updated to ACTIVE after approval")
-
-        # Agent에게 승인 알림
-        try:
-            if hasattr(agent, 'on_approval_received'):
-                await agent.on_approval_received(approval)
-        except Exception as e:
-            self.log(f"ERROR in on_approval_received: {e}")
-            import traceback
-            traceback.print_exc()
-
-        # WebSocket으로 승인 완료 브로드캐스트
-        self.broadcast_notification(
-            f"Ticket {ticket_id} approved. Agent will proceed with execution.",
-            "success"
-        )
-
-        self.log(f"Approval processed for ticket {ticket_id}")
+        await self._process_approval(payload, "approve")
 
     async def handle_reject_request(self, client_id: str, payload: dict):
         """거부 요청 처리 (REJECT_REQUEST)"""
-        request_id = payload.get('requestId')
-        ticket_id = payload.get('ticketId')
-        agent_id = payload.get('agentId')
-
-        self.log(f"Processing rejection for request {request_id}, ticket {ticket_id}")
-
-        # Agent 조회
-        agent = self.get_agent(agent_id)
-        if not agent:
-            self.log(f"ERROR: Agent {agent_id} not found")
-            return
-
-        # ApprovalRequest 생성
-        from models.approval import ApprovalRequest, ApprovalStatus, ApprovalResponse
-        approval = ApprovalRequest(
-            id=request_id,
-            ticketId=ticket_id,
-            agentId=agent_id,
-            type="proceed",
-            message="Approval request",
-            status=ApprovalStatus.REJECTED,
-            response=ApprovalResponse(
-                decision="reject",
-                respondedAt=datetime.now()
-            )
-        )
-
-        # Agent에게 거부 알림
-        try:
-            if hasattr(agent, 'on_approval_received'):
-                await agent.on_approval_received(approval)
-        except Exception as e:
-            self.log(f"ERROR in on_approval_received (reject): {e}")
-            import traceback
-            traceback.print_exc()
-
-        # WebSocket으로 거부 완료 브로드캐스트
-        self.broadcast_notification(f"Ticket {ticket_id} rejected.", "info")
-
-        self.log(f"Rejection processed for ticket {ticket_id}")
+        await self._process_approval(payload, "reject")
 
     async def handle_select_option(self, client_id: str, payload: dict):
         """옵션 선택 처리 (SELECT_OPTION)"""
+        await self._process_approval(payload, "select", payload.get('optionId'))
+
+    async def _process_approval(
+        self,
+        payload: dict,
+        decision: str,
+        selected_option_id: Optional[str] = None
+    ):
+        """승인/거부/옵션선택 공통 처리"""
+        spec = _DECISION_TABLE[decision]
         request_id = payload.get('requestId')
         ticket_id = payload.get('ticketId')
         agent_id = payload.get('agentId')
-        option_id = payload.get('optionId')
 
-        self.log(f"Processing option selection {option_id} for request {request_id}, ticket {ticket_id}")
+        self.log(f"Processing {spec.label} for request {request_id}, ticket {ticket_id}")
 
         # Agent 조회
         agent = self.get_agent(agent_id)
@@ -133,46 +94,47 @@ class ApprovalHandlers(BaseHandler):
             return
 
         # ApprovalRequest 생성
-        from models.approval import ApprovalRequest, ApprovalStatus, ApprovalResponse
         approval = ApprovalRequest(
             id=request_id,
             ticketId=ticket_id,
             agentId=agent_id,
             type="proceed",
             message="Approval request",
-            status=ApprovalStatus.APPROVED,
+            status=spec.status,
             response=ApprovalResponse(
-                decision="select",
-                selectedOptionId=option_id,
+                decision=decision,
+                selectedOptionId=selected_option_id,
                 respondedAt=datetime.now()
             )
         )
 
-        # Agent 상태를 ACTIVE로 변경
-        from models.agent import AgentStatus
-        state = agent.get_state()
-        state.status = AgentStatus.ACTIVE
-        state.currentTaskId = ticket_id
-        state.currentTaskDescription = approval.message or "Option selected"
-        agent._emit_state_change()
+        if spec.activates_agent:
+            # Agent 상태를 ACTIVE로 변경 (제자리 갱신 + 이벤트 1회 발행, 발행된 스냅샷 재사용)
+            state = await agent.update_state(AgentStateUpdate(
+                agentId=agent_id,
+                status=AgentStatus.ACTIVE,
+                currentTaskId=ticket_id,
+                currentTaskDescription=approval.message or spec.task_description,
+            ))
 
-        # Agent 상태 업데이트 브로드캐스트
-        self.broadcast_agent_update(state)
-        self.log(f"Agent {agent.name} status updated to ACTIVE after option selection")
+            # Agent 상태 업데이트 브로드캐스트
+            self.broadcast_agent_update(state)
+            self.log(f"Agent {agent.name} status updated to ACTIVE after {spec.label}")
 
-        # Agent에게 승인 알림
+        # Agent에게 결정 알림
         try:
             if hasattr(agent, 'on_approval_received'):
                 await agent.on_approval_received(approval)
-        except Exception as e:
-            self.log(f"ERROR in on_approval_received (select_option): {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception(
+                "Error in on_approval_received (%s)", decision,
+                extra={"agent_id": agent_id, "ticket_id": ticket_id}
+            )
 
-        # WebSocket으로 옵션 선택 완료 브로드캐스트
+        # WebSocket으로 처리 완료 브로드캐스트
         self.broadcast_notification(
-            f"Option {option_id} selected for ticket {ticket_id}.",
-            "success"
+            spec.notification.format(ticket_id=ticket_id, option_id=selected_option_id),
+            spec.notification_type
         )
 
-        self.log(f"Option selection processed for ticket {ticket_id}")
+        self.log(f"{spec.label.capitalize()} processed for ticket {ticket_id}")
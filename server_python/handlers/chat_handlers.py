@@ -5,8 +5,12 @@ ChatHandlers - 채팅 관련 핸들러
 - CHAT_MESSAGE
 """
 
+import logging
+
 from .base_handler import BaseHandler
 
+logger = logging.getLogger(__name__)
+
 
 class ChatHandlers(BaseHandler):
     """채팅 관련 메시지 핸들러"""
@@ -50,9 +54,7 @@ class ChatHandlers(BaseHandler):
             self.log("Sent LLM request to frontend for chat")
 
         except Exception as e:
-            self.log(f"ERROR processing chat_message: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error processing chat_message")
 
             self.broadcast_chat_message(
                 role='assistant',
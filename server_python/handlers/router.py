@@ -4,6 +4,7 @@ MessageRouter - WebSocket 메시지 라우팅
 메시지 타입에 따라 적절한 핸들러로 라우팅합니다.
 """
 
+import logging
 from typing import Callable, Optional
 
 from models.websocket import WebSocketMessageType
@@ -13,6 +14,8 @@ from .task_handlers import TaskHandlers
 from .chat_handlers import ChatHandlers
 from .config_handlers import ConfigHandlers
 
+logger = logging.getLogger(__name__)
+
 
 class MessageRouter:
     """WebSocket 메시지 라우터"""
@@ -108,7 +111,5 @@ class MessageRouter:
             else:
                 print(f"[MessageRouter] Unknown message type: {message.type}")
 
-        except Exception as e:
-            print(f"[MessageRouter] Error handling message: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error handling message %s", message.type)
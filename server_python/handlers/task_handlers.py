@@ -5,8 +5,12 @@ TaskHandlers - Task 상호작용 관련 핸들러
 - TASK_INTERACTION_CLIENT
 """
 
+import logging
+
 from .base_handler import BaseHandler
 
+logger = logging.getLogger(__name__)
+
 
 class TaskHandlers(BaseHandler):
     """Task 상호작용 메시지 핸들러"""
@@ -186,9 +190,7 @@ class TaskHandlers(BaseHandler):
             )
 
         except Exception as e:
-            self.log(f"ERROR processing task_interaction: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error processing task_interaction")
 
             self.broadcast_task_interaction(
                 task_id=task_id,
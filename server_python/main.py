@@ -46,13 +46,14 @@ from services.slack_webhook import SlackWebhookService
 from services.redis_service import redis_service
 from services.event_store import event_store
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
 # 환경 변수는 파일 상단에서 이미 로드됨
 
 # FastAPI 앱 생성
-app = FastAPI(title="Agent Monitor API")
+app = FastAPI(title="Agent Monitor API", default_response_class=ORJSONResponse)
 
 # CORS 설정
 app.add_middleware(
@@ -201,6 +202,7 @@ class DemoAgent:
         self._state.updatedAt = datetime.now()
         self._state.lastActivity = datetime.now()
         self._emit_state_change()
+        return self._state
 
     async def process(self, input_data):
         """Task 처리 - LLM 기반 실제 작업 수행"""
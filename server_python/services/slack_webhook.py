@@ -6,11 +6,14 @@ Slack 이벤트를 받아서 Task로 변환하는 서비스
 import json
 import hmac
 import hashlib
+import logging
 import time
 from typing import Dict, Any, Optional, Callable
 from datetime import datetime
 from models.task import Task, CreateTaskInput, TaskPriority, TaskSource
 
+logger = logging.getLogger(__name__)
+
 
 class SlackWebhookService:
     """Slack 웹훅 이벤트 처리 서비스"""
@@ -18,11 +21,16 @@ class SlackWebhookService:
     def __init__(self, signing_secret: Optional[str] = None):
         self.signing_secret = signing_secret
         self.task_handlers: list = []
+        # 서명 검증용 HMAC 원형 (키 초기화는 한 번만, 요청마다 copy)
+        self._hmac_prototype = (
+            hmac.new(signing_secret.encode(), digestmod=hashlib.sha256)
+            if signing_secret else None
+        )
     
-    def verify_signature(self, timestamp: str, body: str, signature: str) -> bool:
-        """Slack 서명 검증"""
-        if not self.signing_secret:
-            print(f"[SlackWebhookService] WARNING: No signing secret configured, skipping verification")
+    def verify_signature(self, timestamp: str, body: bytes, signature: str) -> bool:
+        """Slack 서명 검증 (body는 수신한 원본 bytes)"""
+        if self._hmac_prototype is None:
+            logger.warning("[SlackWebhookService] No signing secret configured, skipping verification")
             return True  # 개발 환경에서는 검증 생략
         
         # 타임스탬프 검증 (5분 이내)
@@ -30,12 +38,10 @@ class SlackWebhookService:
             return False
         
         # 서명 생성
-        sig_basestring = f"v0:{timestamp}:{body}"
-        my_signature = 'v0=' + hmac.new(
-            self.signing_secret.encode(),
-            sig_basestring.encode(),
-            hashlib.sha256
-        ).hexdigest()
+        mac = self._hmac_prototype.copy()
+        mac.update(f"v0:{timestamp}:".encode())
+        mac.update(body)
+        my_signature = 'v0=' + mac.hexdigest()
         
         return hmac.compare_digest(my_signature, signature)
     
@@ -47,55 +53,57 @@ class SlackWebhookService:
         """Slack 이벤트 처리"""
         event_type = event_data.get("type")
         
-        print(f"[SlackWebhookService] Processing event type: {event_type}")
-        print(f"[SlackWebhookService] Full event data keys: {list(event_data.keys())}")
+        logger.info("[SlackWebhookService] Processing event type: %s", event_type)
+        logger.debug("[SlackWebhookService] Full event data keys: %s", list(event_data))
         
         if event_type == "url_verification":
             # Slack URL 검증 - 이미 API 레벨에서 처리됨
-            print(f"[SlackWebhookService] URL verification event (should be handled by API)")
+            logger.debug("[SlackWebhookService] URL verification event (should be handled by API)")
             return None
         
         if event_type == "event_callback":
             event = event_data.get("event", {})
             event_subtype = event.get("type")
-            print(f"[SlackWebhookService] Event callback received: {event_subtype}")
-            print(f"[SlackWebhookService] Event details: {json.dumps(event, indent=2, ensure_ascii=False)}")
+            logger.debug("[SlackWebhookService] Event callback received: %s", event_subtype)
             
             if not event:
-                print(f"[SlackWebhookService] WARNING: Empty event in event_callback")
+                logger.warning("[SlackWebhookService] Empty event in event_callback")
                 return None
             
             return self._handle_event(event)
         
-        print(f"[SlackWebhookService] Unknown event type: {event_type}")
-        print(f"[SlackWebhookService] Event data: {json.dumps(event_data, indent=2, ensure_ascii=False)}")
+        logger.warning("[SlackWebhookService] Unknown event type: %s", event_type)
+        # 페이로드 직렬화는 DEBUG 로그가 켜진 경우에만
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SlackWebhookService] Event data: %s", json.dumps(event_data, ensure_ascii=False))
         return None
     
     def _handle_event(self, event: Dict[str, Any]) -> Optional[Task]:
         """이벤트 타입별 처리"""
         event_type = event.get("type")
         
-        print(f"[SlackWebhookService] Handling event type: {event_type}")
-        print(f"[SlackWebhookService] Event details: {json.dumps(event, indent=2, ensure_ascii=False)}")
+        logger.debug("[SlackWebhookService] Handling event type: %s", event_type)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SlackWebhookService] Event details: %s", json.dumps(event, ensure_ascii=False))
         
         if event_type == "app_mention":
             # 봇이 멘션된 경우
-            print(f"[SlackWebhookService] Detected app_mention event")
+            logger.debug("[SlackWebhookService] Detected app_mention event")
             return self._handle_mention(event)
         
         elif event_type == "message":
             # 메시지 이벤트
-            print(f"[SlackWebhookService] Detected message event")
+            logger.debug("[SlackWebhookService] Detected message event")
             
             # 메시지 삭제 이벤트는 무시
             subtype = event.get("subtype")
             if subtype == "message_deleted":
-                print(f"[SlackWebhookService] Message deleted event, skipping")
+                logger.debug("[SlackWebhookService] Message deleted event, skipping")
                 return None
             
             # 봇 메시지는 무시 (DM 처리 전에 확인)
             if subtype == "bot_message":
-                print(f"[SlackWebhookService] Bot message, skipping")
+                logger.debug("[SlackWebhookService] Bot message, skipping")
                 return None
             
             # DM인지 확인
@@ -106,29 +114,29 @@ class SlackWebhookService:
             is_dm = False
             
             if channel_type == "im":
-                print(f"[SlackWebhookService] Detected DM (channel_type=im)")
+                logger.debug("[SlackWebhookService] Detected DM (channel_type=im)")
                 is_dm = True
             elif channel and channel.startswith("D"):
-                print(f"[SlackWebhookService] Detected DM (channel ID starts with D: {channel})")
+                logger.debug("[SlackWebhookService] Detected DM (channel ID starts with D: %s)", channel)
                 is_dm = True
             
             if is_dm:
-                print(f"[SlackWebhookService] Processing DM event")
+                logger.debug("[SlackWebhookService] Processing DM event")
                 return self._handle_dm(event)
             
             # 멘션이 포함된 경우
             text = event.get("text", "")
             if "<@" in text or "<!subteam^" in text:
-                print(f"[SlackWebhookService] Detected mention in message text")
+                logger.debug("[SlackWebhookService] Detected mention in message text")
                 return self._handle_mention(event)
         
-        print(f"[SlackWebhookService] Event type {event_type} not handled")
+        logger.debug("[SlackWebhookService] Event type %s not handled", event_type)
         return None
     
     def _handle_mention(self, event: Dict[str, Any]) -> Optional[Task]:
         """멘션 이벤트 처리"""
-        print(f"[SlackWebhookService] Handling mention event")
-        print(f"[SlackWebhookService] Event keys: {list(event.keys())}")
+        logger.debug("[SlackWebhookService] Handling mention event")
+        logger.debug("[SlackWebhookService] Event keys: %s", list(event))
         
         text = event.get("text", "")
         user = event.get("user", "")
@@ -136,16 +144,14 @@ class SlackWebhookService:
         ts = event.get("ts", "")
         subtype = event.get("subtype")
         
-        print(f"[SlackWebhookService] Mention details:")
-        print(f"  - text: {text[:100] if text else '(empty)'}")
-        print(f"  - user: {user}")
-        print(f"  - channel: {channel}")
-        print(f"  - ts: {ts}")
-        print(f"  - subtype: {subtype}")
+        logger.debug(
+            "[SlackWebhookService] Mention details: text=%s, user=%s, channel=%s, ts=%s, subtype=%s",
+            text[:100] if text else "(empty)", user, channel, ts, subtype,
+        )
         
         # 봇 메시지는 무시
         if subtype == "bot_message":
-            print(f"[SlackWebhookService] Bot message, skipping")
+            logger.debug("[SlackWebhookService] Bot message, skipping")
             return None
         
         # 멘션 제거
@@ -155,10 +161,10 @@ class SlackWebhookService:
         cleaned_text = re.sub(r'<!channel>', '', cleaned_text).strip()
         cleaned_text = re.sub(r'<!here>', '', cleaned_text).strip()
         
-        print(f"[SlackWebhookService] Cleaned text: {cleaned_text[:100] if cleaned_text else '(empty)'}")
+        logger.debug("[SlackWebhookService] Cleaned text: %s", cleaned_text[:100] if cleaned_text else "(empty)")
         
         if not cleaned_text:
-            print(f"[SlackWebhookService] No text after cleaning, skipping")
+            logger.debug("[SlackWebhookService] No text after cleaning, skipping")
             return None
         
         # Task 생성 (Slack에서 온 Task는 기본적으로 자동 할당)
@@ -173,31 +179,26 @@ class SlackWebhookService:
                 autoAssign=True,  # Slack에서 온 Task는 자동 할당
             )
             
-            print(f"[SlackWebhookService] Created task: {task.id} - {task.title}")
-            print(f"[SlackWebhookService] Task details: {task.model_dump_json(indent=2)}")
-        except Exception as e:
-            print(f"[SlackWebhookService] ERROR creating task: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.info("[SlackWebhookService] Created task: %s - %s", task.id, task.title)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SlackWebhookService] Task details: %s", task.model_dump_json())
+        except Exception:
+            logger.exception("[SlackWebhookService] Error creating task")
             return None
         
         # 핸들러 호출
-        print(f"[SlackWebhookService] Calling {len(self.task_handlers)} task handler(s)")
-        for i, handler in enumerate(self.task_handlers):
+        logger.debug("[SlackWebhookService] Calling %d task handler(s)", len(self.task_handlers))
+        for i, handler in enumerate(self.task_handlers, 1):
             try:
-                print(f"[SlackWebhookService] Calling handler {i+1}/{len(self.task_handlers)}")
                 handler(task)
-                print(f"[SlackWebhookService] Task handler {i+1} called successfully")
-            except Exception as e:
-                print(f"[SlackWebhookService] Handler {i+1} error: {e}")
-                import traceback
-                traceback.print_exc()
+            except Exception:
+                logger.exception("[SlackWebhookService] Task handler %d error", i)
         
         return task
     
     def _handle_dm(self, event: Dict[str, Any]) -> Optional[Task]:
         """DM 이벤트 처리"""
-        print(f"[SlackWebhookService] Handling DM event: {event}")
+        logger.debug("[SlackWebhookService] Handling DM event")
         
         text = event.get("text", "")
         user = event.get("user", "")
@@ -205,15 +206,18 @@ class SlackWebhookService:
         ts = event.get("ts", "")
         subtype = event.get("subtype")
         
-        print(f"[SlackWebhookService] DM details: text={text}, user={user}, channel={channel}, subtype={subtype}")
+        logger.debug(
+            "[SlackWebhookService] DM details: text=%s, user=%s, channel=%s, subtype=%s",
+            text, user, channel, subtype,
+        )
         
         if not text:
-            print(f"[SlackWebhookService] No text in DM, skipping")
+            logger.debug("[SlackWebhookService] No text in DM, skipping")
             return None
         
         # 봇 메시지는 무시
         if subtype == "bot_message":
-            print(f"[SlackWebhookService] Bot message, skipping")
+            logger.debug("[SlackWebhookService] Bot message, skipping")
             return None
         
         # Task 생성 (Slack에서 온 Task는 기본적으로 자동 할당)
@@ -228,25 +232,20 @@ class SlackWebhookService:
                 autoAssign=True,  # Slack에서 온 Task는 자동 할당
             )
             
-            print(f"[SlackWebhookService] Created DM task: {task.id} - {task.title}")
-            print(f"[SlackWebhookService] Task details: {task.model_dump_json(indent=2)}")
-        except Exception as e:
-            print(f"[SlackWebhookService] ERROR creating DM task: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.info("[SlackWebhookService] Created DM task: %s - %s", task.id, task.title)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SlackWebhookService] Task details: %s", task.model_dump_json())
+        except Exception:
+            logger.exception("[SlackWebhookService] Error creating DM task")
             return None
         
         # 핸들러 호출
-        print(f"[SlackWebhookService] Calling {len(self.task_handlers)} task handler(s)")
-        for i, handler in enumerate(self.task_handlers):
+        logger.debug("[SlackWebhookService] Calling %d task handler(s)", len(self.task_handlers))
+        for i, handler in enumerate(self.task_handlers, 1):
             try:
-                print(f"[SlackWebhookService] Calling handler {i+1}/{len(self.task_handlers)}")
                 handler(task)
-                print(f"[SlackWebhookService] Task handler {i+1} called successfully")
-            except Exception as e:
-                print(f"[SlackWebhookService] Handler {i+1} error: {e}")
-                import traceback
-                traceback.print_exc()
+            except Exception:
+                logger.exception("[SlackWebhookService] Task handler %d error", i)
         
         return task
 
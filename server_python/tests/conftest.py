@@ -105,6 +105,7 @@ def mock_agent() -> MagicMock:
     agent.initialize = AsyncMock()
     agent.start = AsyncMock()
     agent.on_approval_received = AsyncMock()
+    agent.update_state = AsyncMock(return_value=agent.get_state.return_value)
     agent._emit_state_change = MagicMock()
     return agent
 
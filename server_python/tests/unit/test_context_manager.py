@@ -0,0 +1,167 @@
+"""
+Context Manager Unit Tests
+
+대화 컨텍스트 관리(ContextManager)의 단위 테스트입니다.
+"""
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from context.context_manager import ContextManager, MessageRole
+
+
+def assert_running_totals(manager: ContextManager):
+    """누적 토큰 수와 role별 카운트가 실제 메시지와 일치하는지 확인"""
+    messages = list(manager._system_messages) + list(manager._messages)
+    assert manager._total_tokens == sum(m.token_count for m in messages)
+    for role in MessageRole:
+        expected = sum(1 for m in messages if m.role == role)
+        assert manager._role_counts[role.value] == expected
+
+
+class TestMessageOrdering:
+    """메시지 출력 순서 테스트"""
+
+    @pytest.fixture
+    def manager(self):
+        """system 메시지가 중간에 섞여 추가된 ContextManager"""
+        manager = ContextManager(max_tokens=10000, preserve_recent_messages=1)
+        manager.add_message(MessageRole.USER, "first question")
+        manager.add_message(MessageRole.SYSTEM, "system one")
+        manager.add_message(MessageRole.ASSISTANT, "first answer")
+        manager.add_message(MessageRole.SYSTEM, "system two")
+        manager.add_message(MessageRole.USER, "second question")
+        return manager
+
+    def test_system_messages_first(self, manager):
+        """system 메시지가 먼저, 나머지는 추가된 순서대로"""
+        contents = [m["content"] for m in manager.get_messages_for_llm()]
+        assert contents == [
+            "system one",
+            "system two",
+            "first question",
+            "first answer",
+            "second question",
+        ]
+
+    def test_summary_precedes_system_messages(self, manager):
+        """요약은 system 메시지보다 앞에 위치"""
+        manager._set_summary("earlier talk")
+
+        messages = manager.get_messages_for_llm()
+        assert messages[0]["content"].startswith("[Context Summary]")
+        assert [m["content"] for m in messages[1:3]] == ["system one", "system two"]
+
+        history = manager.export_history()
+        assert history[0]["is_summary"] is True
+        assert [m["content"] for m in history[1:]] == [
+            m["content"] for m in messages[1:]
+        ]
+
+        # 요약 제외 요청 시 요약 없음
+        assert manager.get_messages_for_llm(include_summary=False)[0]["content"] == "system one"
+
+
+class TestRunningTotals:
+    """누적 토큰/role 카운트 일관성 테스트"""
+
+    @pytest.fixture
+    def manager(self):
+        """여러 role의 메시지가 추가된 ContextManager"""
+        manager = ContextManager(max_tokens=10000, preserve_recent_messages=2)
+        manager.add_message(MessageRole.SYSTEM, "you are a helpful agent")
+        for i in range(6):
+            manager.add_message(MessageRole.USER, f"question number {i}")
+            manager.add_message(MessageRole.ASSISTANT, f"answer number {i} with more words")
+        return manager
+
+    def test_totals_after_add(self, manager):
+        """추가 직후 누적값 일치"""
+        assert_running_totals(manager)
+        assert manager.get_stats()["total_messages"] == 13
+
+    def test_totals_after_compress(self, manager):
+        """compress_context 후 누적값 일치, system 메시지와 최근 메시지 유지"""
+        removed = manager.compress_context(target_tokens=1)
+
+        assert removed == 10
+        assert len(manager._system_messages) == 1
+        assert len(manager._messages) == 2
+        assert_running_totals(manager)
+        assert manager.get_stats()["summarized_messages"] == 10
+
+    def test_totals_after_clear(self, manager):
+        """clear 후 누적값 초기화"""
+        manager.clear()
+
+        assert_running_totals(manager)
+        assert manager._total_tokens == 0
+        stats = manager.get_stats()
+        assert stats["total_messages"] == 0
+        assert all(count == 0 for count in stats["role_distribution"].values())
+
+
+class TestMaybeSummarize:
+    """maybe_summarize 테스트"""
+
+    def make_manager(self, summarize_func):
+        """요약이 바로 트리거되는 ContextManager"""
+        manager = ContextManager(
+            max_tokens=10,
+            summarize_threshold=0.1,
+            summarize_func=summarize_func,
+            preserve_recent_messages=1,
+        )
+        for i in range(4):
+            manager.add_message(MessageRole.USER, f"message {i}")
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_summarize_removes_old_messages(self):
+        """요약된 메시지만 제거하고 최근 메시지는 유지"""
+        async def summarize(messages):
+            return f"{len(messages)} messages"
+
+        manager = self.make_manager(summarize)
+        assert await manager.maybe_summarize() is True
+
+        assert [m.content for m in manager._messages] == ["message 3"]
+        assert manager._summary == "3 messages"
+        assert manager._summarized_count == 3
+        assert_running_totals(manager)
+
+    @pytest.mark.asyncio
+    async def test_context_compressed_during_summarize(self):
+        """요약 중 compress_context로 deque가 줄어도 오류 없이 처리"""
+        manager = None
+
+        async def summarize(messages):
+            manager.compress_context(target_tokens=1)
+            manager.add_message(MessageRole.USER, "late message")
+            return "summary"
+
+        manager = self.make_manager(summarize)
+        assert await manager.maybe_summarize() is True
+
+        assert [m.content for m in manager._messages] == ["message 3", "late message"]
+        assert manager._summarized_count == 3
+        assert_running_totals(manager)
+
+    @pytest.mark.asyncio
+    async def test_context_cleared_during_summarize(self):
+        """요약 중 clear로 deque가 비어도 새 메시지는 유지"""
+        manager = None
+
+        async def summarize(messages):
+            manager.clear()
+            manager.add_message(MessageRole.USER, "after clear")
+            return "summary"
+
+        manager = self.make_manager(summarize)
+        assert await manager.maybe_summarize() is True
+
+        assert [m.content for m in manager._messages] == ["after clear"]
+        assert_running_totals(manager)
@@ -12,6 +12,7 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+from handlers.agent_handlers import AgentHandlers
 from handlers.approval_handlers import ApprovalHandlers
 from handlers.config_handlers import ConfigHandlers
 
@@ -89,6 +90,35 @@ class TestApprovalHandlers:
         )
 
 
+class TestAgentHandlers:
+    """AgentHandlers 테스트"""
+
+    @pytest.fixture
+    def agent_handler(self, mock_ws_server, mock_agent_registry):
+        """AgentHandlers 인스턴스 생성"""
+        return AgentHandlers(
+            ws_server=mock_ws_server,
+            agent_registry=mock_agent_registry
+        )
+
+    @pytest.mark.asyncio
+    async def test_initialized_agents_get_own_ontology_context(self, agent_handler):
+        """초기화된 Agent들은 온톨로지 컨텍스트를 공유하지 않음"""
+        agents = [MagicMock(context=None), MagicMock(context=None)]
+        for i, agent in enumerate(agents):
+            agent.initialize = AsyncMock()
+            agent.start = AsyncMock()
+            await agent_handler._initialize_agent_if_needed(agent, f"agent-{i}")
+
+        first, second = (
+            agent.initialize.await_args.args[0].ontology_context for agent in agents
+        )
+        first.appliedConstraints.append("no deploys")
+
+        assert first is not second
+        assert second.appliedConstraints == []
+
+
 class TestConfigHandlers:
     """ConfigHandlers 테스트"""
 
@@ -0,0 +1,278 @@
+"""
+Memory System Unit Tests
+
+Agent 메모리 시스템(MemorySystem)의 단위 테스트입니다.
+"""
+
+import asyncio
+import pytest
+from collections import OrderedDict
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from context.memory import MemorySystem, MemoryType
+
+
+def contents(memories):
+    """메모리 목록의 content만 추출"""
+    return [m.content for m in memories]
+
+
+class TestRecallOrdering:
+    """필터 결과 순서 테스트"""
+
+    @pytest.fixture
+    def memory(self):
+        """태그가 섞인 메모리가 추가된 MemorySystem"""
+        memory = MemorySystem()
+        for i in range(20):
+            memory.add_memory(
+                MemoryType.FACT if i % 2 else MemoryType.PATTERN,
+                f"memory {i}",
+                tags={"even" if i % 2 == 0 else "odd", f"tag-{i}"},
+            )
+        return memory
+
+    def test_tag_filter_keeps_store_order(self, memory):
+        """태그 필터 결과는 추가된 순서 유지"""
+        recalled = memory.recall(
+            tags={"even"}, limit=100,
+            sort_by_relevance=False, track_access=False,
+        )
+        assert contents(recalled) == [f"memory {i}" for i in range(0, 20, 2)]
+
+    def test_type_and_tag_filter_keeps_store_order(self, memory):
+        """타입 + 태그 필터 결과도 추가된 순서 유지"""
+        recalled = memory.recall(
+            memory_type=MemoryType.FACT,
+            tags={"tag-15", "tag-3", "tag-9", "tag-4"},
+            sort_by_relevance=False, track_access=False,
+        )
+        assert contents(recalled) == ["memory 3", "memory 9", "memory 15"]
+
+    def test_tag_filter_follows_lru_order(self, memory):
+        """recall로 최근 사용된 메모리는 필터 결과의 마지막으로 이동"""
+        memory.recall(tags={"tag-4"})
+
+        recalled = memory.recall(
+            tags={"even"}, limit=100,
+            sort_by_relevance=False, track_access=False,
+        )
+        assert contents(recalled) == [
+            f"memory {i}" for i in (0, 2, 6, 8, 10, 12, 14, 16, 18, 4)
+        ]
+
+    def test_unordered_select_returns_matches_only(self, memory):
+        """ordered=False는 순서 없이 인덱스 일치 항목만 반환"""
+        selected = memory._short_term.select(
+            MemoryType.FACT, {"tag-3", "tag-4"}, ordered=False,
+        )
+        assert contents(selected) == ["memory 3"]
+
+    def test_no_match_returns_empty(self, memory):
+        """일치하는 메모리가 없으면 빈 목록"""
+        assert memory.recall(tags={"missing"}, sort_by_relevance=False) == []
+
+
+class _NoScanDict(OrderedDict):
+    """전체 순회 시 실패하는 OrderedDict (인덱스 경로 검증용)"""
+
+    def __iter__(self):
+        raise AssertionError("store scanned")
+
+    def items(self):
+        raise AssertionError("store scanned")
+
+    def values(self):
+        raise AssertionError("store scanned")
+
+
+class TestIndexedRecall:
+    """인덱스 기반 recall 테스트"""
+
+    @pytest.fixture
+    def memory(self):
+        """전체 순회가 금지된 저장소를 가진 MemorySystem"""
+        memory = MemorySystem(max_short_term=1000, consolidation_threshold=1000)
+        for i in range(200):
+            memory.add_memory(
+                MemoryType.FACT, f"memory {i}",
+                importance=i / 200, tags={f"group-{i % 50}"},
+            )
+        for store in (memory._short_term, memory._long_term):
+            store._memories = _NoScanDict(store._memories)
+        return memory
+
+    def test_ranked_recall_uses_tag_index(self, memory):
+        """relevance 정렬 recall은 태그 일치 항목만 확인"""
+        recalled = memory.recall(tags={"group-7"}, limit=2, track_access=False)
+        assert contents(recalled) == ["memory 157", "memory 107"]
+
+    def test_unsorted_recall_uses_tag_index(self, memory):
+        """저장 순서 recall도 일치 항목만 정렬"""
+        recalled = memory.recall(
+            tags={"group-7"}, sort_by_relevance=False, track_access=False,
+        )
+        assert contents(recalled) == ["memory 7", "memory 57", "memory 107", "memory 157"]
+
+
+class TestShortTermEviction:
+    """단기 메모리 LRU 퇴출 테스트"""
+
+    @pytest.fixture
+    def memory(self):
+        """용량 3의 단기 메모리"""
+        return MemorySystem(max_short_term=3, consolidation_threshold=100)
+
+    def add(self, memory, name, tags=None):
+        """태그와 함께 단기 메모리 추가"""
+        return memory.add_memory(MemoryType.FACT, name, tags=tags or {name})
+
+    def test_evicts_least_recently_used(self, memory):
+        """용량 초과 시 가장 오래된 메모리부터 퇴출"""
+        for name in ("a", "b", "c", "d"):
+            self.add(memory, name)
+
+        assert contents(memory._short_term.values()) == ["b", "c", "d"]
+
+    def test_recall_touch_protects_from_eviction(self, memory):
+        """recall된 메모리는 최근 사용으로 이동해 퇴출되지 않음"""
+        for name in ("a", "b", "c"):
+            self.add(memory, name)
+
+        memory.recall(tags={"a"})
+        self.add(memory, "d")
+
+        assert contents(memory._short_term.values()) == ["c", "a", "d"]
+
+    def test_read_only_recall_keeps_lru_order(self, memory):
+        """track_access=False recall은 LRU 순서와 접근 기록을 바꾸지 않음"""
+        for name in ("a", "b", "c"):
+            self.add(memory, name)
+
+        recalled = memory.recall(tags={"a"}, track_access=False)
+        self.add(memory, "d")
+
+        assert recalled[0].access_count == 0
+        assert contents(memory._short_term.values()) == ["b", "c", "d"]
+
+    def test_eviction_cleans_indexes(self, memory):
+        """퇴출된 메모리는 타입/태그 인덱스에서도 제거"""
+        self.add(memory, "a", tags={"shared", "only-a"})
+        for name in ("b", "c", "d"):
+            self.add(memory, name, tags={"shared"})
+
+        store = memory._short_term
+        assert memory.recall(tags={"only-a"}, track_access=False) == []
+        assert "only-a" not in store._by_tag
+        assert len(store._by_tag["shared"]) == 3
+        assert store.count_by_type(MemoryType.FACT) == 3
+
+    def test_readding_existing_memory_does_not_evict(self, memory):
+        """이미 있는 메모리를 다시 추가하면 퇴출 없이 최근 사용으로 이동"""
+        for name in ("a", "b", "c"):
+            self.add(memory, name)
+
+        self.add(memory, "a")
+
+        assert contents(memory._short_term.values()) == ["b", "c", "a"]
+
+
+class TestAddMemories:
+    """add_memories 일괄 추가 테스트"""
+
+    @pytest.fixture
+    def memory(self):
+        """용량 3의 단기 메모리"""
+        return MemorySystem(max_short_term=3, consolidation_threshold=100)
+
+    def records(self, *names):
+        """이름별 add_memory() 인자 목록"""
+        return [
+            {"memory_type": MemoryType.FACT, "content": name, "tags": {name, "shared"}}
+            for name in names
+        ]
+
+    def add_one_by_one(self, names):
+        """같은 메모리를 add_memory()로 하나씩 추가한 MemorySystem"""
+        memory = MemorySystem(max_short_term=3, consolidation_threshold=100)
+        for record in self.records(*names):
+            memory.add_memory(**record)
+        return memory
+
+    def test_builds_tag_index(self, memory):
+        """일괄 추가된 메모리도 태그로 recall 가능"""
+        added = memory.add_memories(self.records("a", "b"))
+
+        assert contents(added) == ["a", "b"]
+        recalled = memory.recall(
+            tags={"shared"}, sort_by_relevance=False, track_access=False,
+        )
+        assert contents(recalled) == ["a", "b"]
+
+    def test_duplicates_in_batch_stored_once(self, memory):
+        """배치 안의 중복은 한 번만 저장되고 마지막 위치로 이동"""
+        records = self.records("a", "b")
+        records.append({"memory_type": MemoryType.FACT, "content": "a", "tags": {"late"}})
+        memory.add_memories(records)
+
+        store = memory._short_term
+        assert contents(store.values()) == ["b", "a"]
+        # 교체된 "a"의 이전 태그는 인덱스에 남지 않음
+        assert contents(store.select(tags={"shared"})) == ["b"]
+        assert contents(store.select(tags={"late"})) == ["a"]
+
+    def test_batch_larger_than_capacity(self, memory):
+        """용량보다 큰 배치는 배치 자신의 앞쪽 항목까지 퇴출 (add_memory 반복과 동일)"""
+        memory.add_memories(self.records("old"))
+        names = ["a", "b", "c", "d", "e"]
+        added = memory.add_memories(self.records(*names))
+
+        expected = self.add_one_by_one(["old"] + names)._short_term
+        store = memory._short_term
+        assert len(added) == 5
+        assert contents(store.values()) == contents(expected.values()) == ["c", "d", "e"]
+        assert store._by_tag["shared"] == expected._by_tag["shared"]
+        assert "a" not in store._by_tag and "old" not in store._by_tag
+
+
+class TestConsolidationWorker:
+    """백그라운드 통합 워커 종료 테스트"""
+
+    async def start_worker(self, memory):
+        """통합 임계치까지 메모리를 추가해 워커를 시작"""
+        for i in range(memory.consolidation_threshold):
+            memory.add_memory(MemoryType.FACT, f"memory {i}", importance=0.9)
+        await asyncio.sleep(0)
+        return memory._consolidation_worker
+
+    async def test_close_cancels_worker(self):
+        """close()는 대기 중인 워커를 취소"""
+        memory = MemorySystem(consolidation_threshold=2)
+        worker = await self.start_worker(memory)
+        assert worker is not None and not worker.done()
+
+        await memory.close()
+
+        assert worker.cancelled()
+        assert memory._consolidation_worker is None
+
+    async def test_close_without_worker(self):
+        """워커가 없으면 close()는 아무것도 하지 않음"""
+        memory = MemorySystem()
+        await memory.close()
+        assert memory._consolidation_worker is None
+
+    async def test_planner_close_stops_memory_worker(self):
+        """EnhancedPlannerAgent.close()가 메모리 워커를 종료"""
+        from agents.enhanced_planner_agent import EnhancedPlannerAgent
+
+        agent = EnhancedPlannerAgent(enable_tools=False, enable_subagents=False)
+        agent.memory.consolidation_threshold = 2
+        worker = await self.start_worker(agent.memory)
+
+        await agent.close()
+
+        assert worker.cancelled()
@@ -0,0 +1,186 @@
+"""
+Task Repository Tests
+
+PostgreSQL 기반 TaskRepository/BaseRepository 테스트입니다.
+TEST_DATABASE_URL (postgresql+asyncpg://...) 이 설정된 경우에만 실행되며,
+각 테스트는 하나의 트랜잭션 안에서 실행 후 롤백됩니다.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from database.models import Base
+from database.repositories import AuditRepository, TaskRepository
+from database.repositories.base import _UOW_DEPTH
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set"),
+]
+
+
+@pytest.fixture
+async def session():
+    """테스트 종료 시 롤백되는 AsyncSession (Database.session()과 같은 설정)"""
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        await conn.run_sync(Base.metadata.create_all)
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            autoflush=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+    await engine.dispose()
+
+
+@pytest.fixture
+def repository(session):
+    """TaskRepository 인스턴스"""
+    return TaskRepository(session)
+
+
+class TestKeysetPagination:
+    """(created_at, id) 키셋 페이지네이션 테스트"""
+
+    @pytest.fixture
+    async def task_ids(self, repository):
+        """created_at이 겹치는 Task 11개 (같은 시각 7개 + 서로 다른 시각 4개)"""
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        created = [base] * 7 + [base - timedelta(minutes=i) for i in range(1, 5)]
+        tasks = [
+            await repository.create(title=f"task {i}", created_at=created_at)
+            for i, created_at in enumerate(created)
+        ]
+        await repository.flush()
+        return [task.id for task in tasks]
+
+    async def collect_pages(self, fetch_page, page_size=3):
+        """next_cursor로 끝까지 페이지를 넘기며 모든 행을 수집"""
+        rows, cursor = [], None
+        while True:
+            page = await fetch_page(limit=page_size, cursor=cursor)
+            assert len(page) <= page_size
+            rows.extend(page)
+            if len(page) < page_size:
+                return rows
+            cursor = TaskRepository.next_cursor(page)
+
+    @pytest.mark.parametrize("descending", [True, False])
+    async def test_get_all_pages_without_duplicates_or_gaps(
+        self, repository, task_ids, descending
+    ):
+        """get_all: 같은 created_at을 가진 행이 페이지 경계에 걸려도 누락/중복 없음"""
+        rows = await self.collect_pages(
+            lambda **kw: repository.get_all(descending=descending, **kw)
+        )
+
+        ids = [row.id for row in rows]
+        assert len(ids) == len(set(ids)) == len(task_ids)
+        assert set(ids) == set(task_ids)
+
+        keys = [(row.created_at, row.id) for row in rows]
+        assert keys == sorted(keys, reverse=descending)
+
+    async def test_get_with_filters_pages_without_duplicates_or_gaps(
+        self, repository, task_ids
+    ):
+        """get_with_filters도 같은 키셋 순서로 페이지 이동"""
+        rows = await self.collect_pages(
+            lambda **kw: repository.get_with_filters(status="pending", load=(), **kw)
+        )
+
+        ids = [row.id for row in rows]
+        assert len(ids) == len(set(ids)) == len(task_ids)
+        assert ids == [row.id for row in await repository.get_all(limit=100)]
+
+    async def test_next_cursor_of_empty_page(self, repository):
+        """빈 페이지의 cursor는 None"""
+        assert TaskRepository.next_cursor([]) is None
+
+
+class TestCreate:
+    """create() / unit_of_work() 테스트"""
+
+    async def test_created_row_visible_immediately(self, repository):
+        """unit_of_work 밖의 create()는 바로 flush되어 같은 세션에서 조회 가능"""
+        task = await repository.create(title="new task")
+        assert task.id is not None
+
+        assert await repository.get_by_id(task.id) is task
+        assert await repository.exists(task.id)
+        updated = await repository.update(task.id, status="in_progress")
+        assert updated.status == "in_progress"
+
+    async def test_explicit_id_kept(self, repository):
+        """명시적으로 전달한 id는 그대로 사용"""
+        task_id = uuid4()
+        task = await repository.create(id=task_id, title="new task")
+        assert task.id == task_id
+
+    async def test_unit_of_work_defers_flush(self, repository, session):
+        """unit_of_work 안에서는 id만 생성하고 종료 시 한 번 flush"""
+        audit = AuditRepository(session)
+
+        async with repository.unit_of_work():
+            task = await repository.create(title="in unit")
+            # 같은 세션의 다른 Repository도 같은 unit에 참여
+            log = await audit.log_task_created(task.id, {"title": "in unit"})
+            assert task.id is not None
+            assert await repository.get_by_id(task.id) is None
+            assert task in session.new and log in session.new
+
+        assert not session.new
+        assert await repository.get_by_id(task.id) is task
+
+    async def test_unit_of_work_skips_flush_on_error(self, repository, session):
+        """unit 안에서 예외가 나면 flush하지 않음"""
+        with pytest.raises(RuntimeError):
+            async with repository.unit_of_work():
+                task = await repository.create(title="in unit")
+                raise RuntimeError("boom")
+
+        assert task in session.new
+        assert not session.info[_UOW_DEPTH]
+
+
+class TestServerDefaults:
+    """서버 기본값(created_at/updated_at) 로딩 테스트"""
+
+    async def test_timestamps_loaded_after_create(self, repository):
+        """create() 직후 created_at/updated_at을 lazy load 없이 읽을 수 있음"""
+        task = await repository.create(title="new task")
+
+        assert isinstance(task.created_at, datetime)
+        assert isinstance(task.updated_at, datetime)
+
+    async def test_updated_at_loaded_after_attribute_change(self, repository, session):
+        """속성 변경 후 flush해도 onupdate 값이 만료되지 않고 바로 로드됨"""
+        task = await repository.create(title="new task")
+
+        task.status = "in_progress"
+        await repository.flush()
+
+        assert task.status == "in_progress"
+        assert isinstance(task.updated_at, datetime)
+
+    async def test_audit_log_created_at_loaded(self, session):
+        """AuditLog도 created_at을 바로 읽을 수 있음"""
+        log = await AuditRepository(session).log_task_created(uuid4(), {"title": "t"})
+
+        assert isinstance(log.created_at, datetime)
@@ -0,0 +1,167 @@
+"""
+Task State Unit Tests
+
+Task/Agent 상태 머신(TaskStateManager)의 단위 테스트입니다.
+"""
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from agents.task_state import (
+    TaskStateManager,
+    TaskStatus,
+    AgentExecutionStatus,
+)
+
+
+class TestRunningAgentCount:
+    """running_agent_count 및 상태별 인덱스 테스트"""
+
+    @pytest.fixture
+    def manager(self):
+        """TaskStateManager 인스턴스"""
+        return TaskStateManager()
+
+    def test_running_waiting_completed(self, manager):
+        """RUNNING → WAITING → IDLE 전이 시 카운트와 인덱스 유지"""
+        execution = manager.start_execution("task-1")
+        manager.set_agent_running("agent-1", "Agent 1", "task-1", execution.execution_id)
+        manager.set_agent_running("agent-2", "Agent 2", "task-1", execution.execution_id)
+
+        assert execution.running_agent_count == 2
+        assert manager._agents_by_status[AgentExecutionStatus.RUNNING] == {"agent-1", "agent-2"}
+
+        # WAITING도 작업 중 상태이므로 카운트 유지
+        manager.update_agent_status("agent-1", status=AgentExecutionStatus.WAITING)
+        assert execution.running_agent_count == 2
+        assert manager._agents_by_status[AgentExecutionStatus.WAITING] == {"agent-1"}
+        assert manager._agents_by_status[AgentExecutionStatus.RUNNING] == {"agent-2"}
+
+        # 같은 execution에서 다시 RUNNING - 중복 카운트 없음
+        manager.set_agent_running("agent-1", "Agent 1", "task-1", execution.execution_id)
+        assert execution.running_agent_count == 2
+
+        manager.set_agent_idle("agent-1")
+        assert execution.running_agent_count == 1
+        assert manager._agents_by_status[AgentExecutionStatus.IDLE] == {"agent-1"}
+
+        # 작업 완료 후 모든 Agent가 쉬면 자동 완료
+        manager.update_execution("task-1", completed_steps=1)
+        manager.set_agent_idle("agent-2")
+        assert execution.running_agent_count == 0
+        assert manager.auto_complete_if_done("task-1") is True
+
+        assert execution.status == TaskStatus.COMPLETED
+        assert manager._tasks_by_status[TaskStatus.COMPLETED] == {"task-1"}
+        assert manager._tasks_by_status[TaskStatus.RUNNING] == set()
+        assert manager._agents_by_status[AgentExecutionStatus.RUNNING] == set()
+
+    def test_failed_execution_releases_agents(self, manager):
+        """실패 처리 시 모든 Agent를 IDLE로 되돌리고 카운트 초기화"""
+        execution = manager.start_execution("task-1")
+        manager.set_agent_running("agent-1", "Agent 1", "task-1", execution.execution_id)
+        manager.update_agent_status("agent-1", status=AgentExecutionStatus.WAITING)
+
+        manager.complete_execution("task-1", success=False)
+
+        assert execution.status == TaskStatus.FAILED
+        assert execution.running_agent_count == 0
+        assert manager._tasks_by_status[TaskStatus.FAILED] == {"task-1"}
+        assert manager._agents_by_status[AgentExecutionStatus.WAITING] == set()
+        assert manager._agents_by_status[AgentExecutionStatus.IDLE] == {"agent-1"}
+
+    def test_agent_moving_to_other_task(self, manager):
+        """다른 Task로 옮겨간 Agent는 이전 Task의 카운트에서 빠짐"""
+        first = manager.start_execution("task-1")
+        second = manager.start_execution("task-2")
+        manager.set_agent_running("agent-1", "Agent 1", "task-1", first.execution_id)
+
+        manager.set_agent_running("agent-1", "Agent 1", "task-2", second.execution_id)
+
+        assert first.running_agent_count == 0
+        assert second.running_agent_count == 1
+
+    def test_stale_execution_not_decremented(self, manager):
+        """재시작된 Task의 새 execution은 이전 execution의 Agent 해제에 영향받지 않음"""
+        old = manager.start_execution("task-1")
+        manager.set_agent_running("agent-1", "Agent 1", "task-1", old.execution_id)
+
+        new = manager.start_execution("task-1")
+        manager.set_agent_running("agent-2", "Agent 2", "task-1", new.execution_id)
+        manager.set_agent_idle("agent-1")
+
+        assert new.running_agent_count == 1
+        assert manager._tasks_by_status[TaskStatus.RUNNING] == {"task-1"}
+
+
+class TestEventBatching:
+    """batch() 이벤트 일괄 발행 테스트"""
+
+    @pytest.fixture
+    def manager(self):
+        """이벤트 핸들러가 연결된 TaskStateManager"""
+        manager = TaskStateManager()
+        manager.status_calls = []
+        manager.agent_calls = []
+        manager.set_status_change_handler(manager.status_calls.append)
+        manager.set_agent_change_handler(manager.agent_calls.append)
+        return manager
+
+    def test_event_outside_batch_is_single_element_list(self, manager):
+        """batch 밖의 이벤트는 즉시 한 개짜리 목록으로 전달"""
+        execution = manager.start_execution("task-1")
+        manager.set_agent_running("agent-1", "Agent 1", "task-1", execution.execution_id)
+
+        assert len(manager.status_calls) == 1
+        assert len(manager.status_calls[0]) == 1
+        assert manager.status_calls[0][0]["new_status"] == TaskStatus.RUNNING.value
+
+        assert len(manager.agent_calls) == 1
+        assert len(manager.agent_calls[0]) == 1
+        assert manager.agent_calls[0][0]["agent_id"] == "agent-1"
+
+    def test_nested_batch_delivers_one_list(self, manager):
+        """중첩된 batch는 가장 바깥 구간 종료 시 한 번만 전달"""
+        with manager.batch():
+            first = manager.start_execution("task-1")
+            with manager.batch():
+                second = manager.start_execution("task-2")
+                manager.set_agent_running("agent-1", "Agent 1", "task-1", first.execution_id)
+            # 안쪽 구간 종료 시에는 아직 전달하지 않음
+            assert manager.status_calls == []
+            assert manager.agent_calls == []
+            manager.set_agent_running("agent-2", "Agent 2", "task-2", second.execution_id)
+
+        assert len(manager.status_calls) == 1
+        assert [e["task_id"] for e in manager.status_calls[0]] == ["task-1", "task-2"]
+
+        assert len(manager.agent_calls) == 1
+        assert [e["agent_id"] for e in manager.agent_calls[0]] == ["agent-1", "agent-2"]
+
+    def test_complete_execution_batches_agent_events(self, manager):
+        """완료 처리 시 Agent 해제 이벤트를 한 목록으로 전달"""
+        execution = manager.start_execution("task-1")
+        manager.set_agent_running("agent-1", "Agent 1", "task-1", execution.execution_id)
+        manager.set_agent_running("agent-2", "Agent 2", "task-1", execution.execution_id)
+        manager.status_calls.clear()
+        manager.agent_calls.clear()
+
+        manager.complete_execution("task-1")
+
+        assert len(manager.agent_calls) == 1
+        assert {e["agent_id"] for e in manager.agent_calls[0]} == {"agent-1", "agent-2"}
+        assert len(manager.status_calls) == 1
+        assert manager.status_calls[0][0]["new_status"] == TaskStatus.COMPLETED.value
+
+    def test_events_flushed_when_batch_raises(self, manager):
+        """batch 구간에서 예외가 나도 모아둔 이벤트는 전달"""
+        with pytest.raises(RuntimeError):
+            with manager.batch():
+                manager.start_execution("task-1")
+                raise RuntimeError("boom")
+
+        assert len(manager.status_calls) == 1
+        assert manager._batch_depth == 0
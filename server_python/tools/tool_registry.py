@@ -3,7 +3,7 @@ Tool Registry for the tool system.
 Central registry for tool registration, discovery, and retrieval.
 """
 
-from typing import Any, Dict, List, Optional, Type, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Type
 import logging
 from dataclasses import dataclass, field
 
@@ -181,6 +181,27 @@ class ToolRegistry:
                     tools.append(registration.instance)
         return tools
 
+    def get_all_items(
+        self,
+        include_disabled: bool = False,
+    ) -> Iterator[Tuple[str, BaseTool]]:
+        """
+        Lazily iterate over registered (name, tool) pairs.
+
+        Walks the registry once without building a name list or doing a
+        second lookup per name, so callers can stop early (e.g. islice).
+
+        Args:
+            include_disabled: Whether to include disabled tools
+
+        Yields:
+            (name, tool instance) tuples in registration order
+        """
+        for name, registration in self._tools.items():
+            if include_disabled or registration.enabled:
+                if registration.instance:
+                    yield name, registration.instance
+
     def get_by_category(
         self,
         category: ToolCategory,
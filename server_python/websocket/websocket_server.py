@@ -1,5 +1,6 @@
 import asyncio
 import json
+import orjson
 from typing import Dict, Set, Optional, Callable, Any
 from datetime import datetime
 from uuid import uuid4
@@ -17,6 +18,11 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from services.event_store import event_store
 
 
+def _dumps(obj: Any) -> str:
+    """WebSocket 전송용 JSON 직렬화 (orjson, 텍스트 프레임으로 보내기 위해 str 반환)"""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class WebSocketClient:
     def __init__(self, client_id: str, websocket: WebSocketServerProtocol):
         self.id = client_id
@@ -48,6 +54,9 @@ class AgentMonitorWebSocketServer:
     
     프론트엔드 모니터링 UI와 실시간 통신
     """
+
+    # Agent 상태 업데이트 병합 구간 (초): 이 안에서 같은 Agent의 업데이트는 마지막 것만 전송
+    AGENT_UPDATE_COALESCE_INTERVAL = 0.015
     
     def __init__(self, port: int = 8080):
         self.port = port
@@ -58,6 +67,8 @@ class AgentMonitorWebSocketServer:
         self.event_store = event_store  # Use Redis event store for persistence
         self._recent_tasks: Dict[str, dict] = {}  # 최근 Task 저장소
         self._task_graphs: Dict[str, dict] = {}  # Task graph 저장소 (task_id -> graph dict)
+        self._pending_agent_updates: Dict[str, Agent] = {}  # 전송 대기 중인 Agent 상태 (agent_id -> 최신 상태)
+        self._agent_update_flush: Optional[asyncio.TimerHandle] = None
     
     async def start(self) -> None:
         """서버 시작"""
@@ -77,6 +88,10 @@ class AgentMonitorWebSocketServer:
     
     async def stop(self) -> None:
         """서버 중지"""
+        if self._agent_update_flush:
+            self._agent_update_flush.cancel()
+            self._flush_agent_updates()
+
         if self.heartbeat_task:
             self.heartbeat_task.cancel()
             try:
@@ -422,11 +437,28 @@ class AgentMonitorWebSocketServer:
     # === 브로드캐스트 메서드 ===
     
     def broadcast_agent_update(self, agent: Agent) -> None:
-        """Agent 상태 업데이트 브로드캐스트"""
-        asyncio.create_task(self._broadcast_with_store(
-            WebSocketMessageType.AGENT_UPDATE,
-            agent.model_dump(mode="json")
-        ))
+        """
+        Agent 상태 업데이트 브로드캐스트
+
+        AGENT_UPDATE_COALESCE_INTERVAL 동안 모았다가 Agent별 최신 상태만 전송합니다.
+        (승인 → 작업 시작처럼 연달아 바뀌는 상태는 한 번만 직렬화/전송)
+        """
+        self._pending_agent_updates[agent.id] = agent
+        if self._agent_update_flush is None:
+            self._agent_update_flush = asyncio.get_running_loop().call_later(
+                self.AGENT_UPDATE_COALESCE_INTERVAL,
+                self._flush_agent_updates
+            )
+
+    def _flush_agent_updates(self) -> None:
+        """대기 중인 Agent 상태 업데이트 전송"""
+        self._agent_update_flush = None
+        pending, self._pending_agent_updates = self._pending_agent_updates, {}
+        for agent in pending.values():
+            asyncio.create_task(self._broadcast_with_store(
+                WebSocketMessageType.AGENT_UPDATE,
+                agent.model_dump(mode="json")
+            ))
     
     def broadcast_ticket_created(self, ticket: Ticket) -> None:
         """티켓 생성 브로드캐스트"""
@@ -763,7 +795,7 @@ class AgentMonitorWebSocketServer:
             print(f"[WebSocket] WARNING: No clients connected, cannot broadcast {message.type}")
             return
 
-        data = json.dumps(message.to_dict())
+        data = _dumps(message.to_dict())
         disconnected = []
         sent_count = 0
 
@@ -787,7 +819,7 @@ class AgentMonitorWebSocketServer:
         client = self.clients.get(client_id)
         if client:
             try:
-                await client.websocket.send(json.dumps(message.to_dict()))
+                await client.websocket.send(_dumps(message.to_dict()))
             except Exception:
                 pass  # 클라이언트가 이미 연결 해제된 경우 무시
     